@@ -26,7 +26,7 @@ def main():
         renderer.set_cube(cube)
         
         print("\nStarting 3D software renderer...")
-        renderer.run()
+        renderer.run(threaded="--threaded" in sys.argv)
         
     except ImportError as e:
         print(f"Missing dependency: {e}")
@@ -1,11 +1,12 @@
 """Cube mechanics and state management."""
 
-from .cube import Cube
+from .cube import Cube, CubePool
 from .moves import Move, MoveSequence, ParseError
 from .state import CubeState, Position, Color, Cubie, Orientation
 
 __all__ = [
     "Cube",
+    "CubePool",
     "Move",
     "MoveSequence", 
     "ParseError",
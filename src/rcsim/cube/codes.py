@@ -0,0 +1,258 @@
+"""Piece-code encoding of 3x3 cube states and per-move code tables.
+
+A piece's stickers depend only on its own position and orientation, and a
+turn maps each (position, orientation) pair to another regardless of the
+other pieces. Encoding a piece as ``position * 64 + orientation`` therefore
+turns every move into a lookup table over codes, and a whole 3x3 state into
+one small integer array, from which ``sticker_ids`` reads every sticker
+with a few table lookups.
+
+All tables are built in memory: the full set of 36 move tables takes under
+10 ms, far less than loading them from data files would save.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from .moves import Move, MoveType
+from .state import COLOR_IDS, PACKED_FACE_ORDER, CubeState, Cubie, Orientation, Position, StandardColors
+
+
+# Every lattice position of a 3x3, core included
+POSITIONS: Tuple[Position, ...] = tuple(
+    Position(float(x), float(y), float(z))
+    for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)
+)
+POSITION_INDEX: Dict[Position, int] = {position: i for i, position in enumerate(POSITIONS)}
+
+# Every orientation the per-axis rotation model can reach
+ORIENTATIONS: Tuple[Orientation, ...] = tuple(
+    Orientation(x, y, z)
+    for x in (0, 90, 180, 270) for y in (0, 90, 180, 270) for z in (0, 90, 180, 270)
+)
+ORIENTATION_INDEX: Dict[Orientation, int] = {orientation: i for i, orientation in enumerate(ORIENTATIONS)}
+
+NUM_ORIENTATIONS = len(ORIENTATIONS)
+NUM_CODES = len(POSITIONS) * NUM_ORIENTATIONS
+
+# Every distinct 3x3 turn, numbered for compact move-index arrays
+MOVES: Tuple[Move, ...] = tuple(
+    Move(face, amount, move_type)
+    for faces, move_type in (("URFDLB", MoveType.FACE), ("MES", MoveType.SLICE), ("xyz", MoveType.ROTATION))
+    for face in faces for amount in (1, 2, 3)
+)
+MOVE_INDEX: Dict[Move, int] = {move: i for i, move in enumerate(MOVES)}
+
+_MOVE_TABLES: Dict[Move, np.ndarray] = {}
+_SEQUENCE_TABLES: Dict[bytes, np.ndarray] = {}
+
+
+def _sticker_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Build the lookups behind ``sticker_ids`` from a solved 3x3."""
+    solved = CubeState(3)
+    cells = [(face, i, j) for face in PACKED_FACE_ORDER for j in range(3) for i in range(3)]
+    cell_position = np.array([POSITION_INDEX[solved._face_cell_position(*cell)] for cell in cells])
+    cell_face = np.array([PACKED_FACE_ORDER.index(face) for face, _, _ in cells])
+    
+    # Original face showing on each current face, per orientation
+    shown = np.empty((len(PACKED_FACE_ORDER), NUM_ORIENTATIONS), dtype=np.intp)
+    for o, orientation in enumerate(ORIENTATIONS):
+        for original, current in orientation.get_face_mapping().items():
+            shown[PACKED_FACE_ORDER.index(current), o] = PACKED_FACE_ORDER.index(original)
+    
+    # Sticker id per piece and original face; faces without a sticker read white
+    piece_colors = np.full((len(solved.cubies), len(PACKED_FACE_ORDER)),
+                           COLOR_IDS[StandardColors.WHITE], dtype=np.uint8)
+    for p, cubie in enumerate(solved.cubies):
+        for face, color in cubie.colors.items():
+            piece_colors[p, PACKED_FACE_ORDER.index(face)] = COLOR_IDS[color]
+    return cell_position, cell_face, shown, piece_colors
+
+
+_CELL_POSITION, _CELL_FACE, _SHOWN_FACE, _PIECE_COLORS = _sticker_tables()
+
+
+def piece_code(cubie: Cubie) -> int:
+    """Encode the position and orientation of one piece.
+
+    Parameters
+    ----------
+    cubie : Cubie
+        Piece of a 3x3 cube
+
+    Returns
+    -------
+    int
+        ``position * 64 + orientation`` index into ``POSITIONS`` and ``ORIENTATIONS``
+    """
+    return (POSITION_INDEX[cubie.current_position] * NUM_ORIENTATIONS
+            + ORIENTATION_INDEX[cubie.orientation])
+
+
+def decode_piece(code: int) -> Tuple[Position, Orientation]:
+    """Get the position and orientation a piece code stands for.
+
+    Parameters
+    ----------
+    code : int
+        Piece code
+
+    Returns
+    -------
+    Tuple[Position, Orientation]
+        Shared, immutable position and orientation objects
+    """
+    position, orientation = divmod(int(code), NUM_ORIENTATIONS)
+    return POSITIONS[position], ORIENTATIONS[orientation]
+
+
+def encode_pieces(state: CubeState) -> np.ndarray:
+    """Encode every piece of a 3x3 state.
+
+    Parameters
+    ----------
+    state : CubeState
+        State of a 3x3 cube
+
+    Returns
+    -------
+    np.ndarray
+        uint16 piece codes in ``state.cubies`` order
+    """
+    return np.fromiter((piece_code(cubie) for cubie in state.cubies),
+                       dtype=np.uint16, count=len(state.cubies))
+
+
+# Piece codes of a solved 3x3, as bytes for quick comparison
+SOLVED_CODES: bytes = encode_pieces(CubeState(3)).tobytes()
+
+
+def move_table(move: Move) -> np.ndarray:
+    """Get the code table of a move on a 3x3.
+
+    Tables are built on first use and shared afterwards.
+
+    Parameters
+    ----------
+    move : Move
+        Face turn, slice move or rotation
+
+    Returns
+    -------
+    np.ndarray
+        Read-only (NUM_CODES,) uint16 array mapping each code to its code after the move
+    """
+    table = _MOVE_TABLES.get(move)
+    if table is None:
+        axis, angle = move.get_rotation_axis(), move.get_rotation_angle()
+        rotated = np.array([ORIENTATION_INDEX[o.rotate_around_axis(axis, angle)] for o in ORIENTATIONS])
+        table = identity_table()
+        for p, position in enumerate(POSITIONS):
+            if move.affects_position(position, 3):
+                new_p = POSITION_INDEX[position.rotate_around_axis(axis.value, angle)]
+                table[p * NUM_ORIENTATIONS:(p + 1) * NUM_ORIENTATIONS] = new_p * NUM_ORIENTATIONS + rotated
+        table.flags.writeable = False
+        _MOVE_TABLES[move] = table
+    return table
+
+
+def identity_table() -> np.ndarray:
+    """Get a new code table that leaves every code in place.
+    
+    Returns
+    -------
+    np.ndarray
+        Writable (NUM_CODES,) uint16 array
+    """
+    return np.arange(NUM_CODES, dtype=np.uint16)
+
+
+def inverse_table(table: np.ndarray) -> np.ndarray:
+    """Invert a code table.
+    
+    Parameters
+    ----------
+    table : np.ndarray
+        Code table of a move or sequence
+        
+    Returns
+    -------
+    np.ndarray
+        Read-only table undoing ``table``
+    """
+    inverse = np.empty_like(table)
+    inverse[table] = identity_table()
+    inverse.flags.writeable = False
+    return inverse
+
+
+def move_indices(moves: Iterable[Move]) -> np.ndarray:
+    """Number a move sequence by ``MOVES``.
+    
+    Parameters
+    ----------
+    moves : Iterable[Move]
+        Face turns, slice moves and single-layer rotations
+        
+    Returns
+    -------
+    np.ndarray
+        int8 index of each move into ``MOVES``
+        
+    Raises
+    ------
+    KeyError
+        If a move (e.g. a wide move) has no index
+    """
+    return np.array([MOVE_INDEX[move] for move in moves], dtype=np.int8)
+
+
+def sequence_table(indices: np.ndarray) -> np.ndarray:
+    """Get the code table of a whole move-index sequence.
+    
+    The move tables are composed into one, so applying it costs a single
+    lookup however long the sequence is. Tables are cached by sequence,
+    which suits the fixed algorithms solvers replay.
+    
+    Parameters
+    ----------
+    indices : np.ndarray
+        int8 move indices, as from ``move_indices``
+        
+    Returns
+    -------
+    np.ndarray
+        Read-only (NUM_CODES,) uint16 array mapping each code to its code
+        after every move in order
+    """
+    key = np.asarray(indices, dtype=np.int8).tobytes()
+    table = _SEQUENCE_TABLES.get(key)
+    if table is None:
+        table = identity_table()
+        for i in np.frombuffer(key, dtype=np.int8).tolist():
+            table = move_table(MOVES[i])[table]
+        table.flags.writeable = False
+        _SEQUENCE_TABLES[key] = table
+    return table
+
+
+def sticker_ids(codes: np.ndarray) -> np.ndarray:
+    """Read every sticker of a 3x3 from its piece codes.
+    
+    Parameters
+    ----------
+    codes : np.ndarray
+        Piece codes in ``state.cubies`` order, as from ``encode_pieces``
+        
+    Returns
+    -------
+    np.ndarray
+        (54,) uint8 ``COLOR_IDS`` values, the faces in ``PACKED_FACE_ORDER``
+        each laid out row by row like ``CubeState.get_face_ids``
+    """
+    positions, orientations = np.divmod(codes, NUM_ORIENTATIONS)
+    piece_at = np.empty(len(POSITIONS), dtype=np.intp)
+    piece_at[positions] = np.arange(len(codes))
+    pieces = piece_at[_CELL_POSITION]
+    return _PIECE_COLORS[pieces, _SHOWN_FACE[_CELL_FACE, orientations[pieces]]]
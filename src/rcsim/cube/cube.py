@@ -6,11 +6,29 @@ to create, manipulate, and query Rubik's Cube instances.
 
 import math
 import random
-from typing import List, Dict, Optional, Union, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Optional, Union, Tuple
 from copy import deepcopy
+import numpy as np
 
-from .state import CubeState, Position, Color, Cubie, Orientation, Axis, StandardColors
+from .state import CubeState, Position, Color, Cubie, Orientation, Axis, StandardColors, PACKED_FACE_ORDER
 from .moves import Move, MoveSequence, ParseError
+from .codes import MOVES, NUM_CODES, SOLVED_CODES, decode_piece, encode_pieces, inverse_table, move_table, sequence_table, sticker_ids
+
+
+# Place value of each sticker within a 54-bit chunk of ``Cube.packed_state``
+_CHUNK_WEIGHTS = np.left_shift(np.uint64(1), np.arange(0, 54, 3, dtype=np.uint64))
+
+# Solved state of each size, cloned by new and reset cubes
+_SOLVED_STATES: Dict[int, CubeState] = {}
+
+
+def _solved_state(size: int) -> CubeState:
+    """Get a fresh solved state, cloned from one built once per size."""
+    state = _SOLVED_STATES.get(size)
+    if state is None:
+        state = _SOLVED_STATES[size] = CubeState(size)
+    return state.clone()
 
 
 class CubeError(Exception):
@@ -32,8 +50,13 @@ class Cube:
         Current state of the cube
     move_history : List[Move]
         History of moves applied to the cube
+    move_version : int
+        Counter bumped whenever the cube state changes, for cache invalidation
     """
     
+    # 3x3 code tables by notation, shared by every cube
+    _move_perm_cache: Dict[str, np.ndarray] = {}
+    
     def __init__(self, size: int = 3):
         """Initialize a new cube in solved state.
         
@@ -51,14 +74,16 @@ class Cube:
             raise CubeError("Cube size must be an integer between 2 and 10")
         
         self.size = size
-        self.state = CubeState(size)
+        self.state = _solved_state(size)
         self.move_history: List[Move] = []
+        self.move_version = 0
         self._scramble_sequence: Optional[MoveSequence] = None
     
     def reset(self) -> None:
         """Reset cube to solved state and clear history."""
-        self.state = CubeState(self.size)
+        self.state = _solved_state(self.size)
         self.move_history.clear()
+        self.move_version += 1
         self._scramble_sequence = None
     
     def clone(self) -> 'Cube':
@@ -73,9 +98,27 @@ class Cube:
         new_cube.size = self.size
         new_cube.state = self.state.clone()
         new_cube.move_history = self.move_history.copy()
+        new_cube.move_version = self.move_version
         new_cube._scramble_sequence = self._scramble_sequence.copy() if self._scramble_sequence else None
         return new_cube
     
+    def copy_state_from(self, other: 'Cube') -> None:
+        """Overwrite this cube with another cube's state in place.
+        
+        Unlike ``clone`` no pieces are allocated, so a scratch cube can be
+        reset repeatedly at little cost.
+        
+        Parameters
+        ----------
+        other : Cube
+            Cube to copy, of the same size
+        """
+        self.state.copy_from(other.state)
+        self.move_history[:] = other.move_history
+        # Bump past both versions so nothing cached against this cube survives
+        self.move_version = max(self.move_version, other.move_version) + 1
+        self._scramble_sequence = other._scramble_sequence.copy() if other._scramble_sequence else None
+    
     def apply_move(self, move: Union[Move, str]) -> None:
         """Apply a single move to the cube.
         
@@ -92,10 +135,7 @@ class Cube:
             If move notation cannot be parsed
         """
         if isinstance(move, str):
-            try:
-                move = Move.parse(move)
-            except ParseError as e:
-                raise CubeError(f"Invalid move notation: {e}")
+            move = self._parse_move(move)
         
         if not isinstance(move, Move):
             raise CubeError(f"Expected Move or str, got {type(move)}")
@@ -104,6 +144,94 @@ class Cube:
         self._execute_move(move)
         self.move_history.append(move)
     
+    @staticmethod
+    def _parse_move(notation: str) -> Move:
+        """Parse move notation, raising CubeError if it is invalid."""
+        try:
+            return Move.parse(notation)
+        except ParseError as e:
+            raise CubeError(f"Invalid move notation: {e}")
+    
+    def get_move_table(self, move: Union[Move, str]) -> np.ndarray:
+        """Get the piece code table of a move on a 3x3.
+        
+        Moving a cube's pieces by hand is then ``codes = table[codes]``,
+        a single array lookup per move; ``set_piece_codes`` writes the
+        result back.
+        
+        Parameters
+        ----------
+        move : Union[Move, str]
+            Move (Move object or notation string)
+            
+        Returns
+        -------
+        np.ndarray
+            Read-only table from ``rcsim.cube.codes.move_table``
+            
+        Raises
+        ------
+        CubeError
+            If the cube is not a 3x3 or the notation is invalid
+        """
+        if self.size != 3:
+            raise CubeError(f"Move tables only apply to 3x3 cubes, got {self.size}x{self.size}")
+        if isinstance(move, Move):
+            return move_table(move)
+        table = self._move_perm_cache.get(move)
+        if table is None:
+            table = move_table(self._parse_move(move))
+            self._move_perm_cache[move] = table
+        return table
+    
+    def apply_move_indices(self, indices: np.ndarray) -> None:
+        """Apply a move-index sequence to a 3x3 in one step.
+        
+        The pieces are moved once by the sequence's composed code table,
+        and every move is still recorded in the history.
+        
+        Parameters
+        ----------
+        indices : np.ndarray
+            int8 indices into ``rcsim.cube.codes.MOVES``, as from
+            ``rcsim.cube.codes.move_indices``
+            
+        Raises
+        ------
+        CubeError
+            If the cube is not a 3x3
+        """
+        if self.size != 3:
+            raise CubeError(f"Move indices only apply to 3x3 cubes, got {self.size}x{self.size}")
+        if len(indices) == 0:
+            return
+        
+        self._apply_code_table(sequence_table(indices))
+        self.move_history.extend([MOVES[i] for i in indices.tolist()])
+    
+    def apply_permutation(self, permutation: np.ndarray,
+                          sequence: Optional[MoveSequence] = None) -> None:
+        """Apply a composed piece code table to a 3x3 in one step.
+        
+        Parameters
+        ----------
+        permutation : np.ndarray
+            Code table, as from ``MoveSequence.to_permutation``
+        sequence : MoveSequence, optional
+            Moves the table stands for, recorded in the history if given
+            
+        Raises
+        ------
+        CubeError
+            If the cube is not a 3x3
+        """
+        if self.size != 3:
+            raise CubeError(f"Permutations only apply to 3x3 cubes, got {self.size}x{self.size}")
+        
+        self._apply_code_table(permutation)
+        if sequence is not None:
+            self.move_history.extend(sequence.moves)
+    
     def apply_sequence(self, sequence: Union[MoveSequence, str, List[Union[Move, str]]]) -> None:
         """Apply a sequence of moves to the cube.
         
@@ -141,6 +269,10 @@ class Cube:
         move : Move
             Move to execute
         """
+        if self.size == 3:
+            self._execute_move_codes(move)
+            return
+        
         # Get all positions affected by this move
         affected_positions = self._get_affected_positions(move)
         
@@ -182,6 +314,78 @@ class Cube:
             # Move piece to new position
             piece.move_to_position(new_pos)
             self.state._position_map[new_pos] = piece
+        
+        self.state.invalidate_caches()
+        self.move_version += 1
+    
+    def _execute_move_codes(self, move: Move) -> None:
+        """Execute a move on a 3x3 through its piece code table.
+        
+        Gives the same positions and orientations as rotating each piece,
+        but only the pieces whose code changes are touched.
+        
+        Parameters
+        ----------
+        move : Move
+            Move to execute
+        """
+        if move.get_rotation_axis() is None:
+            raise CubeError(f"Cannot determine rotation axis for move {move}")
+        self._apply_code_table(move_table(move))
+    
+    def _apply_code_table(self, table: np.ndarray) -> None:
+        """Move the pieces of a 3x3 as a code table says.
+        
+        Parameters
+        ----------
+        table : np.ndarray
+            Code table of a move or sequence, see ``rcsim.cube.codes``
+        """
+        self._set_codes(table[self.get_piece_codes()])
+    
+    def set_piece_codes(self, codes: np.ndarray) -> None:
+        """Move the pieces of a 3x3 to the given piece codes.
+        
+        Counterpart of ``get_piece_codes`` for states computed directly on
+        codes, e.g. with ``get_move_table``. The move history is left as is.
+        
+        Parameters
+        ----------
+        codes : np.ndarray
+            Piece codes in ``state.cubies`` order
+            
+        Raises
+        ------
+        CubeError
+            If the cube is not a 3x3 or the codes do not fit it
+        """
+        if self.size != 3:
+            raise CubeError(f"Piece codes are only defined for 3x3 cubes, got {self.size}x{self.size}")
+        codes = np.array(codes, dtype=np.uint16)
+        if codes.shape != (len(self.state.cubies),) or codes.max() >= NUM_CODES:
+            raise CubeError(f"Expected {len(self.state.cubies)} piece codes below {NUM_CODES}")
+        self._set_codes(codes)
+    
+    def _set_codes(self, new_codes: np.ndarray) -> None:
+        """Move the pieces of a 3x3 to new piece codes, which are then owned by the cube."""
+        codes = self.get_piece_codes()
+        moved = np.flatnonzero(new_codes != codes).tolist()
+        
+        # Remove all moving pieces from their old positions first
+        cubies = self.state.cubies
+        position_map = self.state._position_map
+        for i in moved:
+            position_map.pop(cubies[i].current_position, None)
+        
+        for i in moved:
+            piece = cubies[i]
+            piece.current_position, piece.orientation = decode_piece(new_codes[i])
+            position_map[piece.current_position] = piece
+        
+        self.state.invalidate_caches()
+        new_codes.flags.writeable = False
+        self.state._piece_codes = new_codes
+        self.move_version += 1
     
     def _get_affected_positions(self, move: Move) -> List[Position]:
         """Get all positions affected by a move.
@@ -303,7 +507,11 @@ class Cube:
             return None
         
         solution = self._scramble_sequence.inverse()
-        self.apply_sequence(solution)
+        if self.size == 3:
+            # Undo the whole scramble with one lookup
+            self.apply_permutation(inverse_table(self._scramble_sequence.to_permutation()), solution)
+        else:
+            self.apply_sequence(solution)
         return solution
     
     def is_solved(self) -> bool:
@@ -314,6 +522,9 @@ class Cube:
         bool
             True if cube is solved
         """
+        if self.size == 3:
+            # Every piece home and unrotated is exactly the solved piece codes
+            return self.get_piece_codes().tobytes() == SOLVED_CODES
         return self.state.is_solved()
     
     def get_face_colors(self, face: str) -> List[List[Color]]:
@@ -339,6 +550,63 @@ class Cube:
         except ValueError as e:
             raise CubeError(str(e))
     
+    def get_face_ids(self, face: str) -> np.ndarray:
+        """Get the colors on a face as integer color ids.
+        
+        Comparing ids avoids comparing ``Color`` objects cell by cell.
+        
+        Parameters
+        ----------
+        face : str
+            Face to get ('U', 'D', 'L', 'R', 'F', 'B')
+            
+        Returns
+        -------
+        np.ndarray
+            Read-only (N, N) uint8 array of ``COLOR_IDS`` values, laid out
+            like ``get_face_colors`` and shared until the next move. Look
+            colors up with ``COLOR_TABLE``, ``COLOR_NAMES`` or ``COLOR_HEX``
+            from ``rcsim.cube.state``.
+            
+        Raises
+        ------
+        CubeError
+            If face is invalid
+        """
+        if self.size == 3 and face in PACKED_FACE_ORDER:
+            ids = self.state._face_ids.get(face)
+            if ids is None:
+                # View into the sticker snapshot, no per-cell color objects
+                ids = self.get_sticker_ids().reshape(6, 3, 3)[PACKED_FACE_ORDER.index(face)]
+                self.state._face_ids[face] = ids
+            return ids
+        try:
+            return self.state.get_face_ids(face)
+        except ValueError as e:
+            raise CubeError(str(e))
+    
+    def get_sticker_ids(self) -> np.ndarray:
+        """Get every sticker as integer color ids in one flat array.
+        
+        One snapshot serves any number of checks until the next move.
+        
+        Returns
+        -------
+        np.ndarray
+            Read-only (6 * N * N,) uint8 array of ``COLOR_IDS`` values, the
+            faces in ``PACKED_FACE_ORDER`` each laid out row by row like
+            ``get_face_ids``
+        """
+        stickers = self.state._sticker_ids
+        if stickers is None:
+            if self.size == 3:
+                stickers = sticker_ids(self.get_piece_codes())
+            else:
+                stickers = np.concatenate([self.get_face_ids(face).ravel() for face in PACKED_FACE_ORDER])
+            stickers.flags.writeable = False  # shared with clones
+            self.state._sticker_ids = stickers
+        return stickers
+    
     def get_all_face_colors(self) -> Dict[str, List[List[Color]]]:
         """Get colors for all faces.
         
@@ -350,6 +618,84 @@ class Cube:
         faces = ['U', 'D', 'L', 'R', 'F', 'B']
         return {face: self.get_face_colors(face) for face in faces}
     
+    @property
+    def packed_state(self) -> int:
+        """All sticker colors packed 3 bits each into one integer.
+        
+        See ``CubeState.get_packed_state`` for the layout. On a 3x3 it is
+        packed from ``get_sticker_ids`` and cached until the next move.
+        """
+        if self.size != 3:
+            return self.state.get_packed_state()
+        
+        packed = self.state._packed_state
+        if packed is None:
+            # Three 18-sticker chunks of 54 bits each fit in uint64
+            chunks = self.get_sticker_ids().reshape(3, 18).astype(np.uint64) @ _CHUNK_WEIGHTS
+            packed = int(chunks[0]) | int(chunks[1]) << 54 | int(chunks[2]) << 108
+            self.state._packed_state = packed
+        return packed
+    
+    def get_top_row(self, face: str) -> Tuple[int, ...]:
+        """Get the top row and center of a face as integer color ids.
+        
+        Cheaper than ``get_face_ids`` when only those cells are needed.
+        
+        Parameters
+        ----------
+        face : str
+            Face to read ('U', 'D', 'L', 'R', 'F', 'B')
+            
+        Returns
+        -------
+        Tuple[int, ...]
+            ``COLOR_IDS`` of the top row left to right, then of the center
+            
+        Raises
+        ------
+        CubeError
+            If face is invalid
+        """
+        try:
+            return self.state.get_top_row(face)
+        except ValueError as e:
+            raise CubeError(str(e))
+    
+    def get_piece_codes(self) -> np.ndarray:
+        """Encode the position and orientation of every piece.
+        
+        See ``rcsim.cube.codes`` for the encoding and the move tables that
+        act on it.
+        
+        Returns
+        -------
+        np.ndarray
+            Read-only uint16 piece codes in ``state.cubies`` order, cached
+            until the pieces move
+            
+        Raises
+        ------
+        CubeError
+            If the cube is not a 3x3
+        """
+        if self.size != 3:
+            raise CubeError(f"Piece codes are only defined for 3x3 cubes, got {self.size}x{self.size}")
+        codes = self.state._piece_codes
+        if codes is None:
+            codes = encode_pieces(self.state)
+            codes.flags.writeable = False  # shared with clones
+            self.state._piece_codes = codes
+        return codes
+    
+    @property
+    def u_face(self) -> np.ndarray:
+        """Color ids of the U face, without copying.
+        
+        Read-only (N, N) uint8 array of ``COLOR_IDS`` values, cached by the
+        state until the next move; see ``get_face_ids``.
+        """
+        return self.get_face_ids('U')
+    
     def get_piece_count(self) -> Dict[str, int]:
         """Get count of pieces by type.
         
@@ -548,4 +894,64 @@ class Cube:
         """Detailed string representation."""
         return (f"Cube(size={self.size}, solved={self.is_solved()}, "
                 f"moves={len(self.move_history)}, "
-                f"pieces={self.get_piece_count()['total']})")
\ No newline at end of file
+                f"pieces={self.get_piece_count()['total']})")
+
+
+class CubePool:
+    """Recycle work cubes so repeated solves don't build new pieces.
+    
+    ``get`` hands out a copy of a cube, reusing a recycled cube of the same
+    size when one is available; ``recycle`` returns it afterwards. Taking
+    and returning cubes are single deque operations, so a pool may be
+    shared between threads.
+    
+    Parameters
+    ----------
+    max_size : int, optional
+        Most recycled cubes kept per cube size (default 32)
+    """
+    
+    def __init__(self, max_size: int = 32):
+        """Initialize an empty pool."""
+        self.max_size = max_size
+        self._free: Dict[int, Deque[Cube]] = {}
+    
+    def get(self, src: Cube) -> Cube:
+        """Get a work cube holding a copy of ``src``.
+        
+        Parameters
+        ----------
+        src : Cube
+            Cube to copy
+            
+        Returns
+        -------
+        Cube
+            Pooled or newly cloned cube equal to ``src``
+        """
+        free = self._free.get(src.size)
+        if not free:
+            return src.clone()
+        try:
+            cube = free.pop()
+        except IndexError:  # emptied by another thread since the check
+            return src.clone()
+        cube.copy_state_from(src)
+        return cube
+    
+    def recycle(self, cube: Cube) -> None:
+        """Return a cube obtained from ``get`` for later reuse.
+        
+        Parameters
+        ----------
+        cube : Cube
+            Cube the caller no longer uses
+        """
+        free = self._free.get(cube.size)
+        if free is None:
+            free = self._free.setdefault(cube.size, deque(maxlen=self.max_size))
+        free.append(cube)
+    
+    def __len__(self) -> int:
+        """Number of cubes waiting for reuse."""
+        return sum(len(free) for free in self._free.values())
@@ -6,9 +6,12 @@ parsing standard WCA notation, and applying moves to cube states.
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Union, Iterator, Dict, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union, Iterator, Dict, Tuple
 from enum import Enum
 
+import numpy as np
+
 from .state import Position, CubeState, Axis
 
 
@@ -73,9 +76,13 @@ class Move:
             raise ValueError(f"Invalid face '{self.face}' for move type {self.move_type}")
     
     @classmethod
+    @lru_cache(maxsize=256)
     def parse(cls, notation: str) -> 'Move':
         """Parse move from standard WCA notation.
         
+        Results are cached, as moves are immutable and only a handful of
+        distinct notations occur in practice.
+        
         Parameters
         ----------
         notation : str
@@ -322,6 +329,26 @@ class MoveSequence:
                 else:
                     raise TypeError(f"Expected Move or str, got {type(move)}")
     
+    @classmethod
+    def from_moves(cls, moves: Iterable[Move]) -> 'MoveSequence':
+        """Create a sequence from moves that are already ``Move`` objects.
+        
+        Skips the per-move type checks of the constructor.
+        
+        Parameters
+        ----------
+        moves : Iterable[Move]
+            Moves of the sequence, copied into a new list
+            
+        Returns
+        -------
+        MoveSequence
+            Sequence of the given moves
+        """
+        sequence = cls.__new__(cls)
+        sequence.moves = list(moves)
+        return sequence
+    
     @classmethod
     def parse(cls, notation: str) -> 'MoveSequence':
         """Parse sequence from space-separated notation.
@@ -473,6 +500,25 @@ class MoveSequence:
         """
         return ' '.join(move.to_notation() for move in self.moves)
     
+    def to_permutation(self) -> 'np.ndarray':
+        """Compose the sequence into one 3x3 piece code table.
+        
+        Applying the result with ``Cube.apply_permutation`` moves the pieces
+        exactly as applying every move in order would.
+        
+        Returns
+        -------
+        np.ndarray
+            Read-only (NUM_CODES,) uint16 table, see ``rcsim.cube.codes``
+        """
+        from .codes import identity_table, move_table
+        
+        table = identity_table()
+        for move in self.moves:
+            table = move_table(move)[table]
+        table.flags.writeable = False
+        return table
+    
     def __len__(self) -> int:
         return len(self.moves)
     
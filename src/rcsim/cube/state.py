@@ -36,6 +36,11 @@ class Position:
         """Validate position coordinates."""
         if not all(isinstance(coord, (int, float)) for coord in (self.x, self.y, self.z)):
             raise ValueError("Position coordinates must be numeric")
+        # Positions key every piece lookup, so hash the coordinates only once
+        object.__setattr__(self, '_hash', hash((self.x, self.y, self.z)))
+    
+    def __hash__(self) -> int:
+        return self._hash
     
     def distance_from_center(self) -> float:
         """Calculate Euclidean distance from cube center."""
@@ -243,6 +248,18 @@ class StandardColors:
         return [cls.WHITE, cls.YELLOW, cls.RED, cls.ORANGE, cls.BLUE, cls.GREEN]
 
 
+# Small integer id for each standard color, used by array-based face queries
+COLOR_IDS: Dict[Color, int] = {color: i for i, color in enumerate(StandardColors.get_all_colors())}
+
+# Color, name and hex string of each color id
+COLOR_TABLE: Tuple[Color, ...] = tuple(COLOR_IDS)
+COLOR_NAMES = np.array([color.name for color in COLOR_TABLE])
+COLOR_HEX = np.array([color.to_hex() for color in COLOR_TABLE], dtype="<U7")
+
+# Face order of CubeState.get_packed_state, lowest bits first
+PACKED_FACE_ORDER = ('U', 'R', 'F', 'D', 'L', 'B')
+
+
 class Axis(Enum):
     """Cube rotation axes."""
     X = "x"
@@ -463,13 +480,18 @@ class Cubie:
         return self.orientation.is_solved()
     
     def clone(self) -> 'Cubie':
-        """Create a deep copy of this cubie."""
-        return Cubie(
-            original_position=self.original_position,
-            colors=self.colors.copy(),
-            current_position=self.current_position,
-            orientation=self.orientation
-        )
+        """Create a copy of this cubie.
+        
+        Positions and orientations are immutable and the colors are never
+        mutated after construction, so all of them are shared.
+        """
+        new_cubie = Cubie.__new__(Cubie)  # Skip __init__ and its type checks
+        new_cubie.original_position = self.original_position
+        new_cubie.current_position = self.current_position
+        new_cubie.orientation = self.orientation
+        new_cubie.colors = self.colors
+        new_cubie.piece_type = self.piece_type
+        return new_cubie
     
     def __str__(self) -> str:
         return f"{self.piece_type.title()} at {self.current_position}"
@@ -521,6 +543,13 @@ class CubeState:
         self.size = size
         self.cubies: List[Cubie] = []
         self._position_map: Dict[Position, Cubie] = {}
+        self._positions_array: Optional[np.ndarray] = None
+        self._face_colors: Dict[str, Tuple[Tuple[Color, ...], ...]] = {}
+        self._face_ids: Dict[str, np.ndarray] = {}
+        self._packed_faces: Dict[str, int] = {}
+        self._piece_codes: Optional[np.ndarray] = None  # see rcsim.cube.codes
+        self._sticker_ids: Optional[np.ndarray] = None
+        self._packed_state: Optional[int] = None
         
         self._initialize_solved_state()
     
@@ -611,39 +640,165 @@ class CubeState:
         List[List[Color]]
             2D array of colors on the face
         """
-        if face not in ('U', 'D', 'L', 'R', 'F', 'B'):
-            raise ValueError(f"Invalid face: {face}")
+        cached = self._face_colors.get(face)
+        if cached is None:
+            if face not in ('U', 'D', 'L', 'R', 'F', 'B'):
+                raise ValueError(f"Invalid face: {face}")
+            cached = tuple(tuple(row) for row in self._compute_face_colors(face))
+            self._face_colors[face] = cached
+        # Fresh lists so callers may modify the result
+        return [list(row) for row in cached]
+    
+    def get_face_ids(self, face: str) -> np.ndarray:
+        """Get the colors of a face as ``COLOR_IDS`` values.
         
-        face_colors = [[StandardColors.WHITE for _ in range(self.size)] 
-                       for _ in range(self.size)]
+        Parameters
+        ----------
+        face : str
+            Face name ('U', 'D', 'L', 'R', 'F', 'B')
+            
+        Returns
+        -------
+        np.ndarray
+            Read-only (size, size) uint8 array laid out like
+            ``get_face_colors``, cached until ``invalidate_caches``
+        """
+        ids = self._face_ids.get(face)
+        if ids is None:
+            ids = np.array([[COLOR_IDS[color] for color in row] for row in self.get_face_colors(face)],
+                           dtype=np.uint8)
+            ids.flags.writeable = False  # shared with clones
+            self._face_ids[face] = ids
+        return ids
+    
+    def get_packed_face(self, face: str) -> int:
+        """Get the color ids of a face packed 3 bits per sticker.
+        
+        Parameters
+        ----------
+        face : str
+            Face name ('U', 'D', 'L', 'R', 'F', 'B')
+            
+        Returns
+        -------
+        int
+            Sticker (row, col) in bits ``3 * (row * size + col)`` and up,
+            cached until ``invalidate_caches``
+        """
+        packed = self._packed_faces.get(face)
+        if packed is None:
+            packed = 0
+            for shift, color_id in enumerate(self.get_face_ids(face).ravel().tolist()):
+                packed |= color_id << (3 * shift)
+            self._packed_faces[face] = packed
+        return packed
+    
+    def get_packed_state(self) -> int:
+        """Get all six faces packed into one integer.
         
+        Returns
+        -------
+        int
+            ``get_packed_face`` of each face in ``PACKED_FACE_ORDER``,
+            each taking ``3 * size * size`` bits, first face lowest
+        """
+        face_bits = 3 * self.size * self.size
+        packed = 0
+        for i, face in enumerate(PACKED_FACE_ORDER):
+            packed |= self.get_packed_face(face) << (face_bits * i)
+        return packed
+    
+    def _face_cell_position(self, face: str, i: int, j: int) -> Position:
+        """Get the 3D position behind cell ``[j][i]`` of a face."""
         half_size = (self.size - 1) / 2
         
+        if face == 'U':  # Up face (Y = +half_size)
+            return Position(i - half_size, half_size, j - half_size)
+        elif face == 'D':  # Down face (Y = -half_size)
+            return Position(i - half_size, -half_size, half_size - j)
+        elif face == 'F':  # Front face (Z = +half_size)
+            return Position(i - half_size, half_size - j, half_size)
+        elif face == 'B':  # Back face (Z = -half_size)
+            return Position(half_size - i, half_size - j, -half_size)
+        elif face == 'R':  # Right face (X = +half_size)
+            return Position(half_size, half_size - j, half_size - i)
+        else:  # Left face (X = -half_size)
+            return Position(-half_size, half_size - j, i - half_size)
+    
+    def _face_cell_color(self, face: str, i: int, j: int) -> Color:
+        """Read the color of cell ``[j][i]`` of a face from its piece."""
+        piece = self.get_piece_at_position(self._face_cell_position(face, i, j))
+        if piece:
+            visible_colors = piece.get_visible_colors()
+            if face in visible_colors:
+                return visible_colors[face]
+        return StandardColors.WHITE
+    
+    def _compute_face_colors(self, face: str) -> List[List[Color]]:
+        """Read the colors of a face from the pieces."""
         # Map 3D positions to 2D face coordinates
-        for i in range(self.size):
-            for j in range(self.size):
-                # Calculate 3D position based on face
-                if face == 'U':  # Up face (Y = +half_size)
-                    pos = Position(i - half_size, half_size, j - half_size)
-                elif face == 'D':  # Down face (Y = -half_size)
-                    pos = Position(i - half_size, -half_size, half_size - j)
-                elif face == 'F':  # Front face (Z = +half_size)
-                    pos = Position(i - half_size, half_size - j, half_size)
-                elif face == 'B':  # Back face (Z = -half_size)
-                    pos = Position(half_size - i, half_size - j, -half_size)
-                elif face == 'R':  # Right face (X = +half_size)
-                    pos = Position(half_size, half_size - j, half_size - i)
-                elif face == 'L':  # Left face (X = -half_size)
-                    pos = Position(-half_size, half_size - j, i - half_size)
-                
-                # Get piece at this position and extract color
-                piece = self.get_piece_at_position(pos)
-                if piece:
-                    visible_colors = piece.get_visible_colors()
-                    if face in visible_colors:
-                        face_colors[j][i] = visible_colors[face]
-        
-        return face_colors
+        return [[self._face_cell_color(face, i, j) for i in range(self.size)]
+                for j in range(self.size)]
+    
+    def get_top_row(self, face: str) -> Tuple[int, ...]:
+        """Get the top row and center of a face as ``COLOR_IDS`` values.
+        
+        Only those cells are read from the pieces unless the whole face is
+        already cached.
+        
+        Parameters
+        ----------
+        face : str
+            Face name ('U', 'D', 'L', 'R', 'F', 'B')
+            
+        Returns
+        -------
+        Tuple[int, ...]
+            Ids of row 0 left to right, then of cell (size // 2, size // 2)
+        """
+        mid = self.size // 2
+        ids = self._face_ids.get(face)
+        if ids is not None:
+            return (*ids[0].tolist(), int(ids[mid, mid]))
+        
+        colors = self._face_colors.get(face)
+        if colors is None:
+            if face not in ('U', 'D', 'L', 'R', 'F', 'B'):
+                raise ValueError(f"Invalid face: {face}")
+            top = [self._face_cell_color(face, i, 0) for i in range(self.size)]
+            center = self._face_cell_color(face, mid, mid)
+        else:
+            top, center = colors[0], colors[mid][mid]
+        return (*(COLOR_IDS[color] for color in top), COLOR_IDS[center])
+    
+    def positions_array(self) -> np.ndarray:
+        """Get the current position of every cubie as one array.
+        
+        The array is cached until ``invalidate_caches`` is called, which
+        ``Cube`` does after every move.
+        
+        Returns
+        -------
+        np.ndarray
+            Read-only (N, 3) float32 array, row i is ``cubies[i].current_position``
+        """
+        if self._positions_array is None:
+            coords = [(c.current_position.x, c.current_position.y, c.current_position.z)
+                      for c in self.cubies]
+            positions = np.array(coords, dtype=np.float32).reshape(-1, 3)
+            positions.flags.writeable = False  # shared with clones
+            self._positions_array = positions
+        return self._positions_array
+    
+    def invalidate_caches(self) -> None:
+        """Drop data derived from piece positions after pieces moved."""
+        self._positions_array = None
+        self._face_colors = {}
+        self._face_ids = {}
+        self._packed_faces = {}
+        self._piece_codes = None
+        self._sticker_ids = None
+        self._packed_state = None
     
     def is_solved(self) -> bool:
         """Check if cube is in solved state."""
@@ -657,6 +812,7 @@ class CubeState:
             del self._position_map[from_pos]
             piece.move_to_position(to_pos)
             self._position_map[to_pos] = piece
+            self.invalidate_caches()
     
     def clone(self) -> 'CubeState':
         """Create deep copy of cube state."""
@@ -666,8 +822,48 @@ class CubeState:
         new_state._position_map = {
             cubie.current_position: cubie for cubie in new_state.cubies
         }
+        new_state._positions_array = self._positions_array
+        new_state._face_colors = dict(self._face_colors)
+        new_state._face_ids = dict(self._face_ids)
+        new_state._packed_faces = dict(self._packed_faces)
+        new_state._piece_codes = self._piece_codes
+        new_state._sticker_ids = self._sticker_ids
+        new_state._packed_state = self._packed_state
         return new_state
     
+    def copy_from(self, other: 'CubeState') -> None:
+        """Overwrite this state with another, reusing the existing cubies.
+        
+        Parameters
+        ----------
+        other : CubeState
+            State to copy, of the same size
+            
+        Raises
+        ------
+        ValueError
+            If the sizes differ
+        """
+        if other.size != self.size:
+            raise ValueError(f"Cannot copy a {other.size}x{other.size} state into a {self.size}x{self.size} one")
+        
+        for cubie, source in zip(self.cubies, other.cubies):
+            cubie.original_position = source.original_position
+            cubie.current_position = source.current_position
+            cubie.orientation = source.orientation
+            cubie.colors = source.colors  # never mutated after construction
+            cubie.piece_type = source.piece_type
+        self._position_map = {
+            cubie.current_position: cubie for cubie in self.cubies
+        }
+        self._positions_array = other._positions_array
+        self._face_colors = dict(other._face_colors)
+        self._face_ids = dict(other._face_ids)
+        self._packed_faces = dict(other._packed_faces)
+        self._piece_codes = other._piece_codes
+        self._sticker_ids = other._sticker_ids
+        self._packed_state = other._packed_state
+    
     def __eq__(self, other) -> bool:
         """Check equality with another cube state."""
         if not isinstance(other, CubeState):
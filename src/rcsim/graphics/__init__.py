@@ -2,8 +2,27 @@
 
 This module provides OpenGL-based 3D rendering capabilities for visualizing
 and interacting with Rubik's Cubes.
+
+PyOpenGL's per-call error checking and array validation are switched off
+before any GL module is imported, since they dominate the Python-side
+cost of each GL call. Set ``RCSIM_GL_DEBUG=1`` to keep them on while
+debugging GL errors.
 """
 
+import os
+
+import OpenGL
+
+if not os.environ.get("RCSIM_GL_DEBUG"):
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
+
+try:
+    import OpenGL_accelerate  # noqa: F401  (C speedups, picked up by PyOpenGL)
+except ImportError:
+    pass
+
 from .renderer import CubeRenderer, RenderConfig
 from .camera import Camera
 from .scene import Scene
@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Typed projection loop for the software renderer.
+
+Optional extension: build in place with ``make build-ext``. When it is not
+built, ``SoftwareRenderer`` uses its NumPy implementation, which this
+module mirrors exactly.
+"""
+
+from libc.math cimport cos, sin, M_PI
+
+
+cpdef void project_batch(double[:, ::1] pts, int[:, ::1] out, double[::1] depth,
+                         int width, int height, double cam_dist, double focal,
+                         double rx, double ry) nogil:
+    """Rotate and perspective-project points into screen coordinates.
+
+    Parameters
+    ----------
+    pts : double[:, ::1]
+        (N, 3) world-space points
+    out : int[:, ::1]
+        (N, 2) output screen coordinates
+    depth : double[::1]
+        (N,) output camera-space depth, before the camera distance offset
+    width, height : int
+        Screen size in pixels
+    cam_dist : double
+        Distance of the camera from the origin
+    focal : double
+        Focal length in pixels, ``height / (2 tan(fov / 2))``
+    rx, ry : double
+        Camera rotation around the X and Y axes in degrees
+    """
+    cdef double cos_x = cos(rx * M_PI / 180.0)
+    cdef double sin_x = sin(rx * M_PI / 180.0)
+    cdef double cos_y = cos(ry * M_PI / 180.0)
+    cdef double sin_y = sin(ry * M_PI / 180.0)
+    cdef int half_w = width // 2
+    cdef int half_h = height // 2
+    cdef double x, y, z, x_rot, z_rot, y_rot, z_cam, z_final
+    cdef Py_ssize_t i
+
+    for i in range(pts.shape[0]):
+        x = pts[i, 0]
+        y = pts[i, 1]
+        z = pts[i, 2]
+
+        # Rotate around Y axis, then around X axis
+        x_rot = x * cos_y - z * sin_y
+        z_rot = x * sin_y + z * cos_y
+        y_rot = y * cos_x - z_rot * sin_x
+        z_cam = y * sin_x + z_rot * cos_x
+
+        depth[i] = z_cam
+        z_final = z_cam + cam_dist
+
+        # Points behind the camera collapse to the screen center
+        if z_final <= 0:
+            out[i, 0] = half_w
+            out[i, 1] = half_h
+        else:
+            out[i, 0] = <int>(half_w + x_rot * (focal / z_final))
+            out[i, 1] = <int>(half_h - y_rot * (focal / z_final))
@@ -1,5 +1,6 @@
 """3D camera system for cube visualization."""
 
+import ctypes
 import numpy as np
 from typing import Tuple
 from dataclasses import dataclass
@@ -8,6 +9,10 @@ import math
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+# GLU availability does not change at runtime; resolve it once so the
+# per-frame transform helpers can branch instead of catching exceptions.
+_HAS_GLU = bool(gluLookAt) and bool(gluPerspective)
+
 
 @dataclass
 class CameraState:
@@ -57,8 +62,9 @@ class Camera:
         self.near_plane = near_plane
         self.far_plane = far_plane
         
-        # Orbit camera parameters
-        self.distance = np.linalg.norm(self.position - self.target)
+        # Orbit camera parameters (distance is kept as a plain Python float
+        # so scalar math never promotes the float32 vectors to float64)
+        self.distance = float(np.linalg.norm(self.position - self.target))
         self.azimuth = 45.0  # Horizontal rotation in degrees
         self.elevation = 30.0  # Vertical rotation in degrees
         
@@ -73,6 +79,11 @@ class Camera:
         self.zoom_sensitivity = 0.1
         self.pan_sensitivity = 0.01
         
+        # Column-major matrix buffers handed straight to OpenGL; PyOpenGL
+        # accepts ctypes arrays without an intermediate bytes copy
+        self._view_buf = (ctypes.c_float * 16)()
+        self._proj_buf = (ctypes.c_float * 16)()
+        
         self._update_position()
     
     def _update_position(self) -> None:
@@ -86,7 +97,8 @@ class Camera:
         y = self.distance * math.sin(elevation_rad)
         z = self.distance * math.cos(elevation_rad) * math.sin(azimuth_rad)
         
-        self.position = self.target + np.array([x, y, z], dtype=np.float32)
+        tx, ty, tz = self.target.tolist()
+        self.position = np.array((tx + x, ty + y, tz + z), dtype=np.float32)
     
     def orbit(self, delta_azimuth: float, delta_elevation: float) -> None:
         """Orbit camera around target.
@@ -131,18 +143,54 @@ class Camera:
         delta_y : float
             Pan delta in screen Y direction
         """
-        # Get camera coordinate system
-        forward = self.get_forward_vector()
-        right = self.get_right_vector()
-        up = self.get_up_vector()
+        # Get camera coordinate system as plain floats; the vectors are only
+        # three components long, so scalar math avoids temporary ndarrays
+        _, (rx, ry, rz), (ux, uy, uz) = self._get_basis()
         
         # Calculate pan offset in world space
         pan_scale = self.distance * self.pan_sensitivity
-        offset = (-delta_x * right + delta_y * up) * pan_scale
+        ox = (-delta_x * rx + delta_y * ux) * pan_scale
+        oy = (-delta_x * ry + delta_y * uy) * pan_scale
+        oz = (-delta_x * rz + delta_y * uz) * pan_scale
+        
+        # Move both position and target in place
+        self.target[0] += ox
+        self.target[1] += oy
+        self.target[2] += oz
+        self.position[0] += ox
+        self.position[1] += oy
+        self.position[2] += oz
+    
+    def _get_basis(self) -> Tuple[Tuple[float, float, float], ...]:
+        """Get normalized forward, right and up vectors as scalar tuples.
+        
+        Returns
+        -------
+        Tuple[Tuple[float, float, float], ...]
+            Forward, right and up vectors
+        """
+        px, py, pz = self.position.tolist()
+        tx, ty, tz = self.target.tolist()
+        wx, wy, wz = self.up.tolist()
+        
+        # Forward (camera to target)
+        fx, fy, fz = tx - px, ty - py, tz - pz
+        length = math.sqrt(fx * fx + fy * fy + fz * fz)
+        fx, fy, fz = fx / length, fy / length, fz / length
         
-        # Move both position and target
-        self.target += offset
-        self.position += offset
+        # Right = forward x world up
+        rx = fy * wz - fz * wy
+        ry = fz * wx - fx * wz
+        rz = fx * wy - fy * wx
+        length = math.sqrt(rx * rx + ry * ry + rz * rz)
+        rx, ry, rz = rx / length, ry / length, rz / length
+        
+        # Up = right x forward
+        ux = ry * fz - rz * fy
+        uy = rz * fx - rx * fz
+        uz = rx * fy - ry * fx
+        
+        return (fx, fy, fz), (rx, ry, rz), (ux, uy, uz)
     
     def get_forward_vector(self) -> np.ndarray:
         """Get normalized forward vector (from camera to target)."""
@@ -214,18 +262,63 @@ class Camera:
         
         return proj_matrix
     
+    def get_view_buffer(self) -> ctypes.Array:
+        """Write the view matrix into the reusable column-major buffer.
+        
+        Returns
+        -------
+        ctypes.Array
+            16 floats in OpenGL (column-major) order
+        """
+        (fx, fy, fz), (rx, ry, rz), (ux, uy, uz) = self._get_basis()
+        px, py, pz = self.position.tolist()
+        
+        buf = self._view_buf
+        buf[0], buf[1], buf[2], buf[3] = rx, ux, -fx, 0.0
+        buf[4], buf[5], buf[6], buf[7] = ry, uy, -fy, 0.0
+        buf[8], buf[9], buf[10], buf[11] = rz, uz, -fz, 0.0
+        buf[12] = -(rx * px + ry * py + rz * pz)
+        buf[13] = -(ux * px + uy * py + uz * pz)
+        buf[14] = fx * px + fy * py + fz * pz
+        buf[15] = 1.0
+        return buf
+    
+    def get_projection_buffer(self, aspect_ratio: float) -> ctypes.Array:
+        """Write the projection matrix into the reusable column-major buffer.
+        
+        Parameters
+        ----------
+        aspect_ratio : float
+            Viewport aspect ratio (width/height)
+            
+        Returns
+        -------
+        ctypes.Array
+            16 floats in OpenGL (column-major) order
+        """
+        f = 1.0 / math.tan(math.radians(self.fov) / 2.0)
+        near, far = self.near_plane, self.far_plane
+        
+        buf = self._proj_buf
+        ctypes.memset(buf, 0, ctypes.sizeof(buf))
+        buf[0] = f / aspect_ratio
+        buf[5] = f
+        buf[10] = (far + near) / (near - far)
+        buf[11] = -1.0
+        buf[14] = (2.0 * far * near) / (near - far)
+        return buf
+    
     def apply_view_transform(self) -> None:
         """Apply camera view transform using legacy OpenGL calls."""
-        try:
+        if _HAS_GLU:
             gluLookAt(
                 self.position[0], self.position[1], self.position[2],
                 self.target[0], self.target[1], self.target[2],
                 self.up[0], self.up[1], self.up[2]
             )
-        except:
+        else:
             # Fallback to manual matrix if GLU not available
-            view_matrix = self.get_view_matrix()
-            glMultMatrixf(view_matrix.flatten())
+            glMultMatrixf(self.get_view_buffer())
     
     def apply_projection_transform(self, aspect_ratio: float) -> None:
         """Apply perspective projection using legacy OpenGL calls.
@@ -235,12 +328,11 @@ class Camera:
         aspect_ratio : float
             Viewport aspect ratio
         """
-        try:
+        if _HAS_GLU:
             gluPerspective(self.fov, aspect_ratio, self.near_plane, self.far_plane)
-        except:
+        else:
             # Fallback to manual perspective matrix
-            proj_matrix = self.get_projection_matrix(aspect_ratio)
-            glMultMatrixf(proj_matrix.flatten())
+            glMultMatrixf(self.get_projection_buffer(aspect_ratio))
     
     def reset_to_default(self) -> None:
         """Reset camera to default position and orientation."""
@@ -298,12 +390,9 @@ class Camera:
         self.near_plane = state.near_plane
         self.far_plane = state.far_plane
         
-        # Recalculate orbit parameters
-        self.distance = np.linalg.norm(self.position - self.target)
-        
-        # Calculate azimuth and elevation from position
+        # Recalculate orbit parameters from position
         offset = self.position - self.target
-        self.distance = np.linalg.norm(offset)
+        self.distance = float(np.linalg.norm(offset))
         
         if self.distance > 0:
             normalized = offset / self.distance
@@ -0,0 +1,90 @@
+"""Shadow copy of OpenGL state to skip redundant state changes."""
+
+from typing import Dict, Optional, Tuple
+
+from OpenGL.GL import *
+
+
+class GLStateCache:
+    """Track GL state on the Python side and only call into GL on changes.
+
+    Every PyOpenGL call pays for argument marshalling and validation, so
+    setting state that is already current is wasted work. All changes to
+    the tracked state in a context must go through the same cache, or the
+    cache must be reset with ``invalidate`` afterwards.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache; nothing is assumed about GL state."""
+        self._capabilities: Dict[int, bool] = {}
+        self._matrix_mode: Optional[int] = None
+        self._program: Optional[int] = None
+        self._clear_color: Optional[Tuple[float, float, float, float]] = None
+
+    def invalidate(self) -> None:
+        """Forget all cached state, forcing the next calls through to GL."""
+        self._capabilities.clear()
+        self._matrix_mode = None
+        self._program = None
+        self._clear_color = None
+
+    def enable(self, cap: int) -> None:
+        """Enable a capability unless it is already enabled.
+
+        Parameters
+        ----------
+        cap : int
+            GL capability, e.g. GL_DEPTH_TEST
+        """
+        if self._capabilities.get(cap) is not True:
+            glEnable(cap)
+            self._capabilities[cap] = True
+
+    def disable(self, cap: int) -> None:
+        """Disable a capability unless it is already disabled.
+
+        Parameters
+        ----------
+        cap : int
+            GL capability, e.g. GL_DEPTH_TEST
+        """
+        if self._capabilities.get(cap) is not False:
+            glDisable(cap)
+            self._capabilities[cap] = False
+
+    def matrix_mode(self, mode: int) -> None:
+        """Select the current matrix stack.
+
+        Parameters
+        ----------
+        mode : int
+            GL_MODELVIEW, GL_PROJECTION or GL_TEXTURE
+        """
+        if self._matrix_mode != mode:
+            glMatrixMode(mode)
+            self._matrix_mode = mode
+
+    def bind_program(self, program: int) -> None:
+        """Make a shader program current.
+
+        Parameters
+        ----------
+        program : int
+            Program object, 0 for fixed-function
+        """
+        if self._program != program:
+            glUseProgram(program)
+            self._program = program
+
+    def clear_color(self, r: float, g: float, b: float, a: float) -> None:
+        """Set the color used by glClear.
+
+        Parameters
+        ----------
+        r, g, b, a : float
+            Clear color components
+        """
+        color = (r, g, b, a)
+        if self._clear_color != color:
+            glClearColor(r, g, b, a)
+            self._clear_color = color
@@ -3,15 +3,22 @@
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from pathlib import Path
 import math
 
 from OpenGL.GL import *
+from OpenGL.GL import shaders
 from OpenGL.arrays import vbo
 
+from .gl_state import GLStateCache
 from ..cube import Cube
 from ..cube.state import Position, Color
 
 
+# GLSL sources shipped as package data (see pyproject.toml)
+SHADER_DIR = Path(__file__).resolve().parent.parent / "shaders"
+
+
 @dataclass
 class RenderConfig:
     """Configuration for the cube renderer."""
@@ -42,8 +49,16 @@ class CubeRenderer:
         # OpenGL resources
         self._cube_vao = None
         self._cube_vbo = None
+        self._program = None
         self._initialized = False
         
+        # Shared with the window when driven by a Scene
+        self.gl_state = GLStateCache()
+        
+        # Visible sticker colors per cubie, rebuilt when cube.move_version changes
+        self._visible_colors_cache: Optional[List[Dict[str, Color]]] = None
+        self._cache_version = -1
+        
         # Geometry cache
         self._cube_vertices = None
         self._cube_indices = None
@@ -63,8 +78,8 @@ class CubeRenderer:
         # Generate cube geometry
         self._generate_cube_geometry()
         
-        # Set up basic lighting
-        self._setup_lighting()
+        # Compile the lighting shader program
+        self._setup_shader()
         
         self._initialized = True
     
@@ -129,32 +144,27 @@ class CubeRenderer:
         # Indices are just sequential since we're using separate vertices per face
         self._cube_indices = np.arange(len(vertices) // 9, dtype=np.uint32)
     
-    def _setup_lighting(self) -> None:
-        """Set up basic OpenGL lighting."""
-        # Enable lighting
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        
-        # Light properties
-        light_position = [2.0, 2.0, 2.0, 1.0]  # Positional light
-        light_ambient = [0.2, 0.2, 0.2, 1.0]
-        light_diffuse = [0.8, 0.8, 0.8, 1.0]
-        light_specular = [1.0, 1.0, 1.0, 1.0]
-        
-        glLightfv(GL_LIGHT0, GL_POSITION, light_position)
-        glLightfv(GL_LIGHT0, GL_AMBIENT, light_ambient)
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, light_diffuse)
-        glLightfv(GL_LIGHT0, GL_SPECULAR, light_specular)
-        
-        # Material properties
-        glMaterialfv(GL_FRONT, GL_AMBIENT, [0.1, 0.1, 0.1, 1.0])
-        glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
-        glMaterialfv(GL_FRONT, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-        glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
-        
-        # Enable color material
-        glEnable(GL_COLOR_MATERIAL)
-        glColorMaterial(GL_FRONT, GL_AMBIENT_AND_DIFFUSE)
+    def _setup_shader(self) -> None:
+        """Compile the Phong lighting shader program.
+        
+        Lighting is evaluated per fragment instead of through the
+        fixed-function GL_LIGHT0/glMaterial path.
+        """
+        vertex_source = (SHADER_DIR / "cube.vert").read_text()
+        fragment_source = (SHADER_DIR / "cube.frag").read_text()
+        
+        self._program = shaders.compileProgram(
+            shaders.compileShader(vertex_source, GL_VERTEX_SHADER),
+            shaders.compileShader(fragment_source, GL_FRAGMENT_SHADER),
+        )
+        
+        # Light and material parameters are constant, upload them once
+        glUseProgram(self._program)
+        glUniform3f(glGetUniformLocation(self._program, "u_light_pos"), 2.0, 2.0, 2.0)
+        glUniform1f(glGetUniformLocation(self._program, "u_ambient"), 0.4)
+        glUniform1f(glGetUniformLocation(self._program, "u_diffuse"), 0.8)
+        glUniform1f(glGetUniformLocation(self._program, "u_shininess"), 50.0)
+        glUseProgram(0)
     
     def set_cube(self, cube: Cube) -> None:
         """Set the cube to render.
@@ -165,18 +175,21 @@ class CubeRenderer:
             Cube instance to render
         """
         self.cube = cube
+        self._visible_colors_cache = None
     
     def render(self) -> None:
         """Render the current cube."""
         if not self.cube or not self._initialized:
             return
         
+        self.gl_state.bind_program(self._program)
         glPushMatrix()
         
         # Render each piece
         self._render_pieces()
         
         glPopMatrix()
+        self.gl_state.bind_program(0)
     
     def _render_pieces(self) -> None:
         """Render all cube pieces."""
@@ -187,7 +200,13 @@ class CubeRenderer:
         half_size = (cube_size - 1) / 2.0
         piece_spacing = 1.0
         
-        for cubie in self.cube.state.cubies:
+        if (self._visible_colors_cache is None
+                or self._cache_version != self.cube.move_version):
+            self._visible_colors_cache = [cubie.get_visible_colors()
+                                          for cubie in self.cube.state.cubies]
+            self._cache_version = self.cube.move_version
+        
+        for cubie, visible_colors in zip(self.cube.state.cubies, self._visible_colors_cache):
             pos = cubie.current_position
             
             # Skip internal pieces if not enabled
@@ -201,7 +220,7 @@ class CubeRenderer:
                 pos.z * piece_spacing
             ]
             
-            self._render_piece(cubie, world_pos)
+            self._render_piece(cubie, world_pos, visible_colors)
     
     def _is_visible_piece(self, position: Position, cube_size: int) -> bool:
         """Check if a piece is visible (on the surface)."""
@@ -210,7 +229,8 @@ class CubeRenderer:
                 abs(position.y) == half_size or 
                 abs(position.z) == half_size)
     
-    def _render_piece(self, cubie, world_pos: List[float]) -> None:
+    def _render_piece(self, cubie, world_pos: List[float],
+                      visible_colors: Dict[str, Color]) -> None:
         """Render a single cube piece.
         
         Parameters
@@ -219,6 +239,8 @@ class CubeRenderer:
             The piece to render
         world_pos : List[float]
             World position [x, y, z]
+        visible_colors : Dict[str, Color]
+            Sticker colors by face, from the per-move cache
         """
         glPushMatrix()
         
@@ -233,7 +255,6 @@ class CubeRenderer:
         self._render_base_cube()
         
         # Render colored stickers on visible faces
-        visible_colors = cubie.get_visible_colors()
         for face, color in visible_colors.items():
             self._render_sticker(face, color)
         
@@ -438,4 +459,7 @@ class CubeRenderer:
         if self._cube_vbo:
             self._cube_vbo.delete()
         if self._cube_vao:
-            glDeleteVertexArrays(1, [self._cube_vao])
\ No newline at end of file
+            glDeleteVertexArrays(1, [self._cube_vao])
+        if self._program:
+            glDeleteProgram(self._program)
+            self._program = None
\ No newline at end of file
@@ -1,8 +1,10 @@
 """3D scene management for the cube simulator."""
 
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Tuple
 import time
 
+import numpy as np
+import pygame.locals as pg
 from OpenGL.GL import *
 
 from .window import Window, WindowConfig
@@ -11,6 +13,17 @@ from .renderer import CubeRenderer, RenderConfig
 from ..cube import Cube
 
 
+# Basic face turns by key ('n' for right since 'r' resets the camera)
+_CUBE_MOVE_MAP = {
+    pg.K_u: "U",
+    pg.K_d: "D",
+    pg.K_l: "L",
+    pg.K_n: "R",
+    pg.K_f: "F",
+    pg.K_b: "B",
+}
+
+
 class Scene:
     """Main 3D scene that manages the window, camera, and renderer."""
     
@@ -29,10 +42,19 @@ class Scene:
         self.window = Window(window_config)
         self.camera = Camera()
         self.renderer = CubeRenderer(render_config)
+        
+        # Window and renderer share one GL context, so share its state cache
+        self.renderer.gl_state = self.window.gl_state
         self.cube: Optional[Cube] = None
         
+        # Column-major projection and view matrices, rebuilt only when the
+        # camera or the aspect ratio change
+        self._cached_proj = np.zeros(16, dtype=np.float32)
+        self._cached_view = np.zeros(16, dtype=np.float32)
+        self._matrix_key: Optional[Tuple] = None
+        
         # Timing
-        self.last_frame_time = time.time()
+        self.last_frame_time_ns = time.perf_counter_ns()
         self.delta_time = 0.0
         
         # Input state
@@ -72,8 +94,6 @@ class Scene:
         mod : int
             Modifier keys
         """
-        import pygame.locals as pg
-        
         # Camera controls
         if key == pg.K_r:
             self.camera.reset_to_default()
@@ -99,20 +119,9 @@ class Scene:
         mod : int
             Modifier keys
         """
-        import pygame.locals as pg
-        
         # Basic moves
-        move_map = {
-            pg.K_u: "U",
-            pg.K_d: "D", 
-            pg.K_l: "L",
-            pg.K_n: "R",  # Using 'n' for right since 'r' is used for reset
-            pg.K_f: "F",
-            pg.K_b: "B",
-        }
-        
-        if key in move_map:
-            move = move_map[key]
+        if key in _CUBE_MOVE_MAP:
+            move = _CUBE_MOVE_MAP[key]
             
             # Add prime if shift is held
             if mod & pg.KMOD_SHIFT:
@@ -167,21 +176,23 @@ class Scene:
     def render_frame(self) -> None:
         """Render a single frame."""
         # Update timing
-        current_time = time.time()
-        self.delta_time = current_time - self.last_frame_time
-        self.last_frame_time = current_time
+        # Monotonic integer clock: no NTP jumps, no float drift
+        now_ns = time.perf_counter_ns()
+        self.delta_time = (now_ns - self.last_frame_time_ns) * 1e-9
+        self.last_frame_time_ns = now_ns
         
         # Update animations
         self.renderer.update_animation(self.delta_time)
         
         # Set up matrices
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        self.camera.apply_projection_transform(self.window.get_aspect_ratio())
+        self._update_camera_matrices()
         
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        self.camera.apply_view_transform()
+        gl_state = self.window.gl_state
+        gl_state.matrix_mode(GL_PROJECTION)
+        glLoadMatrixf(self._cached_proj)
+        
+        gl_state.matrix_mode(GL_MODELVIEW)
+        glLoadMatrixf(self._cached_view)
         
         # Render the cube
         self.renderer.render()
@@ -189,36 +200,50 @@ class Scene:
         # Render UI overlay if needed
         self._render_ui()
     
+    def _update_camera_matrices(self) -> None:
+        """Recompute the cached projection and view matrices if stale."""
+        camera = self.camera
+        aspect_ratio = self.window.get_aspect_ratio()
+        
+        key = (camera.position.tobytes(), camera.target.tobytes(), camera.up.tobytes(),
+               camera.fov, camera.near_plane, camera.far_plane, aspect_ratio)
+        if key == self._matrix_key:
+            return
+        
+        self._cached_proj[:] = camera.get_projection_buffer(aspect_ratio)
+        self._cached_view[:] = camera.get_view_buffer()
+        self._matrix_key = key
+    
     def _render_ui(self) -> None:
         """Render UI overlay."""
         if not self.cube:
             return
         
+        gl_state = self.window.gl_state
+        
         # Switch to 2D rendering for UI
-        glMatrixMode(GL_PROJECTION)
+        gl_state.matrix_mode(GL_PROJECTION)
         glPushMatrix()
         glLoadIdentity()
         glOrtho(0, self.window.config.width, self.window.config.height, 0, -1, 1)
         
-        glMatrixMode(GL_MODELVIEW)
+        gl_state.matrix_mode(GL_MODELVIEW)
         glPushMatrix()
         glLoadIdentity()
         
         # Disable depth testing for UI
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
+        gl_state.disable(GL_DEPTH_TEST)
         
         # Render text info
         self._render_cube_info()
         
         # Restore 3D rendering state
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        gl_state.enable(GL_DEPTH_TEST)
         
         glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
+        gl_state.matrix_mode(GL_PROJECTION)
         glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        gl_state.matrix_mode(GL_MODELVIEW)
     
     def _render_cube_info(self) -> None:
         """Render cube information text."""
@@ -2,16 +2,68 @@
 
 import pygame
 import math
+import threading
+from itertools import groupby
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 
 from ..cube import Cube
 from ..cube.state import Position, Color
 
+try:
+    from ._sw_project import project_batch as _project_batch
+except ImportError:  # Cython extension not built, use the NumPy path
+    _project_batch = None
+
+
+# Basic face turns by key
+_CUBE_MOVE_MAP = {
+    pygame.K_u: "U",
+    pygame.K_d: "D",
+    pygame.K_l: "L",
+    pygame.K_r: "R",
+    pygame.K_f: "F",
+    pygame.K_b: "B",
+}
+
+# Events that mean the window contents were lost and must be redrawn
+_EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+
 
 class SoftwareRenderer:
     """Software-based 3D cube renderer using pygame."""
     
+    # Unit-size corner offsets of each piece face, in drawing order
+    _FACE_TEMPLATES: Dict[str, np.ndarray] = {
+        'F': np.array([[-0.5, -0.5, 0.5], [0.5, -0.5, 0.5],
+                       [0.5, 0.5, 0.5], [-0.5, 0.5, 0.5]], dtype=np.float32),
+        'B': np.array([[0.5, -0.5, -0.5], [-0.5, -0.5, -0.5],
+                       [-0.5, 0.5, -0.5], [0.5, 0.5, -0.5]], dtype=np.float32),
+        'U': np.array([[-0.5, 0.5, -0.5], [-0.5, 0.5, 0.5],
+                       [0.5, 0.5, 0.5], [0.5, 0.5, -0.5]], dtype=np.float32),
+        'D': np.array([[-0.5, -0.5, 0.5], [-0.5, -0.5, -0.5],
+                       [0.5, -0.5, -0.5], [0.5, -0.5, 0.5]], dtype=np.float32),
+        'R': np.array([[0.5, -0.5, 0.5], [0.5, -0.5, -0.5],
+                       [0.5, 0.5, -0.5], [0.5, 0.5, 0.5]], dtype=np.float32),
+        'L': np.array([[-0.5, -0.5, -0.5], [-0.5, -0.5, 0.5],
+                       [-0.5, 0.5, 0.5], [-0.5, 0.5, -0.5]], dtype=np.float32),
+    }
+    
+    # Outward unit normal of each piece face
+    _FACE_NORMALS: Dict[str, Tuple[float, float, float]] = {
+        'F': (0.0, 0.0, 1.0), 'B': (0.0, 0.0, -1.0),
+        'U': (0.0, 1.0, 0.0), 'D': (0.0, -1.0, 0.0),
+        'R': (1.0, 0.0, 0.0), 'L': (-1.0, 0.0, 0.0),
+    }
+    
+    _BODY_NORMALS = np.array(list(_FACE_NORMALS.values()))
+    _BODY_COLOR = (0, 0, 0)
+    
+    # Camera-space light direction (upper right, towards the viewer)
+    _LIGHT_DIR = np.array([0.3, 0.5, -1.0]) / np.linalg.norm([0.3, 0.5, -1.0])
+    _AMBIENT = 0.6
+    _DIFFUSE = 0.4
+    
     def __init__(self, width: int = 800, height: int = 600):
         """Initialize the software renderer.
         
@@ -23,19 +75,41 @@ class SoftwareRenderer:
             Screen height
         """
         self.width = width
-        self.height = height
+        self._height = height
         self.screen = None
         self.cube = None
         
+        # Camera rotation trig and matrix, recomputed only after the
+        # angles change (the rotation setters mark them dirty)
+        self._rot_dirty = True
+        self._cos_x = self._sin_x = 0.0
+        self._cos_y = self._sin_y = 0.0
+        self._view_matrix = np.eye(3)
+        
         # Camera parameters
         self.camera_distance = 8.0
         self.camera_rotation_x = 30.0
         self.camera_rotation_y = 45.0
         
-        # Projection parameters
-        self.fov = 60.0
+        # Projection parameters; the height and fov setters keep the focal
+        # length current from here on
+        self._fov = 60.0
+        self._update_focal()
         self.near = 0.1
         self.far = 100.0
+        
+        # Redraw tracking: input sets _dirty, cube changes show up as a new
+        # move_version, render() clears both
+        self._dirty = True
+        self._rendered_version: Optional[Tuple[int, int]] = None
+        
+        # Scratch buffer for single-face corners in render_cube_face
+        self._corner_scratch = np.empty((4, 3), dtype=np.float64)
+        
+        # Visible faces of the current cube, keyed on its move_version
+        self._face_cache: Optional[Tuple[np.ndarray, List[str], np.ndarray,
+                                         List[Color], np.ndarray]] = None
+        self._face_cache_key: Optional[Tuple[int, int, float]] = None
     
     def initialize(self) -> bool:
         """Initialize pygame and create screen.
@@ -49,6 +123,10 @@ class SoftwareRenderer:
             pygame.init()
             self.screen = pygame.display.set_mode((self.width, self.height))
             pygame.display.set_caption("Advanced Rubik's Cube Simulator")
+            
+            # Only queue the events handle_input looks at
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, *_EXPOSE_EVENTS])
             return True
         except Exception as e:
             print(f"Failed to initialize software renderer: {e}")
@@ -63,82 +141,235 @@ class SoftwareRenderer:
             Cube instance to render
         """
         self.cube = cube
+        self._face_cache = None
+        self._dirty = True
     
-    def project_point(self, point: np.ndarray) -> Tuple[int, int]:
-        """Project 3D point to 2D screen coordinates.
+    @property
+    def height(self) -> int:
+        """Screen height in pixels."""
+        return self._height
+    
+    @height.setter
+    def height(self, value: int) -> None:
+        self._height = value
+        self._update_focal()
+    
+    @property
+    def fov(self) -> float:
+        """Vertical field of view in degrees."""
+        return self._fov
+    
+    @fov.setter
+    def fov(self, value: float) -> None:
+        self._fov = value
+        self._update_focal()
+    
+    def _update_focal(self) -> None:
+        """Recompute the focal length in pixels from fov and height."""
+        self._focal = self._height / (2.0 * math.tan(math.radians(self._fov) / 2.0))
+    
+    @property
+    def camera_rotation_x(self) -> float:
+        """Camera rotation around the X axis in degrees."""
+        return self._camera_rotation_x
+    
+    @camera_rotation_x.setter
+    def camera_rotation_x(self, value: float) -> None:
+        self._camera_rotation_x = value
+        self._rot_dirty = True
+    
+    @property
+    def camera_rotation_y(self) -> float:
+        """Camera rotation around the Y axis in degrees."""
+        return self._camera_rotation_y
+    
+    @camera_rotation_y.setter
+    def camera_rotation_y(self, value: float) -> None:
+        self._camera_rotation_y = value
+        self._rot_dirty = True
+    
+    def _update_rotation(self) -> None:
+        """Recompute the cached trig values and rotation matrix if dirty."""
+        if not self._rot_dirty:
+            return
+        
+        angle_x = math.radians(self._camera_rotation_x)
+        angle_y = math.radians(self._camera_rotation_y)
+        self._cos_x, self._sin_x = math.cos(angle_x), math.sin(angle_x)
+        self._cos_y, self._sin_y = math.cos(angle_y), math.sin(angle_y)
+        
+        # Rotate around Y axis, then around X axis
+        rot_y = np.array([[self._cos_y, 0.0, -self._sin_y],
+                          [0.0, 1.0, 0.0],
+                          [self._sin_y, 0.0, self._cos_y]])
+        rot_x = np.array([[1.0, 0.0, 0.0],
+                          [0.0, self._cos_x, -self._sin_x],
+                          [0.0, self._sin_x, self._cos_x]])
+        
+        self._view_matrix = rot_x @ rot_y
+        self._rot_dirty = False
+    
+    def _compute_view_matrix(self) -> np.ndarray:
+        """Get the 3x3 camera rotation matrix for the current angles.
+        
+        Returns
+        -------
+        np.ndarray
+            3x3 ``Rx @ Ry`` rotation matrix mapping world to camera space
+        """
+        self._update_rotation()
+        return self._view_matrix
+    
+    def project_points(self, points: np.ndarray) -> np.ndarray:
+        """Project a batch of 3D points to 2D screen coordinates.
         
         Parameters
         ----------
-        point : np.ndarray
-            3D point [x, y, z]
+        points : np.ndarray
+            Array of shape (N, 3) with world-space points
             
         Returns
         -------
-        Tuple[int, int]
-            Screen coordinates (x, y)
+        np.ndarray
+            Integer array of shape (N, 2) with screen coordinates
         """
-        # Apply camera rotation
-        x, y, z = point
+        return self._rotate_and_project(points)[0]
+    
+    def _rotate_and_project(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Rotate points into camera space and project them.
+        
+        Uses the compiled ``_sw_project`` loop when it is available.
+        
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (N, 3) with world-space points
+            
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (N, 2) screen coordinates and (N,) camera-space depths
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
         
-        # Rotate around Y axis
-        angle_y = math.radians(self.camera_rotation_y)
-        cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
-        x_rot = x * cos_y - z * sin_y
-        z_rot = x * sin_y + z * cos_y
+        if _project_batch is not None:
+            screen = np.empty((len(points), 2), dtype=np.intc)
+            depth = np.empty(len(points), dtype=np.float64)
+            _project_batch(points, screen, depth, self.width, self.height,
+                           self.camera_distance, self._focal,
+                           self.camera_rotation_x, self.camera_rotation_y)
+            return screen, depth
         
-        # Rotate around X axis
-        angle_x = math.radians(self.camera_rotation_x)
-        cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
-        y_rot = y * cos_x - z_rot * sin_x
-        z_final = y * sin_x + z_rot * cos_x
+        # Apply camera rotation
+        camera_points = np.einsum('ij,nj->ni', self._compute_view_matrix(), points)
         
+        return self._project_camera_points(camera_points), camera_points[:, 2]
+    
+    def _project_camera_points(self, camera_points: np.ndarray) -> np.ndarray:
+        """Perspective-project rotated (camera-space) points.
+        
+        Parameters
+        ----------
+        camera_points : np.ndarray
+            Array of shape (N, 3) already rotated into camera space
+            
+        Returns
+        -------
+        np.ndarray
+            Integer array of shape (N, 2) with screen coordinates
+        """
         # Move away from camera
-        z_final += self.camera_distance
+        z_final = camera_points[:, 2] + self.camera_distance
         
-        # Perspective projection
-        if z_final <= 0:
-            return (self.width // 2, self.height // 2)
+        # Perspective projection; points behind the camera collapse to center
+        behind = z_final <= 0
+        z_safe = np.where(behind, 1.0, z_final)
         
-        fov_rad = math.radians(self.fov)
-        scale = 1.0 / math.tan(fov_rad / 2.0)
+        screen = np.empty((len(camera_points), 2), dtype=np.int64)
+        focal_over_z = self._focal / z_safe
+        screen[:, 0] = self.width // 2 + camera_points[:, 0] * focal_over_z
+        screen[:, 1] = self.height // 2 - camera_points[:, 1] * focal_over_z
+        screen[behind] = (self.width // 2, self.height // 2)
         
-        screen_x = int(self.width // 2 + x_rot * scale * self.height / (2.0 * z_final))
-        screen_y = int(self.height // 2 - y_rot * scale * self.height / (2.0 * z_final))
+        return screen
+    
+    def project_point(self, point: np.ndarray) -> Tuple[int, int]:
+        """Project 3D point to 2D screen coordinates.
         
+        Parameters
+        ----------
+        point : np.ndarray
+            3D point [x, y, z]
+            
+        Returns
+        -------
+        Tuple[int, int]
+            Screen coordinates (x, y)
+        """
+        screen_x, screen_y = self.project_points(point)[0].tolist()
         return (screen_x, screen_y)
     
-    def render_cube_face(self, corners: List[np.ndarray], color: Color) -> None:
+    def render_cube_face(self, corners: Union[List[np.ndarray], np.ndarray], color: Color) -> None:
         """Render a cube face as a polygon.
         
         Parameters
         ----------
-        corners : List[np.ndarray]
+        corners : Union[List[np.ndarray], np.ndarray]
             4 corner points of the face
         color : Color
             Face color
         """
-        # Project corners to screen space
-        screen_points = [self.project_point(corner) for corner in corners]
+        # Project corners to screen space, quads via the scratch buffer
+        if len(corners) == 4:
+            self._corner_scratch[:] = corners
+            corners = self._corner_scratch
+        screen_points = self.project_points(corners).tolist()
         
         # Check if face is visible (simple back-face culling)
         if len(screen_points) >= 3:
-            # Calculate normal using cross product
-            v1 = np.array(screen_points[1]) - np.array(screen_points[0])
-            v2 = np.array(screen_points[2]) - np.array(screen_points[0])
-            normal_z = v1[0] * v2[1] - v1[1] * v2[0]
+            # Calculate normal using a scalar 2D cross product
+            (p0x, p0y), (p1x, p1y), (p2x, p2y) = screen_points[:3]
+            normal_z = (p1x - p0x) * (p2y - p0y) - (p1y - p0y) * (p2x - p0x)
             
             if normal_z > 0:  # Face is visible
-                pygame_color = (color.r, color.g, color.b)
-                pygame.draw.polygon(self.screen, pygame_color, screen_points)
-                pygame.draw.polygon(self.screen, (0, 0, 0), screen_points, 2)  # Border
+                self._draw_polygon(self.screen, screen_points, (color.r, color.g, color.b))
+    
+    def _draw_polygon(self, surface: pygame.Surface, screen_points: List[List[int]],
+                      rgb: Tuple[int, int, int]) -> None:
+        """Draw a filled, outlined polygon.
+        
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Surface to draw on
+        screen_points : List[List[int]]
+            Projected corner points of the face
+        rgb : Tuple[int, int, int]
+            Fill color
+        """
+        pygame.draw.polygon(surface, rgb, screen_points)
+        pygame.draw.polygon(surface, (0, 0, 0), screen_points, 2)  # Border
     
-    def render(self) -> None:
-        """Render the current cube."""
-        if not self.cube or not self.screen:
+    def render(self, target: Optional[pygame.Surface] = None) -> None:
+        """Render the current cube.
+        
+        Parameters
+        ----------
+        target : pygame.Surface, optional
+            Surface to render into, defaults to the screen
+        """
+        surface = target or self.screen
+        if not self.cube or not surface:
             return
         
+        self._dirty = False
+        self._rendered_version = (id(self.cube), self.cube.move_version)
+        
         # Clear screen
-        self.screen.fill((50, 50, 70))  # Dark blue background
+        surface.fill((50, 50, 70))  # Dark blue background
+        
+        # Refresh camera trig once per frame if the angles changed
+        self._update_rotation()
         
         # Get cube size and calculate piece positions
         cube_size = self.cube.size
@@ -146,22 +377,120 @@ class SoftwareRenderer:
         gap = 0.1
         half_cube = (cube_size - 1) / 2.0
         
-        # Render each piece
-        for cubie in self.cube.state.cubies:
-            pos = cubie.current_position
-            
-            # Calculate world position
-            world_x = pos.x * (piece_size + gap)
-            world_y = pos.y * (piece_size + gap)
-            world_z = pos.z * (piece_size + gap)
-            
-            # Get visible colors
-            visible_colors = cubie.get_visible_colors()
+        # Every visible face, so all corners are projected in one batch
+        face_centers, face_names, normals, face_colors, fill_groups = self._get_face_data(piece_size + gap)
+        if not face_names:
+            return
+        
+        # Back-face cull in 3D: keep faces whose outward normal points
+        # towards the eye, which sits at (0, 0, -distance) in camera space
+        rotation = self._compute_view_matrix()
+        eye = rotation[2] * -self.camera_distance
+        
+        # Black cube body first: one quad per camera-facing side shows
+        # between the stickers instead of a border around every sticker
+        body_size = (cube_size - 1) * (piece_size + gap) + piece_size
+        body_facing = np.einsum('ij,ij->i', self._BODY_NORMALS,
+                                self._BODY_NORMALS * (body_size / 2.0) - eye) < 0
+        body_names = [face for face, facing in zip(self._FACE_NORMALS, body_facing) if facing]
+        body_corners = self.build_face_corners_batch(np.zeros((len(body_names), 3)),
+                                                     body_names, body_size)
+        body_screen = self._rotate_and_project(body_corners.reshape(-1, 3))[0]
+        for points in body_screen.reshape(-1, 4, 2).tolist():
+            pygame.draw.polygon(surface, self._BODY_COLOR, points)
+        
+        to_face = face_centers + normals * (piece_size / 2.0) - eye
+        visible = np.flatnonzero(np.einsum('ij,ij->i', normals, to_face) < 0)
+        if len(visible) == 0:
+            return
+        
+        # Cheap diffuse shade from the same normals
+        lambert = np.maximum((normals[visible] @ rotation.T) @ self._LIGHT_DIR, 0.0)
+        shades = self._AMBIENT + self._DIFFUSE * lambert
+        
+        corners = self.build_face_corners_batch(face_centers[visible],
+                                                [face_names[i] for i in visible],
+                                                piece_size)
+        
+        # Rotate all (M, 4, 3) corners at once, then order faces by fill
+        # group (same color on the same side) and far to near within a
+        # group; visible stickers of the convex cube never overlap
+        screen, depth = self._rotate_and_project(corners.reshape(-1, 3))
+        groups = fill_groups[visible]
+        order = np.lexsort((-depth.reshape(-1, 4).mean(axis=1), groups))
+        
+        projected = screen.reshape(-1, 4, 2).tolist()
+        visible = visible.tolist()
+        shades = shades.tolist()
+        
+        # One fill color per run of same-group faces
+        draw_polygon = pygame.draw.polygon
+        for _, run in groupby(order.tolist(), key=groups.__getitem__):
+            run = list(run)
+            color, shade = face_colors[visible[run[0]]], shades[run[0]]
+            rgb = (int(color.r * shade), int(color.g * shade), int(color.b * shade))
+            for i in run:
+                draw_polygon(surface, rgb, projected[i])
+    
+    def needs_redraw(self) -> bool:
+        """Check whether the camera or cube changed since the last render.
+        
+        Returns
+        -------
+        bool
+            True if the next frame would differ from the last one
+        """
+        if self._dirty:
+            return True
+        return (self.cube is not None
+                and self._rendered_version != (id(self.cube), self.cube.move_version))
+    
+    def _get_face_data(self, spacing: float) -> Tuple[np.ndarray, List[str], np.ndarray,
+                                                      List[Color], np.ndarray]:
+        """Get piece centers, names, normals and colors of all visible faces.
+        
+        The sticker layout only changes when a move is applied, so the
+        result is cached until ``cube.move_version`` changes.
+        
+        Parameters
+        ----------
+        spacing : float
+            Distance between neighbouring piece centers
             
-            # Render each visible face
-            for face_name, face_color in visible_colors.items():
-                self.render_piece_face(world_x, world_y, world_z, 
-                                     face_name, face_color, piece_size)
+        Returns
+        -------
+        Tuple[np.ndarray, List[str], np.ndarray, List[Color], np.ndarray]
+            (M, 3) piece centers, M face names, (M, 3) outward normals,
+            M colors and M fill group ids (faces with equal ids share the
+            same color and side, hence the same shaded fill)
+        """
+        cube = self.cube
+        key = (id(cube), cube.move_version, spacing)
+        if self._face_cache is not None and key == self._face_cache_key:
+            return self._face_cache
+        
+        # Only the color lookup stays per cubie; positions come as one array
+        cubie_index = []
+        face_names = []
+        face_colors = []
+        for index, cubie in enumerate(cube.state.cubies):
+            for face_name, face_color in cubie.get_visible_colors().items():
+                if face_name in self._FACE_TEMPLATES:
+                    cubie_index.append(index)
+                    face_names.append(face_name)
+                    face_colors.append(face_color)
+        
+        positions = cube.state.positions_array().astype(np.float64)
+        face_centers = positions[cubie_index] * spacing
+        normals = np.array([self._FACE_NORMALS[face] for face in face_names]).reshape(-1, 3)
+        
+        group_ids: Dict[Tuple[str, str], int] = {}
+        fill_groups = np.array([group_ids.setdefault((color.name, face), len(group_ids))
+                                for color, face in zip(face_colors, face_names)], dtype=np.int64)
+        
+        self._face_cache = (face_centers.reshape(-1, 3), face_names, normals, face_colors, fill_groups)
+        self._face_cache_key = key
+        return self._face_cache
     
     def render_piece_face(self, x: float, y: float, z: float, 
                          face: str, color: Color, size: float) -> None:
@@ -178,56 +507,34 @@ class SoftwareRenderer:
         size : float
             Size of the face
         """
-        half_size = size / 2.0
-        
-        # Define face corners based on face name
-        if face == 'F':  # Front
-            corners = [
-                np.array([x - half_size, y - half_size, z + half_size]),
-                np.array([x + half_size, y - half_size, z + half_size]),
-                np.array([x + half_size, y + half_size, z + half_size]),
-                np.array([x - half_size, y + half_size, z + half_size])
-            ]
-        elif face == 'B':  # Back
-            corners = [
-                np.array([x + half_size, y - half_size, z - half_size]),
-                np.array([x - half_size, y - half_size, z - half_size]),
-                np.array([x - half_size, y + half_size, z - half_size]),
-                np.array([x + half_size, y + half_size, z - half_size])
-            ]
-        elif face == 'U':  # Up
-            corners = [
-                np.array([x - half_size, y + half_size, z - half_size]),
-                np.array([x - half_size, y + half_size, z + half_size]),
-                np.array([x + half_size, y + half_size, z + half_size]),
-                np.array([x + half_size, y + half_size, z - half_size])
-            ]
-        elif face == 'D':  # Down
-            corners = [
-                np.array([x - half_size, y - half_size, z + half_size]),
-                np.array([x - half_size, y - half_size, z - half_size]),
-                np.array([x + half_size, y - half_size, z - half_size]),
-                np.array([x + half_size, y - half_size, z + half_size])
-            ]
-        elif face == 'R':  # Right
-            corners = [
-                np.array([x + half_size, y - half_size, z + half_size]),
-                np.array([x + half_size, y - half_size, z - half_size]),
-                np.array([x + half_size, y + half_size, z - half_size]),
-                np.array([x + half_size, y + half_size, z + half_size])
-            ]
-        elif face == 'L':  # Left
-            corners = [
-                np.array([x - half_size, y - half_size, z - half_size]),
-                np.array([x - half_size, y - half_size, z + half_size]),
-                np.array([x - half_size, y + half_size, z + half_size]),
-                np.array([x - half_size, y + half_size, z - half_size])
-            ]
-        else:
+        template = self._FACE_TEMPLATES.get(face)
+        if template is None:
             return
         
+        corners = template * size + np.array([x, y, z])
         self.render_cube_face(corners, color)
     
+    def build_face_corners_batch(self, centers: np.ndarray, faces: List[str],
+                                 size: float) -> np.ndarray:
+        """Build world-space corners for many piece faces at once.
+        
+        Parameters
+        ----------
+        centers : np.ndarray
+            Array of shape (N, 3) with piece centers
+        faces : List[str]
+            Face name for each center
+        size : float
+            Size of the faces
+            
+        Returns
+        -------
+        np.ndarray
+            Array of shape (N, 4, 3) with face corners
+        """
+        templates = np.stack([self._FACE_TEMPLATES[face] for face in faces])
+        return templates * size + np.asarray(centers)[:, None, :]
+    
     def handle_input(self, event) -> bool:
         """Handle input events.
         
@@ -244,7 +551,14 @@ class SoftwareRenderer:
         if event.type == pygame.QUIT:
             return False
         
+        elif event.type in _EXPOSE_EVENTS:
+            # Uncovered or restored window: repaint even if nothing changed
+            self._dirty = True
+        
         elif event.type == pygame.KEYDOWN:
+            # Camera and cube keys all change the picture
+            self._dirty = True
+            
             if event.key == pygame.K_ESCAPE:
                 return False
             
@@ -264,17 +578,8 @@ class SoftwareRenderer:
             
             # Cube controls
             elif self.cube:
-                move_map = {
-                    pygame.K_u: "U",
-                    pygame.K_d: "D",
-                    pygame.K_l: "L",
-                    pygame.K_r: "R",
-                    pygame.K_f: "F",
-                    pygame.K_b: "B"
-                }
-                
-                if event.key in move_map:
-                    move = move_map[event.key]
+                if event.key in _CUBE_MOVE_MAP:
+                    move = _CUBE_MOVE_MAP[event.key]
                     
                     # Check for modifiers
                     mods = pygame.key.get_pressed()
@@ -299,8 +604,15 @@ class SoftwareRenderer:
         
         return True
     
-    def run(self) -> None:
-        """Run the software renderer main loop."""
+    def run(self, threaded: bool = False) -> None:
+        """Run the software renderer main loop.
+        
+        Parameters
+        ----------
+        threaded : bool, optional
+            Render on a background thread into two offscreen surfaces
+            while the main thread handles input and presents frames
+        """
         if not self.initialize():
             return
         
@@ -321,17 +633,87 @@ class SoftwareRenderer:
         print("  ESC         - Quit")
         print("="*50)
         
+        if threaded:
+            self._run_threaded(clock)
+            pygame.quit()
+            return
+        
         while running:
             for event in pygame.event.get():
                 if not self.handle_input(event):
                     running = False
             
-            self.render()
-            pygame.display.flip()
+            # Nothing changed: keep the last frame on screen
+            if self.needs_redraw():
+                self.render()
+                pygame.display.flip()
             clock.tick(60)
         
         pygame.quit()
     
+    def _run_threaded(self, clock: pygame.time.Clock) -> None:
+        """Main loop with rendering moved to a worker thread.
+        
+        The worker alternates between two offscreen surfaces and publishes
+        the index of the last completed one; the main thread blits that
+        surface and flips. ``state_lock`` keeps input handling from
+        mutating the cube or camera mid-frame.
+        
+        Parameters
+        ----------
+        clock : pygame.time.Clock
+            Clock used to cap the presentation rate
+        """
+        buffers = [pygame.Surface((self.width, self.height)) for _ in range(2)]
+        state_lock = threading.Lock()
+        swap_lock = threading.Lock()
+        frame_request = threading.Event()
+        frame_ready = threading.Event()
+        stop = threading.Event()
+        front = [0]
+        
+        def worker() -> None:
+            back = 1
+            while not stop.is_set():
+                if not frame_request.wait(timeout=0.1):
+                    continue
+                frame_request.clear()
+                
+                with state_lock:
+                    self.render(buffers[back])
+                with swap_lock:
+                    front[0] = back
+                back ^= 1
+                frame_ready.set()
+        
+        render_thread = threading.Thread(target=worker, name="rcsim-software-render", daemon=True)
+        render_thread.start()
+        
+        try:
+            running = True
+            while running:
+                with state_lock:
+                    for event in pygame.event.get():
+                        if not self.handle_input(event):
+                            running = False
+                
+                # Let input catch up before asking for another frame
+                if pygame.event.peek(pump=False):
+                    continue
+                
+                if self.needs_redraw():
+                    frame_request.set()
+                if frame_ready.is_set():
+                    frame_ready.clear()
+                    with swap_lock:
+                        self.screen.blit(buffers[front[0]], (0, 0))
+                    pygame.display.flip()
+                
+                clock.tick(60)
+        finally:
+            stop.set()
+            render_thread.join()
+    
     def cleanup(self) -> None:
         """Clean up resources."""
         if pygame.get_init():
@@ -1,5 +1,7 @@
 """Window management using Pygame and OpenGL."""
 
+import time
+
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
@@ -8,9 +10,16 @@ import numpy as np
 from typing import Tuple, Optional, Callable
 from dataclasses import dataclass
 
+from .gl_state import GLStateCache
 from ..cube import Cube
 
 
+# Event types handled by Window.handle_events; everything else is
+# dropped by SDL before it reaches the Python queue
+_HANDLED_EVENTS = [QUIT, KEYDOWN, MOUSEBUTTONDOWN, MOUSEBUTTONUP,
+                   MOUSEMOTION, MOUSEWHEEL, VIDEORESIZE]
+
+
 @dataclass
 class WindowConfig:
     """Configuration for the graphics window."""
@@ -37,6 +46,7 @@ class Window:
         self.config = config or WindowConfig()
         self.running = False
         self.clock = None
+        self.gl_state = GLStateCache()
         
         # Event callbacks
         self.on_key_press: Optional[Callable[[int, int], None]] = None
@@ -48,6 +58,10 @@ class Window:
         self._mouse_pressed = False
         self._last_mouse_pos = (0, 0)
         
+        # Event pumping is throttled to the frame rate set by run()
+        self.target_fps = 0
+        self._last_pump_time = 0.0
+        
         self._initialize()
     
     def _initialize(self) -> None:
@@ -75,6 +89,10 @@ class Window:
         )
         pygame.display.set_caption(self.config.title)
         
+        # Filter events at the SDL level instead of matching them in Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        
         # Enable VSync if requested
         if self.config.vsync:
             pygame.display.gl_set_attribute(pygame.GL_SWAP_CONTROL, 1)
@@ -88,24 +106,24 @@ class Window:
     def _setup_opengl(self) -> None:
         """Configure OpenGL state."""
         # Enable depth testing
-        glEnable(GL_DEPTH_TEST)
+        self.gl_state.enable(GL_DEPTH_TEST)
         glDepthFunc(GL_LESS)
         
         # Enable face culling
-        glEnable(GL_CULL_FACE)
+        self.gl_state.enable(GL_CULL_FACE)
         glCullFace(GL_BACK)
         glFrontFace(GL_CCW)
         
         # Enable blending for transparency
-        glEnable(GL_BLEND)
+        self.gl_state.enable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         
         # Enable multisampling if available
         if self.config.msaa_samples > 0:
-            glEnable(GL_MULTISAMPLE)
+            self.gl_state.enable(GL_MULTISAMPLE)
         
         # Set clear color
-        glClearColor(*self.config.background_color)
+        self.gl_state.clear_color(*self.config.background_color)
         
         # Set initial viewport
         self.set_viewport(self.config.width, self.config.height)
@@ -144,7 +162,28 @@ class Window:
         bool
             True if should continue running, False to quit
         """
+        # Don't pump SDL faster than the target frame rate unless
+        # something is already waiting in the queue
+        now = time.perf_counter()
+        if (self.target_fps > 0
+                and now - self._last_pump_time < 0.9 / self.target_fps
+                and not pygame.event.peek(pump=False)):
+            return True
+        self._last_pump_time = now
+        
+        # Mouse motion is coalesced: only the latest position of a run of
+        # MOUSEMOTION events is reported as a single drag
+        motion_pos = None
+        
         for event in pygame.event.get():
+            if event.type == MOUSEMOTION:
+                motion_pos = event.pos
+                continue
+            
+            if motion_pos is not None:
+                self._flush_mouse_motion(motion_pos)
+                motion_pos = None
+            
             if event.type == QUIT:
                 return False
             
@@ -166,14 +205,6 @@ class Window:
             elif event.type == MOUSEBUTTONUP:
                 self._mouse_pressed = False
             
-            elif event.type == MOUSEMOTION:
-                if self._mouse_pressed and self.on_mouse_drag:
-                    dx = event.pos[0] - self._last_mouse_pos[0]
-                    dy = event.pos[1] - self._last_mouse_pos[1]
-                    self.on_mouse_drag(dx, dy, event.pos[0], event.pos[1])
-                
-                self._last_mouse_pos = event.pos
-            
             elif event.type == MOUSEWHEEL:
                 if self.on_mouse_wheel:
                     self.on_mouse_wheel(event.y)
@@ -183,8 +214,26 @@ class Window:
                 if self.on_resize:
                     self.on_resize(event.w, event.h)
         
+        if motion_pos is not None:
+            self._flush_mouse_motion(motion_pos)
+        
         return True
     
+    def _flush_mouse_motion(self, pos: Tuple[int, int]) -> None:
+        """Report accumulated mouse motion up to ``pos``.
+        
+        Parameters
+        ----------
+        pos : Tuple[int, int]
+            Latest mouse position
+        """
+        if self._mouse_pressed and self.on_mouse_drag:
+            dx = pos[0] - self._last_mouse_pos[0]
+            dy = pos[1] - self._last_mouse_pos[1]
+            self.on_mouse_drag(dx, dy, pos[0], pos[1])
+        
+        self._last_mouse_pos = pos
+    
     def run(self, render_callback: Callable[[], None], target_fps: int = 60) -> None:
         """Run the main event loop.
         
@@ -196,6 +245,7 @@ class Window:
             Target frames per second, defaults to 60
         """
         self.running = True
+        self.target_fps = target_fps
         
         while self.running:
             # Handle events
@@ -0,0 +1,28 @@
+#version 120
+
+// Phong lighting for cube pieces and stickers.
+
+uniform vec3 u_light_pos;   // Light position in eye space
+uniform float u_ambient;
+uniform float u_diffuse;
+uniform float u_shininess;
+
+varying vec3 v_position;
+varying vec3 v_normal;
+varying vec4 v_color;
+
+void main() {
+    vec3 normal = normalize(v_normal);
+    vec3 light_dir = normalize(u_light_pos - v_position);
+    vec3 view_dir = normalize(-v_position);
+    vec3 half_dir = normalize(light_dir + view_dir);
+
+    float diffuse = max(dot(normal, light_dir), 0.0);
+    float specular = 0.0;
+    if (diffuse > 0.0) {
+        specular = pow(max(dot(normal, half_dir), 0.0), u_shininess);
+    }
+
+    vec3 color = v_color.rgb * (u_ambient + u_diffuse * diffuse) + vec3(specular);
+    gl_FragColor = vec4(color, v_color.a);
+}
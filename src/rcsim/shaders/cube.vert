@@ -0,0 +1,16 @@
+#version 120
+
+// Per-vertex transform for cube pieces. Lighting is computed per fragment
+// in eye space, so only the eye-space position and normal are passed on.
+
+varying vec3 v_position;
+varying vec3 v_normal;
+varying vec4 v_color;
+
+void main() {
+    vec4 eye_position = gl_ModelViewMatrix * gl_Vertex;
+    v_position = eye_position.xyz;
+    v_normal = normalize(gl_NormalMatrix * gl_Normal);
+    v_color = gl_Color;
+    gl_Position = gl_ProjectionMatrix * eye_position;
+}
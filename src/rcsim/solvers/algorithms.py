@@ -1,168 +1,251 @@
 """Algorithm database for common cube solving algorithms."""
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 
-from ..cube.moves import MoveSequence
+import numpy as np
 
+from ..cube.moves import Move, MoveSequence
+from .base import _SLOTS
 
-@dataclass
+
+@dataclass(eq=False, repr=False, frozen=True, **_SLOTS)
 class Algorithm:
-    """Represents a solving algorithm/case."""
+    """Represents a solving algorithm/case.
+    
+    Built-in algorithms are single shared instances, so equality and
+    hashing are by identity. ``moves_tuple`` and ``notation_tuple`` are
+    snapshots of ``moves`` taken at construction.
+    """
     name: str
     moves: MoveSequence
     description: str
     category: str
     difficulty: int  # 1-5 scale
     frequency: float  # How often this case appears (0-1)
+    moves_tuple: Tuple[Move, ...] = field(init=False)
+    notation_tuple: Tuple[str, ...] = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Resolve the moves once for callers that apply them repeatedly."""
+        object.__setattr__(self, "moves_tuple", tuple(self.moves))
+        object.__setattr__(self, "notation_tuple", tuple(str(move) for move in self.moves_tuple))
     
     def __str__(self) -> str:
         return f"{self.name}: {self.moves}"
 
 
+# (name, moves, description, category, difficulty, frequency)
+_ALG_SPECS: Tuple[Tuple[str, str, str, str, int, float], ...] = (
+    # OLL - Dot cases (simplified to use only basic moves)
+    ("OLL 1", "R U2 R2 F R F' U2 R' F R F'",
+     "Dot case - all edges flipped", "OLL", 3, 0.02),
+    ("OLL 2", "F R U R' U' F' R U R' U' R U R' U' F R U R' U' F'",
+     "Dot case - alternate (simplified)", "OLL", 4, 0.02),
+    
+    # OLL - Cross cases
+    ("OLL 21", "R U R' U R U' R' U R U2 R'",
+     "Cross case - H shape", "OLL", 2, 0.04),
+    ("OLL 22", "R U2 R2 U' R2 U' R2 U2 R",
+     "Cross case - Pi shape", "OLL", 2, 0.04),
+    
+    # OLL - Line cases
+    ("OLL 45", "F R U R' U' F'",
+     "Line case - simple", "OLL", 1, 0.08),
+    ("OLL 46", "R' U' R' F R F' U R",
+     "Line case - alternate", "OLL", 2, 0.08),
+    
+    # OLL - L cases (simplified)
+    ("OLL 47", "F' L' U' L U F",
+     "L shape case (simplified)", "OLL", 2, 0.04),
+    ("OLL 48", "F R U R' U' F'",
+     "L shape case - mirror (simplified)", "OLL", 2, 0.04),
+    
+    # OLL - T cases
+    ("OLL 33", "R U R' U' R' F R F'",
+     "T shape case", "OLL", 2, 0.04),
+    ("OLL 34", "R U R2 U' R' F R U R U' F'",
+     "T shape case - alternate", "OLL", 3, 0.04),
+    
+    # PLL - Adjacent corner swaps
+    ("T-Perm", "R U R' F' R U R' U' R' F R2 U' R'",
+     "T permutation - adjacent corners", "PLL", 2, 0.08),
+    ("J-Perm A", "R' U L' U2 R U' R' U2 R L U'",
+     "J permutation - adjacent corners", "PLL", 3, 0.08),
+    ("J-Perm B", "R U R' F' R U R' U' R' F R2 U' R'",
+     "J permutation - adjacent corners", "PLL", 3, 0.08),
+    
+    # PLL - Diagonal corner swaps
+    ("Y-Perm", "F R U' R' U' R U R' F' R U R' U' R' F R F'",
+     "Y permutation - diagonal corners", "PLL", 4, 0.04),
+    ("V-Perm", "R' U R' U' B' R' B2 U' R' U R' B R B",
+     "V permutation - diagonal corners (no rotation)", "PLL", 4, 0.04),
+    
+    # PLL - Edge cycles
+    ("U-Perm A", "R U' R U R U R U' R' U' R2",
+     "U permutation - 3-cycle edges", "PLL", 2, 0.08),
+    ("U-Perm B", "R2 U R U R' U' R' U' R' U R'",
+     "U permutation - 3-cycle edges", "PLL", 2, 0.08),
+    ("Z-Perm", "R' U' R U' R U R U' R' U R U R2 U' R'",
+     "Z permutation - opposite edge swap (simplified)", "PLL", 4, 0.04),
+    ("H-Perm", "R U R' U R U' R D R' U' R D' R' U2 R'",
+     "H permutation - opposite edge swap (simplified)", "PLL", 4, 0.04),
+    
+    # PLL - Corner + edge cycles
+    ("A-Perm A", "R' F R' B2 R F' R' B2 R2",
+     "A permutation - 3-cycle", "PLL", 2, 0.08),
+    ("A-Perm B", "R B' R F2 R' B R F2 R2",
+     "A permutation - 3-cycle", "PLL", 2, 0.08),
+    
+    # F2L - Basic cases
+    ("F2L-1", "R U' R'",
+     "Basic F2L - corner above slot, edge in place", "F2L", 1, 0.1),
+    ("F2L-2", "F R F'",
+     "Basic F2L - edge above slot, corner in place", "F2L", 1, 0.1),
+    ("F2L-3", "R U R' U' R U R'",
+     "Basic F2L - both pieces above", "F2L", 1, 0.05),
+    
+    # F2L - Common cases
+    ("F2L-27", "R U2 R' U' R U R'",
+     "F2L case 27 - corner and edge separated", "F2L", 2, 0.03),
+    ("F2L-32", "R U R' U2 R U' R'",
+     "F2L case 32 - edge flipped", "F2L", 2, 0.03),
+    ("F2L-37", "R U' R' U R U' R'",
+     "F2L case 37 - corner twisted", "F2L", 2, 0.03),
+    
+    # Common - Sexy move and variations
+    ("Sexy Move", "R U R' U'",
+     "Most common trigger sequence", "Common", 1, 1.0),
+    ("Sledgehammer", "R' F R F'",
+     "Another common trigger", "Common", 1, 0.8),
+    
+    # Common - Sune family
+    ("Sune", "R U R' U R U2 R'",
+     "Classic Sune sequence", "Common", 1, 0.6),
+    ("Anti-Sune", "R U2 R' U' R U' R'",
+     "Reverse Sune sequence", "Common", 1, 0.6),
+    
+    # Common - Niklas
+    ("Niklas", "R U' L' U R' U' L",
+     "Niklas commutator", "Common", 2, 0.3),
+    
+    # Common - 4-move triggers
+    ("Right Hand", "R U R' U'",
+     "Right hand trigger", "Trigger", 1, 1.0),
+    ("Left Hand", "L' U' L U",
+     "Left hand trigger", "Trigger", 1, 0.8),
+)
+
+# Search columns: lowercased names, lowercased descriptions, algorithms
+_SearchColumns = Tuple[List[str], List[str], List[Algorithm]]
+
+# Algorithm notation never changes, so parse it once at import. Algorithms
+# with identical notation (e.g. Sexy Move and Right Hand) share one sequence.
+_SHARED_SEQUENCES: Dict[str, MoveSequence] = {}
+_PARSED: Dict[str, MoveSequence] = {}
+for _name, _notation, *_ in _ALG_SPECS:
+    if _notation not in _SHARED_SEQUENCES:
+        _SHARED_SEQUENCES[_notation] = MoveSequence.parse(_notation)
+    _PARSED[_name] = _SHARED_SEQUENCES[_notation]
+del _name, _notation
+
+# 3x3 piece code tables of algorithms, by their notation snapshot
+_PERMUTATIONS: Dict[Tuple[str, ...], np.ndarray] = {}
+
+
 class AlgorithmDatabase:
-    """Database of common solving algorithms."""
+    """Database of common solving algorithms.
+    
+    The built-in algorithms are built once and shared by every instance.
+    An instance takes a private copy the first time a custom algorithm is
+    added, so ``algorithms`` must only be modified through
+    ``add_custom_algorithm``.
+    """
+    
+    _DEFAULT_DB: ClassVar[Optional[Dict[str, Dict[str, Algorithm]]]] = None
+    _DEFAULT_INDEX: ClassVar[Optional[Dict[Tuple[str, str], Algorithm]]] = None
+    _DEFAULT_SEARCH_INDEX: ClassVar[Optional[_SearchColumns]] = None
     
     def __init__(self):
         """Initialize the algorithm database."""
-        self.algorithms: Dict[str, Dict[str, Algorithm]] = {}
-        self._initialize_database()
+        if AlgorithmDatabase._DEFAULT_DB is None:
+            default_db = self._initialize_database()
+            AlgorithmDatabase._DEFAULT_INDEX = {
+                (cat, name): alg for cat, algs in default_db.items() for name, alg in algs.items()
+            }
+            AlgorithmDatabase._DEFAULT_SEARCH_INDEX = self._build_search_index(default_db)
+            AlgorithmDatabase._DEFAULT_DB = default_db
+        self.algorithms: Dict[str, Dict[str, Algorithm]] = AlgorithmDatabase._DEFAULT_DB
+        # Flat (category, name) index so lookups are a single dict probe
+        self._by_name: Dict[Tuple[str, str], Algorithm] = AlgorithmDatabase._DEFAULT_INDEX
+        self._search_index: _SearchColumns = AlgorithmDatabase._DEFAULT_SEARCH_INDEX
+        self._category_cache: Dict[str, Tuple[Algorithm, ...]] = {}
     
-    def _initialize_database(self) -> None:
-        """Initialize the database with common algorithms."""
-        # OLL (Orient Last Layer) algorithms
-        self._add_oll_algorithms()
-        
-        # PLL (Permute Last Layer) algorithms  
-        self._add_pll_algorithms()
+    @classmethod
+    def _initialize_database(cls) -> Dict[str, Dict[str, Algorithm]]:
+        """Build the shared database of common algorithms.
         
-        # F2L (First Two Layers) algorithms
-        self._add_f2l_algorithms()
-        
-        # Common sequences
-        self._add_common_sequences()
-    
-    def _add_oll_algorithms(self) -> None:
-        """Add OLL algorithms to the database."""
-        oll_algs = [
-            # Dot cases (simplified to use only basic moves)
-            Algorithm("OLL 1", MoveSequence.parse("R U2 R2 F R F' U2 R' F R F'"),
-                     "Dot case - all edges flipped", "OLL", 3, 0.02),
-            Algorithm("OLL 2", MoveSequence.parse("F R U R' U' F' R U R' U' R U R' U' F R U R' U' F'"),
-                     "Dot case - alternate (simplified)", "OLL", 4, 0.02),
-            
-            # Cross cases
-            Algorithm("OLL 21", MoveSequence.parse("R U R' U R U' R' U R U2 R'"),
-                     "Cross case - H shape", "OLL", 2, 0.04),
-            Algorithm("OLL 22", MoveSequence.parse("R U2 R2 U' R2 U' R2 U2 R"),
-                     "Cross case - Pi shape", "OLL", 2, 0.04),
-            
-            # Line cases  
-            Algorithm("OLL 45", MoveSequence.parse("F R U R' U' F'"),
-                     "Line case - simple", "OLL", 1, 0.08),
-            Algorithm("OLL 46", MoveSequence.parse("R' U' R' F R F' U R"),
-                     "Line case - alternate", "OLL", 2, 0.08),
-            
-            # L cases (simplified)
-            Algorithm("OLL 47", MoveSequence.parse("F' L' U' L U F"),
-                     "L shape case (simplified)", "OLL", 2, 0.04),
-            Algorithm("OLL 48", MoveSequence.parse("F R U R' U' F'"),
-                     "L shape case - mirror (simplified)", "OLL", 2, 0.04),
-            
-            # T cases
-            Algorithm("OLL 33", MoveSequence.parse("R U R' U' R' F R F'"),
-                     "T shape case", "OLL", 2, 0.04),
-            Algorithm("OLL 34", MoveSequence.parse("R U R2 U' R' F R U R U' F'"),
-                     "T shape case - alternate", "OLL", 3, 0.04),
-        ]
-        
-        self.algorithms["OLL"] = {alg.name: alg for alg in oll_algs}
-    
-    def _add_pll_algorithms(self) -> None:
-        """Add PLL algorithms to the database."""
-        pll_algs = [
-            # Adjacent corner swaps
-            Algorithm("T-Perm", MoveSequence.parse("R U R' F' R U R' U' R' F R2 U' R'"),
-                     "T permutation - adjacent corners", "PLL", 2, 0.08),
-            Algorithm("J-Perm A", MoveSequence.parse("R' U L' U2 R U' R' U2 R L U'"),
-                     "J permutation - adjacent corners", "PLL", 3, 0.08),
-            Algorithm("J-Perm B", MoveSequence.parse("R U R' F' R U R' U' R' F R2 U' R'"),
-                     "J permutation - adjacent corners", "PLL", 3, 0.08),
+        Returns
+        -------
+        Dict[str, Dict[str, Algorithm]]
+            Algorithms by section and name
+        """
+        return {
+            # OLL (Orient Last Layer) algorithms
+            "OLL": cls._build_algorithms("OLL"),
             
-            # Diagonal corner swaps
-            Algorithm("Y-Perm", MoveSequence.parse("F R U' R' U' R U R' F' R U R' U' R' F R F'"),
-                     "Y permutation - diagonal corners", "PLL", 4, 0.04),
-            Algorithm("V-Perm", MoveSequence.parse("R' U R' U' B' R' B2 U' R' U R' B R B"),
-                     "V permutation - diagonal corners (no rotation)", "PLL", 4, 0.04),
+            # PLL (Permute Last Layer) algorithms
+            "PLL": cls._build_algorithms("PLL"),
             
-            # Edge cycles
-            Algorithm("U-Perm A", MoveSequence.parse("R U' R U R U R U' R' U' R2"),
-                     "U permutation - 3-cycle edges", "PLL", 2, 0.08),
-            Algorithm("U-Perm B", MoveSequence.parse("R2 U R U R' U' R' U' R' U R'"),
-                     "U permutation - 3-cycle edges", "PLL", 2, 0.08),
-            Algorithm("Z-Perm", MoveSequence.parse("R' U' R U' R U R U' R' U R U R2 U' R'"),
-                     "Z permutation - opposite edge swap (simplified)", "PLL", 4, 0.04),
-            Algorithm("H-Perm", MoveSequence.parse("R U R' U R U' R D R' U' R D' R' U2 R'"),
-                     "H permutation - opposite edge swap (simplified)", "PLL", 4, 0.04),
+            # F2L (First Two Layers) algorithms
+            "F2L": cls._build_algorithms("F2L"),
             
-            # Corner + edge cycles
-            Algorithm("A-Perm A", MoveSequence.parse("R' F R' B2 R F' R' B2 R2"),
-                     "A permutation - 3-cycle", "PLL", 2, 0.08),
-            Algorithm("A-Perm B", MoveSequence.parse("R B' R F2 R' B R F2 R2"),
-                     "A permutation - 3-cycle", "PLL", 2, 0.08),
-        ]
+            # Common sequences and triggers
+            "Common": cls._build_algorithms("Common", "Trigger"),
+        }
+    
+    @staticmethod
+    def _build_search_index(
+            algorithms: Dict[str, Dict[str, Algorithm]]) -> _SearchColumns:
+        """Build the lowercased search columns, most frequent algorithms first.
         
-        self.algorithms["PLL"] = {alg.name: alg for alg in pll_algs}
-    
-    def _add_f2l_algorithms(self) -> None:
-        """Add F2L algorithms to the database."""
-        f2l_algs = [
-            # Basic F2L cases
-            Algorithm("F2L-1", MoveSequence.parse("R U' R'"),
-                     "Basic F2L - corner above slot, edge in place", "F2L", 1, 0.1),
-            Algorithm("F2L-2", MoveSequence.parse("F R F'"),
-                     "Basic F2L - edge above slot, corner in place", "F2L", 1, 0.1),
-            Algorithm("F2L-3", MoveSequence.parse("R U R' U' R U R'"),
-                     "Basic F2L - both pieces above", "F2L", 1, 0.05),
+        Parameters
+        ----------
+        algorithms : Dict[str, Dict[str, Algorithm]]
+            Algorithms by section and name
             
-            # Common F2L cases
-            Algorithm("F2L-27", MoveSequence.parse("R U2 R' U' R U R'"),
-                     "F2L case 27 - corner and edge separated", "F2L", 2, 0.03),
-            Algorithm("F2L-32", MoveSequence.parse("R U R' U2 R U' R'"),
-                     "F2L case 32 - edge flipped", "F2L", 2, 0.03),
-            Algorithm("F2L-37", MoveSequence.parse("R U' R' U R U' R'"),
-                     "F2L case 37 - corner twisted", "F2L", 2, 0.03),
-        ]
+        Returns
+        -------
+        _SearchColumns
+            Parallel lists of lowercased names, lowercased descriptions
+            and algorithms
+        """
+        algs = [alg for category_algs in algorithms.values() for alg in category_algs.values()]
+        # Stable, so equal frequencies keep database order
+        algs.sort(key=lambda alg: -alg.frequency)
+        return ([alg.name.lower() for alg in algs],
+                [alg.description.lower() for alg in algs],
+                algs)
+    
+    @staticmethod
+    def _build_algorithms(*categories: str) -> Dict[str, Algorithm]:
+        """Build algorithms for the given categories from the parsed specs.
         
-        self.algorithms["F2L"] = {alg.name: alg for alg in f2l_algs}
-    
-    def _add_common_sequences(self) -> None:
-        """Add common sequences and triggers."""
-        common_algs = [
-            # Sexy move and variations
-            Algorithm("Sexy Move", MoveSequence.parse("R U R' U'"),
-                     "Most common trigger sequence", "Common", 1, 1.0),
-            Algorithm("Sledgehammer", MoveSequence.parse("R' F R F'"),
-                     "Another common trigger", "Common", 1, 0.8),
-            
-            # Sune family
-            Algorithm("Sune", MoveSequence.parse("R U R' U R U2 R'"),
-                     "Classic Sune sequence", "Common", 1, 0.6),
-            Algorithm("Anti-Sune", MoveSequence.parse("R U2 R' U' R U' R'"),
-                     "Reverse Sune sequence", "Common", 1, 0.6),
-            
-            # Niklas
-            Algorithm("Niklas", MoveSequence.parse("R U' L' U R' U' L"),
-                     "Niklas commutator", "Common", 2, 0.3),
+        Parameters
+        ----------
+        *categories : str
+            Categories to include
             
-            # 4-move triggers
-            Algorithm("Right Hand", MoveSequence.parse("R U R' U'"),
-                     "Right hand trigger", "Trigger", 1, 1.0),
-            Algorithm("Left Hand", MoveSequence.parse("L' U' L U"),
-                     "Left hand trigger", "Trigger", 1, 0.8),
-        ]
-        
-        self.algorithms["Common"] = {alg.name: alg for alg in common_algs}
+        Returns
+        -------
+        Dict[str, Algorithm]
+            Algorithms keyed by name, in spec order
+        """
+        return {
+            name: Algorithm(name, _PARSED[name], description, category, difficulty, frequency)
+            for name, _, description, category, difficulty, frequency in _ALG_SPECS
+            if category in categories
+        }
     
     def get_algorithm(self, category: str, name: str) -> Optional[Algorithm]:
         """Get a specific algorithm by category and name.
@@ -179,9 +262,38 @@ class AlgorithmDatabase:
         Optional[Algorithm]
             Algorithm if found, None otherwise
         """
-        return self.algorithms.get(category, {}).get(name)
+        return self._by_name.get((category, name))
     
-    def get_algorithms_by_category(self, category: str) -> List[Algorithm]:
+    def get_algorithm_perm(self, category: str, name: str) -> Optional[np.ndarray]:
+        """Get a specific algorithm as one 3x3 piece code table.
+        
+        Applying the table with ``Cube.apply_permutation`` moves the pieces
+        as the whole algorithm does. Tables are built on first use and
+        shared by algorithms with the same moves.
+        
+        Parameters
+        ----------
+        category : str
+            Algorithm category (OLL, PLL, F2L, Common)
+        name : str
+            Algorithm name
+            
+        Returns
+        -------
+        Optional[np.ndarray]
+            Read-only table from ``MoveSequence.to_permutation`` if the
+            algorithm is found, None otherwise
+        """
+        alg = self._by_name.get((category, name))
+        if alg is None:
+            return None
+        table = _PERMUTATIONS.get(alg.notation_tuple)
+        if table is None:
+            table = MoveSequence.from_moves(alg.moves_tuple).to_permutation()
+            _PERMUTATIONS[alg.notation_tuple] = table
+        return table
+    
+    def get_algorithms_by_category(self, category: str) -> Tuple[Algorithm, ...]:
         """Get all algorithms in a category.
         
         Parameters
@@ -191,10 +303,15 @@ class AlgorithmDatabase:
             
         Returns
         -------
-        List[Algorithm]
-            List of algorithms in category
+        Tuple[Algorithm, ...]
+            Algorithms in category; cached, so repeated calls return the
+            same tuple until the category changes
         """
-        return list(self.algorithms.get(category, {}).values())
+        algs = self._category_cache.get(category)
+        if algs is None:
+            algs = tuple(self.algorithms.get(category, {}).values())
+            self._category_cache[category] = algs
+        return algs
     
     def search_algorithms(self, query: str) -> List[Algorithm]:
         """Search for algorithms by name or description.
@@ -209,16 +326,12 @@ class AlgorithmDatabase:
         List[Algorithm]
             Matching algorithms
         """
-        results = []
         query_lower = query.lower()
         
-        for category_algs in self.algorithms.values():
-            for alg in category_algs.values():
-                if (query_lower in alg.name.lower() or 
-                    query_lower in alg.description.lower()):
-                    results.append(alg)
-        
-        return sorted(results, key=lambda x: x.frequency, reverse=True)
+        # The index is presorted by frequency, so filtering keeps the order
+        names, descriptions, algs = self._search_index
+        return [algs[i] for i, name in enumerate(names)
+                if query_lower in name or query_lower in descriptions[i]]
     
     def get_all_categories(self) -> List[str]:
         """Get all available algorithm categories.
@@ -248,7 +361,14 @@ class AlgorithmDatabase:
         algorithm : Algorithm
             Algorithm to add
         """
+        if self.algorithms is AlgorithmDatabase._DEFAULT_DB:
+            self.algorithms = {cat: dict(algs) for cat, algs in self.algorithms.items()}
+            self._by_name = dict(self._by_name)
+        
         if algorithm.category not in self.algorithms:
             self.algorithms[algorithm.category] = {}
         
-        self.algorithms[algorithm.category][algorithm.name] = algorithm
\ No newline at end of file
+        self.algorithms[algorithm.category][algorithm.name] = algorithm
+        self._by_name[(algorithm.category, algorithm.name)] = algorithm
+        self._search_index = self._build_search_index(self.algorithms)
+        self._category_cache.pop(algorithm.category, None)
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Base classes for cube solving algorithms."""
 
+import sys
 from abc import ABC, abstractmethod
+from collections import Counter
+from itertools import chain
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from enum import Enum
@@ -9,6 +12,10 @@ from ..cube import Cube
 from ..cube.moves import MoveSequence
 
 
+# dataclass(slots=True) needs Python 3.10; older versions keep __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class SolutionPhase(Enum):
     """Phases of cube solving."""
     CROSS = "cross"
@@ -21,7 +28,12 @@ class SolutionPhase(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+# Phase labels precomputed per member to skip Enum attribute lookups
+_PHASE_VALUE: Dict[SolutionPhase, str] = {phase: phase.value for phase in SolutionPhase}
+_PHASE_UPPER: Dict[SolutionPhase, str] = {phase: phase.value.upper() for phase in SolutionPhase}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SolutionStep:
     """Represents a single step in the solving process."""
     phase: SolutionPhase
@@ -95,10 +107,7 @@ class BaseSolver(ABC):
             Complete solution sequence
         """
         steps = self.solve(cube)
-        all_moves = []
-        for step in steps:
-            all_moves.extend(step.moves)
-        return MoveSequence(all_moves)
+        return MoveSequence(list(chain.from_iterable(step.moves for step in steps)))
     
     def get_solution_summary(self) -> Dict[str, Any]:
         """Get summary statistics for the last solution.
@@ -111,20 +120,17 @@ class BaseSolver(ABC):
         if not self.solution_steps:
             return {}
         
-        phase_counts = {}
+        phase_counts: Counter = Counter()
         for step in self.solution_steps:
-            phase = step.phase.value
-            if phase not in phase_counts:
-                phase_counts[phase] = 0
-            phase_counts[phase] += len(step.moves)
+            phase_counts[_PHASE_VALUE[step.phase]] += len(step.moves)
         
         return {
             'solver': self.name,
             'total_steps': len(self.solution_steps),
             'total_moves': self.total_moves,
             'solve_time': self.solve_time,
-            'moves_per_second': self.total_moves / max(self.solve_time, 0.001),
-            'phase_breakdown': phase_counts,
+            'moves_per_second': self.total_moves / (self.solve_time or 0.001),
+            'phase_breakdown': dict(phase_counts),
             'average_moves_per_step': self.total_moves / len(self.solution_steps)
         }
     
@@ -139,24 +145,26 @@ class BaseSolver(ABC):
         if not self.solution_steps:
             return f"No solution found using {self.name}"
         
-        explanation = [f"{self.name} Solution ({self.total_moves} moves):"]
-        explanation.append("=" * 50)
-        
-        for i, step in enumerate(self.solution_steps, 1):
-            explanation.append(f"\nStep {i}: {step.description}")
-            explanation.append(f"Phase: {step.phase.value.upper()}")
-            explanation.append(f"Moves: {step.moves}")
-            explanation.append(f"Explanation: {step.explanation}")
+        def _lines():
+            yield f"{self.name} Solution ({self.total_moves} moves):"
+            yield "=" * 50
             
-            if step.efficiency_score:
-                explanation.append(f"Efficiency: {step.efficiency_score:.2f}/5.0")
-        
-        explanation.append(f"\nTotal moves: {self.total_moves}")
-        if self.solve_time > 0:
-            explanation.append(f"Solve time: {self.solve_time:.3f}s")
-            explanation.append(f"Speed: {self.total_moves/self.solve_time:.1f} moves/second")
+            # One formatted block per step instead of one line at a time
+            for i, step in enumerate(self.solution_steps, 1):
+                block = (f"\nStep {i}: {step.description}\n"
+                         f"Phase: {_PHASE_UPPER[step.phase]}\n"
+                         f"Moves: {step.moves}\n"
+                         f"Explanation: {step.explanation}")
+                if step.efficiency_score:
+                    block += f"\nEfficiency: {step.efficiency_score:.2f}/5.0"
+                yield block
+            
+            yield f"\nTotal moves: {self.total_moves}"
+            if self.solve_time > 0:
+                yield f"Solve time: {self.solve_time:.3f}s"
+                yield f"Speed: {self.total_moves/self.solve_time:.1f} moves/second"
         
-        return "\n".join(explanation)
+        return "\n".join(_lines())
     
     def _create_step(self, phase: SolutionPhase, description: str, 
                     moves: MoveSequence, explanation: str) -> SolutionStep:
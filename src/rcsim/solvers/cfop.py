@@ -1,14 +1,303 @@
 """CFOP (Cross, F2L, OLL, PLL) solver implementation."""
 
 import time
-from typing import List, Optional, Tuple
-from copy import deepcopy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-from .base import BaseSolver, SolutionStep, SolutionPhase
+import numpy as np
+
+from .base import _SLOTS, BaseSolver, SolutionStep, SolutionPhase
 from .algorithms import AlgorithmDatabase
-from ..cube import Cube
+from ..cube import Cube, CubePool
 from ..cube.moves import MoveSequence, Move
-from ..cube.state import Position, StandardColors
+from ..cube.codes import NUM_CODES, ORIENTATIONS, POSITIONS, move_table, piece_code
+from ..cube.state import COLOR_IDS, PACKED_FACE_ORDER, Color, CubeState, Position, StandardColors
+
+try:
+    from numba import njit
+except ImportError:  # numba not installed, the cross search stays on NumPy
+    njit = None
+
+
+# Parsed face turns, so solving never re-parses notation
+_MOVE_CACHE = {
+    f"{face}{suffix}": Move.parse(f"{face}{suffix}")
+    for face in "URFDLB" for suffix in ("", "'", "2")
+}
+
+# Candidate moves tried by the cross search, in preference order
+_CROSS_CANDIDATES = ("F", "R", "U", "L", "B", "D", "F'", "R'", "U'", "L'", "B'", "D'")
+
+# Face cells (row, col) of the four edge stickers; cell (row, col) of the
+# D face of a 3x3 is the sticker of the piece at Position(col - 1, -1, 1 - row)
+_CROSS_EDGE_CELLS = ((0, 1), (1, 0), (1, 2), (2, 1))
+
+_WHITE_ID = COLOR_IDS[StandardColors.WHITE]
+_YELLOW_ID = COLOR_IDS[StandardColors.YELLOW]
+
+# Bit layout of CubeState.get_packed_face for a 3x3: sticker (row, col)
+# occupies the 3 bits at 3 * (row * 3 + col)
+_CROSS_EDGE_SHIFTS = tuple(3 * (row * 3 + col) for row, col in _CROSS_EDGE_CELLS)
+_CROSS_MASK = sum(7 << shift for shift in _CROSS_EDGE_SHIFTS)
+_CROSS_WHITE = sum(_WHITE_ID << shift for shift in _CROSS_EDGE_SHIFTS)
+_CROSS_YELLOW = sum(_YELLOW_ID << shift for shift in _CROSS_EDGE_SHIFTS)
+_CROSS_LOW_BITS = sum(1 << shift for shift in _CROSS_EDGE_SHIFTS)  # lowest bit of each cell
+_REPEAT_9 = sum(1 << (3 * i) for i in range(9))  # one color id in all 9 cells
+_REPEAT_6 = sum(1 << (3 * i) for i in range(6))  # ... in the bottom two rows
+_FACE_WHITE = _WHITE_ID * _REPEAT_9
+_FACE_YELLOW = _YELLOW_ID * _REPEAT_9
+_CENTER_SHIFT = 3 * 4
+_FACE_MASK = (1 << 27) - 1
+# Shift of each face within Cube.packed_state
+_FACE_SHIFTS = {face: 27 * i for i, face in enumerate(PACKED_FACE_ORDER)}
+
+# Side faces read by PLL recognition
+_PLL_SIDES = ('F', 'R', 'B', 'L')
+
+# Faces checked by _is_f2l_complete, most likely to fail first: over
+# scrambled solves the D check fails on every call made during F2L
+_F2L_FACES = ('D', 'F', 'R', 'B', 'L')
+
+# Candidates that move at least one cross edge piece. The others (U, U')
+# leave every D sticker in place, so they can never improve the cross.
+_CROSS_AFFECTING = frozenset(
+    move_str for move_str in _CROSS_CANDIDATES
+    if any(_MOVE_CACHE[move_str].affects_position(Position(col - 1, -1, 1 - row), 3)
+           for row, col in _CROSS_EDGE_CELLS)
+)
+
+
+# Original faces in the bit order of the white-face masks below
+_PIECE_FACES = "URFDLB"
+
+
+# Moves tried by the cross search and their code tables, in preference order
+_CROSS_SEARCH_MOVES = tuple(
+    _MOVE_CACHE[move_str] for move_str in _CROSS_CANDIDATES if move_str in _CROSS_AFFECTING
+)
+_CROSS_TRANSITIONS = np.stack([move_table(move) for move in _CROSS_SEARCH_MOVES])
+_U_TRANSITION = move_table(_MOVE_CACHE["U"])
+
+
+def _cross_white_table() -> np.ndarray:
+    """Build the table of which piece codes show white on a D cross cell.
+    
+    ``CubeState.get_face_colors`` reads a cell as white when the piece's
+    white sticker faces D, or when the original face now facing D has no
+    sticker at all. Which original faces count depends on the piece, so
+    rows are indexed by a 6-bit mask over ``_PIECE_FACES`` of such faces.
+    
+    Returns
+    -------
+    np.ndarray
+        (64, positions * orientations) uint8 array, 1 where the cell is white
+    """
+    on_cross = np.array([
+        position in {Position(col - 1.0, -1.0, 1.0 - row) for row, col in _CROSS_EDGE_CELLS}
+        for position in POSITIONS
+    ])
+    down_face = np.array([
+        next(_PIECE_FACES.index(k) for k, v in o.get_face_mapping().items() if v == 'D')
+        for o in ORIENTATIONS
+    ])
+    shows = (np.arange(64)[:, None] >> down_face[None, :]) & 1
+    return (shows[:, None, :] * on_cross[None, :, None]).reshape(64, NUM_CODES).astype(np.uint8)
+
+
+_CROSS_WHITE_BY_MASK = _cross_white_table()
+
+
+def _white_face_mask(colors: Dict[str, Color]) -> int:
+    """Get the row of ``_CROSS_WHITE_BY_MASK`` for a piece's stickers.
+    
+    Parameters
+    ----------
+    colors : Dict[str, Color]
+        Stickers of the piece by original face
+        
+    Returns
+    -------
+    int
+        Bit i set if original face ``_PIECE_FACES[i]`` reads white on D
+    """
+    white = StandardColors.WHITE
+    return sum(1 << i for i, face in enumerate(_PIECE_FACES) if colors.get(face, white) == white)
+
+
+# Only edge pieces ever sit on a cross cell, so the search tracks just the
+# 12 edges. Stickers are fixed per solved position, and so are their masks.
+_EDGE_WHITE_MASKS = {
+    cubie.original_position: _white_face_mask(cubie.colors)
+    for cubie in CubeState(3).cubies if cubie.piece_type == 'edge'
+}
+
+
+def _edge_codes(cube: Cube) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode the edge pieces of a 3x3 as codes and white-face masks.
+    
+    Parameters
+    ----------
+    cube : Cube
+        Cube to encode
+        
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Edge codes, and row indices into ``_CROSS_WHITE_BY_MASK``
+    """
+    codes = []
+    masks = []
+    for cubie in cube.state.cubies:
+        if cubie.piece_type == 'edge':
+            codes.append(piece_code(cubie))
+            masks.append(_EDGE_WHITE_MASKS[cubie.original_position])
+    return np.array(codes, dtype=np.uint16), np.array(masks, dtype=np.uint8)
+
+
+def _cross_search_loops(codes: np.ndarray, masks: np.ndarray, transitions: np.ndarray,
+                        u_transition: np.ndarray, white: np.ndarray,
+                        max_moves: int, solved: int) -> np.ndarray:
+    """Run the cross hill-climb as plain loops, for compilation with numba.
+    
+    Mirrors the NumPy search in ``_cross_search`` step for step.
+    
+    Parameters
+    ----------
+    codes, masks : np.ndarray
+        Edge codes and white-face masks from ``_edge_codes``
+    transitions : np.ndarray
+        Code tables of the candidate moves
+    u_transition : np.ndarray
+        Code table of the fallback U turn
+    white : np.ndarray
+        ``_CROSS_WHITE_BY_MASK``
+    max_moves : int
+        Maximum number of moves to search
+    solved : int
+        Number of white cross cells when the cross is solved
+        
+    Returns
+    -------
+    np.ndarray
+        Indices into the candidate moves, -1 for the fallback U turn
+    """
+    codes = codes.copy()
+    steps = np.empty(max_moves, dtype=np.int64)
+    n = 0
+    while n < max_moves:
+        current = 0
+        for i in range(codes.shape[0]):
+            current += white[masks[i], codes[i]]
+        if current == solved:
+            break
+        
+        chosen = -1
+        for k in range(transitions.shape[0]):
+            score = 0
+            for i in range(codes.shape[0]):
+                score += white[masks[i], transitions[k, codes[i]]]
+            if score > current:
+                chosen = k
+                break
+        
+        table = u_transition if chosen < 0 else transitions[chosen]
+        for i in range(codes.shape[0]):
+            codes[i] = table[codes[i]]
+        steps[n] = chosen
+        n += 1
+    return steps[:n]
+
+
+_cross_search_native = njit(cache=True)(_cross_search_loops) if njit is not None else None
+
+
+def _cross_search(codes: np.ndarray, masks: np.ndarray, max_moves: int) -> List[int]:
+    """Hill-climb the cross on edge codes, taking the first improving move.
+    
+    Parameters
+    ----------
+    codes, masks : np.ndarray
+        Edge codes and white-face masks from ``_edge_codes``
+    max_moves : int
+        Maximum number of moves to search
+        
+    Returns
+    -------
+    List[int]
+        Indices into ``_CROSS_SEARCH_MOVES``, -1 for the fallback U turn
+    """
+    solved = len(_CROSS_EDGE_CELLS)
+    if _cross_search_native is not None:
+        return _cross_search_native(codes, masks, _CROSS_TRANSITIONS, _U_TRANSITION,
+                                    _CROSS_WHITE_BY_MASK, max_moves, solved).tolist()
+    
+    steps = []
+    for _ in range(max_moves):
+        current = _CROSS_WHITE_BY_MASK[masks, codes].sum()
+        if current == solved:
+            break
+        
+        # Every candidate is scored in one lookup
+        next_codes = _CROSS_TRANSITIONS[:, codes]
+        scores = _CROSS_WHITE_BY_MASK[masks, next_codes].sum(axis=1)
+        better = np.flatnonzero(scores > current)
+        if better.size:
+            steps.append(int(better[0]))
+            codes = next_codes[better[0]]
+        else:
+            steps.append(-1)
+            codes = _U_TRANSITION[codes]
+    return steps
+
+
+def _face_bits(cube: Cube, face: str) -> int:
+    """Get a face as cached packed color ids.
+    
+    Parameters
+    ----------
+    cube : Cube
+        Cube to read
+    face : str
+        Face name ('U', 'D', 'L', 'R', 'F', 'B')
+        
+    Returns
+    -------
+    int
+        Face packed 3 bits per sticker, see ``CubeState.get_packed_face``
+    """
+    return (cube.packed_state >> _FACE_SHIFTS[face]) & _FACE_MASK
+
+
+def _f2l_face_done(face: str, bits: int) -> bool:
+    """Check one face of the F2L condition on its packed colors.
+    
+    Parameters
+    ----------
+    face : str
+        'D' or a side face
+    bits : int
+        Face packed 3 bits per sticker
+        
+    Returns
+    -------
+    bool
+        True if D is all white, or a side's bottom two rows match its center
+    """
+    if face == 'D':
+        return bits == _FACE_WHITE
+    center = (bits >> _CENTER_SHIFT) & 7
+    return bits >> 9 == center * _REPEAT_6
+
+
+@dataclass(**_SLOTS)
+class _SolveState:
+    """What the phases of one solve found out about the work cube.
+    
+    ``None`` means not checked; a phase records what it learned so the next
+    one does not have to rebuild faces to find out again.
+    """
+    cross_solved: Optional[bool] = None
+    cube_solved: Optional[bool] = None
 
 
 class CFOPSolver(BaseSolver):
@@ -25,6 +314,33 @@ class CFOPSolver(BaseSolver):
         """Initialize the CFOP solver."""
         super().__init__("CFOP (Cross, F2L, OLL, PLL)")
         self.algorithm_db = AlgorithmDatabase()
+        
+        # Case -> algorithm tables, resolved once instead of on every lookup
+        db = self.algorithm_db
+        self._oll_algs = {
+            "Cross": db.get_algorithm("OLL", "OLL 21"),
+            "Line": db.get_algorithm("OLL", "OLL 45"),
+            "Dot": db.get_algorithm("OLL", "OLL 1"),
+        }
+        self._pll_algs = {
+            "T-Perm": db.get_algorithm("PLL", "T-Perm"),
+            "A-Perm": db.get_algorithm("PLL", "A-Perm A"),
+            "U-Perm": db.get_algorithm("PLL", "U-Perm A"),
+            "H-Perm": db.get_algorithm("PLL", "H-Perm"),
+        }
+        self._f2l_algs = [db.get_algorithm("F2L", f"F2L-{i}") for i in (1, 2, 3)]
+        
+        # 2-look fallbacks as flat move tuples; a Sune round ends with a U turn
+        cross_alg = db.get_algorithm("OLL", "OLL 45")
+        sune = db.get_algorithm("Common", "Sune")
+        self._yellow_cross_moves = cross_alg.moves_tuple if cross_alg else ()
+        self._sune_round = sune.moves_tuple + (_MOVE_CACHE["U"],) if sune else ()
+        self._two_look_pll_moves = tuple(
+            alg.moves_tuple for alg in (self._pll_algs["T-Perm"], self._pll_algs["A-Perm"]) if alg
+        )
+        
+        # Work cubes kept between solves and reset in place
+        self._scratch_pool = CubePool()
     
     def can_solve(self, cube: Cube) -> bool:
         """Check if this solver can solve the given cube.
@@ -61,16 +377,34 @@ class CFOPSolver(BaseSolver):
         start_time = time.time()
         
         # Work on a copy so we don't modify the original
-        work_cube = cube.clone()
+        work_cube = self._scratch_pool.get(cube)
+        try:
+            self._solve_phases(work_cube)
+        finally:
+            self._scratch_pool.recycle(work_cube)
+        
+        self.solve_time = time.time() - start_time
+        
+        return self.solution_steps
+    
+    def _solve_phases(self, work_cube: Cube) -> None:
+        """Run the four CFOP phases on a work cube, recording the steps.
+        
+        Parameters
+        ----------
+        work_cube : Cube
+            Cube to solve in place
+        """
+        state = _SolveState()
         
         # Step 1: Cross
-        step1 = self._solve_cross(work_cube)
+        step1 = self._solve_cross(work_cube, state)
         if step1:
             self.solution_steps.append(step1)
             self.total_moves += len(step1.moves)
         
         # Step 2: F2L (First Two Layers)
-        step2 = self._solve_f2l(work_cube)
+        step2 = self._solve_f2l(work_cube, state)
         if step2:
             self.solution_steps.append(step2)
             self.total_moves += len(step2.moves)
@@ -82,22 +416,20 @@ class CFOPSolver(BaseSolver):
             self.total_moves += len(step3.moves)
         
         # Step 4: PLL (Permute Last Layer)
-        step4 = self._solve_pll(work_cube)
+        step4 = self._solve_pll(work_cube, state)
         if step4:
             self.solution_steps.append(step4)
             self.total_moves += len(step4.moves)
-        
-        self.solve_time = time.time() - start_time
-        
-        return self.solution_steps
     
-    def _solve_cross(self, cube: Cube) -> Optional[SolutionStep]:
+    def _solve_cross(self, cube: Cube, state: Optional[_SolveState] = None) -> Optional[SolutionStep]:
         """Solve the cross on the bottom face.
         
         Parameters
         ----------
         cube : Cube
             Cube to work on
+        state : _SolveState, optional
+            Records whether the cross is solved afterwards
             
         Returns
         -------
@@ -108,15 +440,22 @@ class CFOPSolver(BaseSolver):
         
         # Check if cross is already solved
         if self._is_cross_solved(cube):
+            if state is not None:
+                state.cross_solved = True
             return None
         
         # Advanced cross solving with inspection
         # This is a simplified implementation
         cross_moves = self._find_cross_solution(cube)
         
-        for move_str in cross_moves:
-            cube.apply_move(move_str)
-            moves.append(Move.parse(move_str))
+        for move in cross_moves:
+            cube.apply_move(move)
+            moves.append(move)
+        
+        if state is not None:
+            # Edge codes are cheaper to read than the D face
+            codes, masks = _edge_codes(cube)
+            state.cross_solved = bool(_CROSS_WHITE_BY_MASK[masks, codes].sum() == len(_CROSS_EDGE_CELLS))
         
         if not moves:
             return None
@@ -128,13 +467,15 @@ class CFOPSolver(BaseSolver):
             "Efficiently solve the bottom cross with look-ahead and planning"
         )
     
-    def _solve_f2l(self, cube: Cube) -> Optional[SolutionStep]:
+    def _solve_f2l(self, cube: Cube, state: Optional[_SolveState] = None) -> Optional[SolutionStep]:
         """Solve F2L (First Two Layers).
         
         Parameters
         ----------
         cube : Cube
             Cube to work on
+        state : _SolveState, optional
+            What the cross phase found out
             
         Returns
         -------
@@ -143,19 +484,21 @@ class CFOPSolver(BaseSolver):
         """
         moves = []
         
-        # Check if F2L is already complete
-        if self._is_f2l_complete(cube):
+        # Check if F2L is already complete; it includes the cross, so an
+        # unsolved cross rules it out without building the D face
+        cross_unsolved = state is not None and state.cross_solved is False
+        if not cross_unsolved and self._is_f2l_complete(cube):
             return None
         
-        # Solve each F2L pair
+        # Solve each F2L pair; the first one starts from the checked state
         for pair_num in range(4):
-            if self._is_f2l_complete(cube):
+            if pair_num and self._is_f2l_complete(cube):
                 break
             
             pair_moves = self._solve_f2l_pair(cube, pair_num)
-            for move_str in pair_moves:
-                cube.apply_move(move_str)
-                moves.append(Move.parse(move_str))
+            for move in pair_moves:
+                cube.apply_move(move)
+                moves.append(move)
         
         if not moves:
             return None
@@ -191,9 +534,9 @@ class CFOPSolver(BaseSolver):
         oll_algorithm = self._get_oll_algorithm(oll_case)
         
         if oll_algorithm:
-            for move in oll_algorithm.moves:
+            for move in oll_algorithm.moves_tuple:
                 cube.apply_move(move)
-                moves.append(move)
+            moves.extend(oll_algorithm.moves_tuple)
         else:
             # Fallback to 2-look OLL
             moves.extend(self._two_look_oll(cube))
@@ -208,13 +551,15 @@ class CFOPSolver(BaseSolver):
             "Orient all last layer pieces to make the top face one solid color"
         )
     
-    def _solve_pll(self, cube: Cube) -> Optional[SolutionStep]:
+    def _solve_pll(self, cube: Cube, state: Optional[_SolveState] = None) -> Optional[SolutionStep]:
         """Solve PLL (Permute Last Layer).
         
         Parameters
         ----------
         cube : Cube
             Cube to work on
+        state : _SolveState, optional
+            Records whether the cube was solved for case recognition
             
         Returns
         -------
@@ -226,15 +571,18 @@ class CFOPSolver(BaseSolver):
         # Check if already solved
         if cube.is_solved():
             return None
+        if state is None:
+            state = _SolveState()
+        state.cube_solved = False
         
         # Recognize PLL case and apply appropriate algorithm
-        pll_case = self._recognize_pll_case(cube)
+        pll_case = self._recognize_pll_case(cube, state)
         pll_algorithm = self._get_pll_algorithm(pll_case)
         
         if pll_algorithm:
-            for move in pll_algorithm.moves:
+            for move in pll_algorithm.moves_tuple:
                 cube.apply_move(move)
-                moves.append(move)
+            moves.extend(pll_algorithm.moves_tuple)
         else:
             # Fallback to 2-look PLL
             moves.extend(self._two_look_pll(cube))
@@ -249,7 +597,7 @@ class CFOPSolver(BaseSolver):
             "Position all last layer pieces correctly to complete the solve"
         )
     
-    def _find_cross_solution(self, cube: Cube) -> List[str]:
+    def _find_cross_solution(self, cube: Cube) -> List[Move]:
         """Find an efficient cross solution.
         
         Parameters
@@ -259,36 +607,24 @@ class CFOPSolver(BaseSolver):
             
         Returns
         -------
-        List[str]
+        List[Move]
             List of moves for cross solution
         """
         # This is a simplified cross solver
         # A real implementation would use advanced algorithms
         moves = []
         
-        for i in range(15):  # Max moves for cross
-            if self._is_cross_solved(cube):
-                break
-            
-            # Try common cross moves
-            candidates = ["F", "R", "U", "L", "B", "D", "F'", "R'", "U'", "L'", "B'", "D'"]
-            
-            # Simple heuristic: try moves that affect cross edges
-            for move_str in candidates:
-                test_cube = cube.clone()
-                test_cube.apply_move(move_str)
-                if self._count_cross_edges_correct(test_cube) > self._count_cross_edges_correct(cube):
-                    moves.append(move_str)
-                    cube.apply_move(move_str)
-                    break
-            else:
-                # If no improvement found, try a random move
-                moves.append("U")
-                cube.apply_move("U")
+        # Simple heuristic: take the first move that improves the cross,
+        # searched on edge codes; if none does, try a random move
+        codes, masks = _edge_codes(cube)
+        for step in _cross_search(codes, masks, 15):  # Max moves for cross
+            move = _CROSS_SEARCH_MOVES[step] if step >= 0 else _MOVE_CACHE["U"]
+            cube.apply_move(move)
+            moves.append(move)
         
         return moves
     
-    def _solve_f2l_pair(self, cube: Cube, pair_num: int) -> List[str]:
+    def _solve_f2l_pair(self, cube: Cube, pair_num: int) -> List[Move]:
         """Solve a single F2L pair.
         
         Parameters
@@ -300,25 +636,18 @@ class CFOPSolver(BaseSolver):
             
         Returns
         -------
-        List[str]
+        List[Move]
             Moves to solve this pair
         """
         # Simplified F2L pair solving
         moves = []
         
-        # Use basic F2L algorithms from database
-        f2l_algs = [
-            self.algorithm_db.get_algorithm("F2L", "F2L-1"),
-            self.algorithm_db.get_algorithm("F2L", "F2L-2"),
-            self.algorithm_db.get_algorithm("F2L", "F2L-3"),
-        ]
-        
-        # Try different F2L algorithms
-        for alg in f2l_algs:
+        # Try the basic F2L algorithms from the database
+        for alg in self._f2l_algs:
             if alg:
-                for move in alg.moves:
-                    moves.append(str(move))
+                for move in alg.moves_tuple:
                     cube.apply_move(move)
+                moves.extend(alg.moves_tuple)
                 break
         
         return moves
@@ -339,29 +668,22 @@ class CFOPSolver(BaseSolver):
         moves = []
         
         # First: Make yellow cross
-        if not self._is_yellow_cross_formed(cube):
-            cross_alg = self.algorithm_db.get_algorithm("OLL", "OLL 45")
-            if cross_alg:
-                for i in range(3):  # Max 3 applications
-                    if self._is_yellow_cross_formed(cube):
-                        break
-                    for move in cross_alg.moves:
-                        cube.apply_move(move)
-                        moves.append(move)
-        
-        # Second: Orient corners
-        if not self._is_oll_solved(cube):
-            sune = self.algorithm_db.get_algorithm("Common", "Sune")
-            if sune:
-                for i in range(6):  # Max 6 applications
-                    if self._is_oll_solved(cube):
-                        break
-                    for move in sune.moves:
-                        cube.apply_move(move)
-                        moves.append(move)
-                    # Rotate to try different positions
-                    cube.apply_move("U")
-                    moves.append(Move.parse("U"))
+        if not self._is_yellow_cross_formed(cube) and self._yellow_cross_moves:
+            for i in range(3):  # Max 3 applications
+                if self._is_yellow_cross_formed(cube):
+                    break
+                for move in self._yellow_cross_moves:
+                    cube.apply_move(move)
+                moves.extend(self._yellow_cross_moves)
+        
+        # Second: Orient corners, rotating to try different positions
+        if not self._is_oll_solved(cube) and self._sune_round:
+            for i in range(6):  # Max 6 applications
+                if self._is_oll_solved(cube):
+                    break
+                for move in self._sune_round:
+                    cube.apply_move(move)
+                moves.extend(self._sune_round)
         
         return moves
     
@@ -381,28 +703,21 @@ class CFOPSolver(BaseSolver):
         moves = []
         
         # Use T-Perm and A-Perm for 2-look PLL
-        t_perm = self.algorithm_db.get_algorithm("PLL", "T-Perm")
-        a_perm = self.algorithm_db.get_algorithm("PLL", "A-Perm A")
-        
-        # Try different PLL algorithms
-        for alg in [t_perm, a_perm]:
-            if not alg:
-                continue
-            
+        for alg_moves in self._two_look_pll_moves:
             for i in range(4):  # Try 4 orientations
                 if cube.is_solved():
                     break
                 
-                for move in alg.moves:
+                for move in alg_moves:
                     cube.apply_move(move)
-                    moves.append(move)
+                moves.extend(alg_moves)
                 
                 if cube.is_solved():
                     break
                 
                 # Rotate top face
-                cube.apply_move("U")
-                moves.append(Move.parse("U"))
+                cube.apply_move(_MOVE_CACHE["U"])
+                moves.append(_MOVE_CACHE["U"])
         
         return moves
     
@@ -419,12 +734,8 @@ class CFOPSolver(BaseSolver):
         str
             OLL case identifier
         """
-        # Simplified OLL recognition
-        top_face = cube.get_face_colors('U')
-        yellow_color = StandardColors.YELLOW
-        
-        # Count yellow pieces on top
-        yellow_count = sum(1 for row in top_face for color in row if color == yellow_color)
+        # Simplified OLL recognition: count yellow pieces on top
+        yellow_count = np.count_nonzero(cube.u_face == _YELLOW_ID)
         
         if yellow_count == 9:
             return "Skip"
@@ -435,13 +746,15 @@ class CFOPSolver(BaseSolver):
         else:  # Dot
             return "Dot"
     
-    def _recognize_pll_case(self, cube: Cube) -> str:
+    def _recognize_pll_case(self, cube: Cube, state: Optional[_SolveState] = None) -> str:
         """Recognize the current PLL case.
         
         Parameters
         ----------
         cube : Cube
             Cube to analyze
+        state : _SolveState, optional
+            Whether the cube is already known to be solved
             
         Returns
         -------
@@ -449,20 +762,15 @@ class CFOPSolver(BaseSolver):
             PLL case identifier
         """
         # Simplified PLL recognition
-        if cube.is_solved():
+        solved = state.cube_solved if state is not None else None
+        if solved is None:
+            solved = cube.is_solved()
+        if solved:
             return "Skip"
         
-        # Count solved sides
-        sides = ['F', 'R', 'B', 'L']
-        solved_sides = 0
-        
-        for side in sides:
-            face_colors = cube.get_face_colors(side)
-            center_color = face_colors[1][1]
-            
-            # Check if top row matches center
-            if all(face_colors[0][i] == center_color for i in range(3)):
-                solved_sides += 1
+        # Count solved sides: top row (columns 0-2) matching the center (column 3)
+        rows = np.array([cube.get_top_row(side) for side in _PLL_SIDES])
+        solved_sides = int((rows[:, :3] == rows[:, 3:]).all(axis=1).sum())
         
         if solved_sides == 0:
             return "H-Perm"
@@ -486,12 +794,7 @@ class CFOPSolver(BaseSolver):
         Algorithm or None
             Algorithm for the case
         """
-        case_map = {
-            "Cross": self.algorithm_db.get_algorithm("OLL", "OLL 21"),
-            "Line": self.algorithm_db.get_algorithm("OLL", "OLL 45"),
-            "Dot": self.algorithm_db.get_algorithm("OLL", "OLL 1"),
-        }
-        return case_map.get(case)
+        return self._oll_algs.get(case)
     
     def _get_pll_algorithm(self, case: str):
         """Get PLL algorithm for a case.
@@ -506,61 +809,32 @@ class CFOPSolver(BaseSolver):
         Algorithm or None
             Algorithm for the case
         """
-        case_map = {
-            "T-Perm": self.algorithm_db.get_algorithm("PLL", "T-Perm"),
-            "A-Perm": self.algorithm_db.get_algorithm("PLL", "A-Perm A"),
-            "U-Perm": self.algorithm_db.get_algorithm("PLL", "U-Perm A"),
-            "H-Perm": self.algorithm_db.get_algorithm("PLL", "H-Perm"),
-        }
-        return case_map.get(case)
+        return self._pll_algs.get(case)
     
     # Helper methods (reuse from LayerByLayerSolver with similar logic)
     def _is_cross_solved(self, cube: Cube) -> bool:
         """Check if cross is solved."""
-        bottom_face = cube.get_face_colors('D')
-        white_color = StandardColors.WHITE
-        edge_positions = [(0, 1), (1, 0), (1, 2), (2, 1)]
-        return all(bottom_face[row][col] == white_color for row, col in edge_positions)
+        return _face_bits(cube, 'D') & _CROSS_MASK == _CROSS_WHITE
     
     def _is_f2l_complete(self, cube: Cube) -> bool:
         """Check if F2L is complete."""
-        # Check if first two layers are solved
-        bottom_face = cube.get_face_colors('D')
-        white_color = StandardColors.WHITE
-        
-        # Bottom must be all white
-        if not all(color == white_color for row in bottom_face for color in row):
-            return False
-        
-        # Middle layer must match centers
-        for face in ['F', 'R', 'B', 'L']:
-            face_colors = cube.get_face_colors(face)
-            center_color = face_colors[1][1]
-            
-            # Check bottom two rows
-            for row in [1, 2]:
-                for col in range(3):
-                    if face_colors[row][col] != center_color:
-                        return False
-        
+        # Faces are only built when reached, so stop at the first failure
+        for face in _F2L_FACES:
+            if not _f2l_face_done(face, _face_bits(cube, face)):
+                return False
         return True
     
     def _is_oll_solved(self, cube: Cube) -> bool:
         """Check if OLL is solved."""
-        top_face = cube.get_face_colors('U')
-        yellow_color = StandardColors.YELLOW
-        return all(color == yellow_color for row in top_face for color in row)
+        return _face_bits(cube, 'U') == _FACE_YELLOW
     
     def _is_yellow_cross_formed(self, cube: Cube) -> bool:
         """Check if yellow cross is formed."""
-        top_face = cube.get_face_colors('U')
-        yellow_color = StandardColors.YELLOW
-        edge_positions = [(0, 1), (1, 0), (1, 2), (2, 1)]
-        return all(top_face[row][col] == yellow_color for row, col in edge_positions)
+        return _face_bits(cube, 'U') & _CROSS_MASK == _CROSS_YELLOW
     
     def _count_cross_edges_correct(self, cube: Cube) -> int:
         """Count how many cross edges are correctly placed."""
-        bottom_face = cube.get_face_colors('D')
-        white_color = StandardColors.WHITE
-        edge_positions = [(0, 1), (1, 0), (1, 2), (2, 1)]
-        return sum(1 for row, col in edge_positions if bottom_face[row][col] == white_color)
\ No newline at end of file
+        # Fold each differing cell onto its lowest bit and count those
+        diff = (_face_bits(cube, 'D') ^ _CROSS_WHITE) & _CROSS_MASK
+        wrong = (diff | diff >> 1 | diff >> 2) & _CROSS_LOW_BITS
+        return len(_CROSS_EDGE_CELLS) - bin(wrong).count("1")
\ No newline at end of file
@@ -1,14 +1,49 @@
 """Layer-by-Layer (Beginner's Method) solver implementation."""
 
 import time
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 from copy import deepcopy
 
 from .base import BaseSolver, SolutionStep, SolutionPhase
 from .algorithms import AlgorithmDatabase
-from ..cube import Cube
+from ..cube import Cube, CubePool
+from ..cube.codes import move_indices
 from ..cube.moves import MoveSequence, Move
-from ..cube.state import Position, StandardColors
+from ..cube.state import COLOR_IDS, PACKED_FACE_ORDER, Position, StandardColors
+
+
+def _cell_bits(face: str, cells: List[Tuple[int, int]], value: int) -> int:
+    """Put a 3-bit value in (row, col) cells of a 3x3 face, laid out like ``Cube.packed_state``."""
+    offset = 27 * PACKED_FACE_ORDER.index(face)
+    return sum(value << (offset + 3 * (3 * row + col)) for row, col in cells)
+
+
+_EDGE_CELLS = [(0, 1), (1, 0), (1, 2), (2, 1)]
+_ALL_CELLS = [(row, col) for row in range(3) for col in range(3)]
+_SIDE_FACES = ['F', 'R', 'B', 'L']
+
+_WHITE = COLOR_IDS[StandardColors.WHITE]
+_YELLOW = COLOR_IDS[StandardColors.YELLOW]
+
+# Mask and target bits of each predicate
+_D_EDGE_MASK = _cell_bits('D', _EDGE_CELLS, 7)
+_D_EDGE_WHITE = _cell_bits('D', _EDGE_CELLS, _WHITE)
+_D_FACE_MASK = _cell_bits('D', _ALL_CELLS, 7)
+_D_FACE_WHITE = _cell_bits('D', _ALL_CELLS, _WHITE)
+_U_EDGE_MASK = _cell_bits('U', _EDGE_CELLS, 7)
+_U_EDGE_YELLOW = _cell_bits('U', _EDGE_CELLS, _YELLOW)
+_U_FACE_MASK = _cell_bits('U', _ALL_CELLS, 7)
+_U_FACE_YELLOW = _cell_bits('U', _ALL_CELLS, _YELLOW)
+# Middle row edges of the side faces; a cell sits 3 bits below the center
+# on its left and 3 bits above it on its right
+_MIDDLE_LEFT_MASK = sum(_cell_bits(face, [(1, 0)], 7) for face in _SIDE_FACES)
+_MIDDLE_RIGHT_MASK = sum(_cell_bits(face, [(1, 2)], 7) for face in _SIDE_FACES)
+
+# Moves of the trial loops, parsed once
+_U = Move.parse("U")
+_TEST_MOVES = tuple(Move.parse(m) for m in ("F", "R", "U", "R'", "U'", "F'"))
+_MID_SEQ = tuple(Move.parse(m) for m in ("R", "U", "R'", "U'", "F'", "U'", "F"))
+_MID_INDICES = move_indices(_MID_SEQ)
 
 
 class LayerByLayerSolver(BaseSolver):
@@ -27,6 +62,17 @@ class LayerByLayerSolver(BaseSolver):
         """Initialize the Layer-by-Layer solver."""
         super().__init__("Layer-by-Layer (Beginner's Method)")
         self.algorithm_db = AlgorithmDatabase()
+        self._scratch_pool = CubePool()
+        
+        # Fixed trial sequences, each replayed as one move-index array
+        self._sexy_moves = self.algorithm_db.get_algorithm("Common", "Sexy Move").moves_tuple
+        self._cross_moves = self.algorithm_db.get_algorithm("OLL", "OLL 45").moves_tuple
+        self._sune_round = self.algorithm_db.get_algorithm("Common", "Sune").moves_tuple + (_U,)
+        self._t_perm_round = self.algorithm_db.get_algorithm("PLL", "T-Perm").moves_tuple + (_U,)
+        self._sexy_indices = move_indices(self._sexy_moves)
+        self._cross_indices = move_indices(self._cross_moves)
+        self._sune_indices = move_indices(self._sune_round)
+        self._t_perm_indices = move_indices(self._t_perm_round)
     
     def can_solve(self, cube: Cube) -> bool:
         """Check if this solver can solve the given cube.
@@ -63,8 +109,24 @@ class LayerByLayerSolver(BaseSolver):
         start_time = time.time()
         
         # Work on a copy so we don't modify the original
-        work_cube = cube.clone()
+        work_cube = self._scratch_pool.get(cube)
+        try:
+            self._solve_layers(work_cube)
+        finally:
+            self._scratch_pool.recycle(work_cube)
         
+        self.solve_time = time.time() - start_time
+        
+        return self.solution_steps
+    
+    def _solve_layers(self, work_cube: Cube) -> None:
+        """Run the six layer-by-layer steps on a work cube, recording the steps.
+        
+        Parameters
+        ----------
+        work_cube : Cube
+            Cube to solve in place
+        """
         # Step 1: White cross
         step1 = self._solve_white_cross(work_cube)
         if step1:
@@ -100,10 +162,6 @@ class LayerByLayerSolver(BaseSolver):
         if step6:
             self.solution_steps.append(step6)
             self.total_moves += len(step6.moves)
-        
-        self.solve_time = time.time() - start_time
-        
-        return self.solution_steps
     
     def _solve_white_cross(self, cube: Cube) -> Optional[SolutionStep]:
         """Solve the white cross on the bottom face.
@@ -134,17 +192,19 @@ class LayerByLayerSolver(BaseSolver):
         
         # This is a simplified implementation
         # A real solver would use more sophisticated algorithms
+        seen = set()
         for i in range(20):  # Max attempts to avoid infinite loop
             if self._is_white_cross_solved(cube):
                 break
+            if self._revisits(cube, seen):
+                break
             
             # Apply some moves to try to get white cross
-            test_moves = ["F", "R", "U", "R'", "U'", "F'"]
-            for move_str in test_moves:
-                cube.apply_move(move_str)
-                moves.append(Move.parse(move_str))
+            for applied, move in enumerate(_TEST_MOVES, 1):
+                cube.apply_move(move)
                 if self._is_white_cross_solved(cube):
                     break
+            moves.extend(_TEST_MOVES[:applied])
         
         if not moves:
             return None
@@ -152,7 +212,7 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.CROSS,
             "Solve white cross",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Form a white cross on the bottom face with matching center colors"
         )
     
@@ -176,16 +236,16 @@ class LayerByLayerSolver(BaseSolver):
             return None
         
         # Simplified implementation - use right-hand algorithm
-        sexy_move = self.algorithm_db.get_algorithm("Common", "Sexy Move")
-        
+        seen = set()
         for i in range(20):  # Max attempts
             if self._is_first_layer_complete(cube):
                 break
+            if self._revisits(cube, seen):
+                break
             
             # Apply sexy move sequence
-            for move in sexy_move.moves:
-                cube.apply_move(move)
-                moves.append(move)
+            cube.apply_move_indices(self._sexy_indices)
+            moves.extend(self._sexy_moves)
         
         if not moves:
             return None
@@ -193,7 +253,7 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.LAYER1,
             "Complete first layer (white corners)",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Position and orient white corners to complete the first layer"
         )
     
@@ -217,15 +277,16 @@ class LayerByLayerSolver(BaseSolver):
             return None
         
         # Simplified middle layer solving
+        seen = set()
         for i in range(30):  # Max attempts
             if self._is_middle_layer_complete(cube):
                 break
+            if self._revisits(cube, seen):
+                break
             
             # Apply some common F2L-style moves
-            test_sequence = ["R", "U", "R'", "U'", "F'", "U'", "F"]
-            for move_str in test_sequence:
-                cube.apply_move(move_str) 
-                moves.append(Move.parse(move_str))
+            cube.apply_move_indices(_MID_INDICES)
+            moves.extend(_MID_SEQ)
         
         if not moves:
             return None
@@ -233,7 +294,7 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.LAYER2,
             "Solve middle layer edges",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Position the four middle layer edges correctly"
         )
     
@@ -256,17 +317,17 @@ class LayerByLayerSolver(BaseSolver):
         if self._is_yellow_cross_formed(cube):
             return None
         
-        # Use the simple cross algorithm: F R U R' U' F'
-        cross_alg = self.algorithm_db.get_algorithm("OLL", "OLL 45")
-        
+        # Use the simple cross algorithm (OLL 45): F R U R' U' F'
         # Apply the algorithm up to 3 times (dot -> line -> cross)
+        seen = set()
         for i in range(3):
             if self._is_yellow_cross_formed(cube):
                 break
+            if self._revisits(cube, seen):
+                break
             
-            for move in cross_alg.moves:
-                cube.apply_move(move)
-                moves.append(move)
+            cube.apply_move_indices(self._cross_indices)
+            moves.extend(self._cross_moves)
         
         if not moves:
             return None
@@ -274,7 +335,7 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.CROSS,
             "Form yellow cross",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Create a yellow cross pattern on the top face"
         )
     
@@ -298,20 +359,16 @@ class LayerByLayerSolver(BaseSolver):
             return None
         
         # Use Sune algorithm for orienting corners
-        sune = self.algorithm_db.get_algorithm("Common", "Sune")
-        
+        seen = set()
         for i in range(6):  # Max 6 applications of Sune
             if self._is_last_layer_oriented(cube):
                 break
+            if self._revisits(cube, seen):
+                break
             
-            # Apply Sune
-            for move in sune.moves:
-                cube.apply_move(move)
-                moves.append(move)
-            
-            # Rotate top face to try different positions
-            cube.apply_move("U")
-            moves.append(Move.parse("U"))
+            # Apply Sune, then rotate top face to try different positions
+            cube.apply_move_indices(self._sune_indices)
+            moves.extend(self._sune_round)
         
         if not moves:
             return None
@@ -319,7 +376,7 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.OLL,
             "Orient last layer",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Make all top face pieces yellow using Sune algorithm"
         )
     
@@ -343,20 +400,16 @@ class LayerByLayerSolver(BaseSolver):
             return None
         
         # Use T-Perm for final permutation
-        t_perm = self.algorithm_db.get_algorithm("PLL", "T-Perm")
-        
+        seen = set()
         for i in range(12):  # Max attempts
             if cube.is_solved():
                 break
+            if self._revisits(cube, seen):
+                break
             
-            # Apply T-Perm
-            for move in t_perm.moves:
-                cube.apply_move(move)
-                moves.append(move)
-            
-            # Try different orientations
-            cube.apply_move("U")
-            moves.append(Move.parse("U"))
+            # Apply T-Perm, then try different orientations
+            cube.apply_move_indices(self._t_perm_indices)
+            moves.extend(self._t_perm_round)
         
         if not moves:
             return None
@@ -364,10 +417,34 @@ class LayerByLayerSolver(BaseSolver):
         return self._create_step(
             SolutionPhase.PLL,
             "Permute last layer",
-            MoveSequence(moves),
+            MoveSequence.from_moves(moves),
             "Position all last layer pieces correctly to complete the solve"
         )
     
+    def _revisits(self, cube: Cube, seen: Set[bytes]) -> bool:
+        """Record the state at the start of a trial and report repeats.
+        
+        Trials are deterministic, so once a state comes round again the
+        loop is cycling and further attempts cannot reach the goal.
+        
+        Parameters
+        ----------
+        cube : Cube
+            Cube being solved
+        seen : Set[bytes]
+            States at the start of earlier trials of the same loop
+            
+        Returns
+        -------
+        bool
+            True if this state was seen before
+        """
+        key = cube.get_piece_codes().tobytes()
+        if key in seen:
+            return True
+        seen.add(key)
+        return False
+    
     def _is_white_cross_solved(self, cube: Cube) -> bool:
         """Check if white cross is correctly positioned.
         
@@ -381,18 +458,8 @@ class LayerByLayerSolver(BaseSolver):
         bool
             True if white cross is solved
         """
-        # Check bottom face edge positions for white color
-        bottom_face = cube.get_face_colors('D')
-        white_color = StandardColors.WHITE
-        
-        # Check if the edges (not corners) are white
-        edge_positions = [(0, 1), (1, 0), (1, 2), (2, 1)]
-        
-        for row, col in edge_positions:
-            if bottom_face[row][col] != white_color:
-                return False
-        
-        return True
+        # Check if the bottom face edges (not corners) are white
+        return cube.packed_state & _D_EDGE_MASK == _D_EDGE_WHITE
     
     def _is_first_layer_complete(self, cube: Cube) -> bool:
         """Check if the entire first layer (white face) is complete.
@@ -407,16 +474,8 @@ class LayerByLayerSolver(BaseSolver):
         bool
             True if first layer is complete
         """
-        bottom_face = cube.get_face_colors('D')
-        white_color = StandardColors.WHITE
-        
         # Check if entire bottom face is white
-        for row in bottom_face:
-            for color in row:
-                if color != white_color:
-                    return False
-        
-        return True
+        return cube.packed_state & _D_FACE_MASK == _D_FACE_WHITE
     
     def _is_middle_layer_complete(self, cube: Cube) -> bool:
         """Check if middle layer is complete.
@@ -433,17 +492,10 @@ class LayerByLayerSolver(BaseSolver):
         """
         # This is a simplified check
         # A complete implementation would check edge positions and orientations
-        faces = ['F', 'R', 'B', 'L']
-        
-        for face in faces:
-            face_colors = cube.get_face_colors(face)
-            center_color = face_colors[1][1]  # Center color
-            
-            # Check middle row edges
-            if face_colors[1][0] != center_color or face_colors[1][2] != center_color:
-                return False
-        
-        return True
+        # Each middle row edge XORed with its face's center, shifted into place
+        bits = cube.packed_state
+        return (((bits >> 3) ^ bits) & _MIDDLE_LEFT_MASK
+                | ((bits << 3) ^ bits) & _MIDDLE_RIGHT_MASK) == 0
     
     def _is_yellow_cross_formed(self, cube: Cube) -> bool:
         """Check if yellow cross is formed on top.
@@ -458,17 +510,7 @@ class LayerByLayerSolver(BaseSolver):
         bool
             True if yellow cross exists
         """
-        top_face = cube.get_face_colors('U')
-        yellow_color = StandardColors.YELLOW
-        
-        # Check edge positions for yellow
-        edge_positions = [(0, 1), (1, 0), (1, 2), (2, 1)]
-        
-        for row, col in edge_positions:
-            if top_face[row][col] != yellow_color:
-                return False
-        
-        return True
+        return cube.packed_state & _U_EDGE_MASK == _U_EDGE_YELLOW
     
     def _is_last_layer_oriented(self, cube: Cube) -> bool:
         """Check if last layer is fully oriented (all yellow on top).
@@ -483,13 +525,5 @@ class LayerByLayerSolver(BaseSolver):
         bool
             True if all top face is yellow
         """
-        top_face = cube.get_face_colors('U')
-        yellow_color = StandardColors.YELLOW
-        
         # Check if entire top face is yellow
-        for row in top_face:
-            for color in row:
-                if color != yellow_color:
-                    return False
-        
-        return True
\ No newline at end of file
+        return cube.packed_state & _U_FACE_MASK == _U_FACE_YELLOW
@@ -3,21 +3,41 @@
 import os
 import json
 import asyncio
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # orjson not installed, serialize with the stdlib
+    orjson = None
+
 # Import our cube logic
-from ..cube import Cube
+from ..cube import Cube, CubePool
+from ..cube.state import COLOR_HEX, PACKED_FACE_ORDER
 from ..solvers import LayerByLayerSolver, CFOPSolver
 
 
+# Order faces are sent in
+_STATE_FACES = ('U', 'D', 'L', 'R', 'F', 'B')
+
+
+def _dumps(message: dict) -> str:
+    """Serialize a message for a WebSocket text frame."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message)
+
+
 class CubeState(BaseModel):
     """Pydantic model for cube state."""
     size: int
@@ -51,6 +71,19 @@ class CubeManager:
             "layer_by_layer": LayerByLayerSolver(),
             "cfop": CFOPSolver()
         }
+        self._pool = CubePool()
+        # cube_id -> (cube, move_version, state) of the last state built
+        self._state_cache: Dict[str, Tuple[Cube, int, CubeState]] = {}
+        self._solve_lock = threading.Lock()
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    def get_lock(self, cube_id: str = None) -> asyncio.Lock:
+        """Get the lock serializing requests that read or change a cube."""
+        cube_id = cube_id or self.default_cube_id
+        lock = self._locks.get(cube_id)
+        if lock is None:
+            lock = self._locks[cube_id] = asyncio.Lock()
+        return lock
     
     def get_cube(self, cube_id: str = None) -> Cube:
         """Get cube by ID, or default cube."""
@@ -60,13 +93,27 @@ class CubeManager:
         return self.cubes[cube_id]
     
     def get_cube_state(self, cube_id: str = None) -> CubeState:
-        """Get current state of cube as Pydantic model."""
+        """Get current state of cube as Pydantic model.
+        
+        The model is reused until the cube changes, so treat it as read-only.
+        """
+        cube_id = cube_id or self.default_cube_id
         cube = self.get_cube(cube_id)
         
-        # Convert face colors to hex strings
-        face_colors = {}
-        for face, colors in cube.get_all_face_colors().items():
-            face_colors[face] = [[color.to_hex() for color in row] for row in colors]
+        cached = self._state_cache.get(cube_id)
+        if cached is not None and cached[0] is cube and cached[1] == cube.move_version:
+            return cached[2]
+        
+        state = self._build_cube_state(cube)
+        self._state_cache[cube_id] = (cube, cube.move_version, state)
+        return state
+    
+    def _build_cube_state(self, cube: Cube) -> CubeState:
+        """Convert a cube to the Pydantic model."""
+        # Convert all color ids to hex strings in one lookup
+        n = cube.size
+        hex_faces = dict(zip(PACKED_FACE_ORDER, COLOR_HEX[cube.get_sticker_ids()].reshape(6, n, n).tolist()))
+        face_colors = {face: hex_faces[face] for face in _STATE_FACES}
         
         return CubeState(
             size=cube.size,
@@ -104,28 +151,34 @@ class CubeManager:
         if not solver.can_solve(cube):
             raise ValueError(f"Solver {method} cannot solve this cube")
         
-        # Work on a copy to get solution steps
-        cube_copy = cube.clone()
-        steps = solver.solve(cube_copy)
-        
-        # Convert steps to JSON-serializable format
-        solution_steps = []
-        for step in steps:
-            solution_steps.append({
-                "phase": step.phase.value,
-                "description": step.description,
-                "moves": str(step.moves),
-                "explanation": step.explanation,
-                "move_count": len(step.moves)
-            })
-        
-        return {
-            "method": method,
-            "steps": solution_steps,
-            "total_moves": solver.total_moves,
-            "solve_time": solver.solve_time,
-            "summary": solver.get_solution_summary()
-        }
+        # Solvers keep per-solve results on the instance, so solves that may
+        # run in worker threads take turns
+        with self._solve_lock:
+            # Work on a copy to get solution steps
+            cube_copy = self._pool.get(cube)
+            try:
+                steps = solver.solve(cube_copy)
+            finally:
+                self._pool.recycle(cube_copy)
+            
+            # Convert steps to JSON-serializable format
+            solution_steps = []
+            for step in steps:
+                solution_steps.append({
+                    "phase": step.phase.value,
+                    "description": step.description,
+                    "moves": str(step.moves),
+                    "explanation": step.explanation,
+                    "move_count": len(step.moves)
+                })
+            
+            return {
+                "method": method,
+                "steps": solution_steps,
+                "total_moves": solver.total_moves,
+                "solve_time": solver.solve_time,
+                "summary": solver.get_solution_summary()
+            }
 
 
 class ConnectionManager:
@@ -139,18 +192,28 @@ class ConnectionManager:
         self.active_connections.append(websocket)
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # A failed broadcast may already have dropped the connection
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
     
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        if self.active_connections:
-            message_str = json.dumps(message)
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message_str)
-                except:
-                    # Connection may have been closed
-                    pass
+        """Broadcast message to all connected clients.
+        
+        The message is serialized once and sent to every client
+        concurrently; clients whose send fails are dropped.
+        """
+        if not self.active_connections:
+            return
+        
+        payload = _dumps(message)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 # Initialize FastAPI app
@@ -169,6 +232,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (the page, cube states, solutions)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize managers
 cube_manager = CubeManager()
 connection_manager = ConnectionManager()
@@ -177,15 +243,8 @@ connection_manager = ConnectionManager()
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main HTML page."""
-    html_file = static_path / "index.html"
-    if html_file.exists():
-        return HTMLResponse(content=html_file.read_text(), status_code=200)
-    else:
-        return HTMLResponse(content="""
+# Page served while static/index.html is missing
+_FALLBACK_HTML = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -201,7 +260,18 @@ async def root():
             <p>The HTML interface files are not yet created.</p>
         </body>
         </html>
-        """, status_code=200)
+        """
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """Serve the main HTML page."""
+    html_file = static_path / "index.html"
+    if html_file.exists():
+        # Streamed from disk by Starlette rather than read into a str
+        return FileResponse(html_file, media_type="text/html")
+    else:
+        return HTMLResponse(content=_FALLBACK_HTML, status_code=200)
 
 
 # REST API Endpoints
@@ -209,7 +279,8 @@ async def root():
 async def get_cube_state(cube_id: Optional[str] = None):
     """Get current cube state."""
     try:
-        state = cube_manager.get_cube_state(cube_id)
+        async with cube_manager.get_lock(cube_id):
+            state = cube_manager.get_cube_state(cube_id)
         return state
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -219,7 +290,8 @@ async def get_cube_state(cube_id: Optional[str] = None):
 async def apply_move(request: MoveRequest, cube_id: Optional[str] = None):
     """Apply moves to the cube."""
     try:
-        state = cube_manager.apply_moves(request.moves, cube_id)
+        async with cube_manager.get_lock(cube_id):
+            state = cube_manager.apply_moves(request.moves, cube_id)
         
         # Broadcast state change to all connected clients
         await connection_manager.broadcast({
@@ -239,7 +311,8 @@ async def apply_move(request: MoveRequest, cube_id: Optional[str] = None):
 async def scramble_cube(num_moves: int = 20, cube_id: Optional[str] = None):
     """Scramble the cube."""
     try:
-        state = cube_manager.scramble_cube(num_moves, cube_id)
+        async with cube_manager.get_lock(cube_id):
+            state = await run_in_threadpool(cube_manager.scramble_cube, num_moves, cube_id)
         
         # Broadcast state change
         await connection_manager.broadcast({
@@ -258,7 +331,8 @@ async def scramble_cube(num_moves: int = 20, cube_id: Optional[str] = None):
 async def reset_cube(cube_id: Optional[str] = None):
     """Reset cube to solved state."""
     try:
-        state = cube_manager.reset_cube(cube_id)
+        async with cube_manager.get_lock(cube_id):
+            state = cube_manager.reset_cube(cube_id)
         
         # Broadcast state change
         await connection_manager.broadcast({
@@ -276,7 +350,9 @@ async def reset_cube(cube_id: Optional[str] = None):
 async def solve_cube(request: SolveRequest, cube_id: Optional[str] = None):
     """Get solution for the cube."""
     try:
-        solution = cube_manager.solve_cube(request.method, cube_id)
+        # Solving is CPU-bound; keep the event loop free for other clients
+        async with cube_manager.get_lock(cube_id):
+            solution = await run_in_threadpool(cube_manager.solve_cube, request.method, cube_id)
         
         # Broadcast solution
         await connection_manager.broadcast({
@@ -290,16 +366,45 @@ async def solve_cube(request: SolveRequest, cube_id: Optional[str] = None):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# The solver list never changes, so it is serialized once
+_SOLVERS_JSON = _dumps({
+    "solvers": list(cube_manager.solvers.keys()),
+    "descriptions": {
+        "layer_by_layer": "Beginner's method - Layer by Layer solving",
+        "cfop": "Advanced speedcubing method - CFOP (Cross, F2L, OLL, PLL)"
+    }
+})
+
+
 @app.get("/api/solvers")
 async def get_available_solvers():
     """Get list of available solving methods."""
-    return {
-        "solvers": list(cube_manager.solvers.keys()),
-        "descriptions": {
-            "layer_by_layer": "Beginner's method - Layer by Layer solving",
-            "cfop": "Advanced speedcubing method - CFOP (Cross, F2L, OLL, PLL)"
-        }
-    }
+    return Response(content=_SOLVERS_JSON, media_type="application/json")
+
+
+# WebSocket message handlers by message type
+_PONG = _dumps({"type": "pong"})
+
+
+async def _handle_ping(websocket: WebSocket, message: dict):
+    """Answer a keep-alive ping."""
+    await websocket.send_text(_PONG)
+
+
+async def _handle_get_state(websocket: WebSocket, message: dict):
+    """Send the current cube state to one client."""
+    async with cube_manager.get_lock(None):
+        state = cube_manager.get_cube_state()
+    await websocket.send_text(_dumps({
+        "type": "cube_state",
+        "state": state.dict()
+    }))
+
+
+_WS_HANDLERS = {
+    "ping": _handle_ping,
+    "get_state": _handle_get_state,
+}
 
 
 # WebSocket endpoint for real-time communication
@@ -310,27 +415,19 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         # Send initial cube state
-        initial_state = cube_manager.get_cube_state()
-        await websocket.send_text(json.dumps({
+        async with cube_manager.get_lock(None):
+            initial_state = cube_manager.get_cube_state()
+        await websocket.send_text(_dumps({
             "type": "initial_state",
             "state": initial_state.dict()
         }))
         
         while True:
-            # Listen for client messages
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            
-            # Handle different message types
-            if message.get("type") == "ping":
-                await websocket.send_text(json.dumps({"type": "pong"}))
-            
-            elif message.get("type") == "get_state":
-                state = cube_manager.get_cube_state()
-                await websocket.send_text(json.dumps({
-                    "type": "cube_state",
-                    "state": state.dict()
-                }))
+            # Listen for client messages; unknown types are ignored
+            message = await websocket.receive_json()
+            handler = _WS_HANDLERS.get(message.get("type"))
+            if handler is not None:
+                await handler(websocket, message)
     
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket)
@@ -6,6 +6,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from rcsim.cube import Cube
+from rcsim.cube.moves import MoveSequence
 from rcsim.solvers import LayerByLayerSolver, CFOPSolver, AlgorithmDatabase
 
 
@@ -168,7 +169,8 @@ def test_solution_explanation():
     print("=== Solution Explanation Test ===")
     
     cube = Cube(3)
-    cube.apply_sequence("R U R' U'")  # Simple scramble
+    scramble = MoveSequence.parse("R U R' U'")  # Simple scramble
+    cube.apply_permutation(scramble.to_permutation(), scramble)
     
     solver = LayerByLayerSolver()
     steps = solver.solve(cube)
@@ -1,16 +1,23 @@
 """Pytest configuration and shared fixtures for Advanced Rubik's Cube Simulator tests."""
 
+import copy
 import os
+import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator
 
 import pytest
 import pygame
 
-# Add src directory to Python path for testing
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src directory to Python path for testing, unless already there
+# (not needed at all after ``pip install -e .``)
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Test configuration
 os.environ["RCSIM_TESTING"] = "1"
@@ -20,9 +27,9 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"  # Headless mode for CI
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up the test environment for graphics testing."""
-    # Initialize pygame in headless mode
-    pygame.init()
-    pygame.display.set_mode((1, 1))  # Minimal display for testing
+    # Initialize pygame in headless mode; the dummy driver needs no surface
+    if not pygame.get_init():
+        pygame.init()
     
     yield
     
@@ -30,6 +37,12 @@ def setup_test_environment():
     pygame.quit()
 
 
+@pytest.fixture(scope="session")
+def dummy_surface(setup_test_environment):
+    """Provide a minimal display surface for tests that draw to one."""
+    return pygame.display.set_mode((1, 1))
+
+
 @pytest.fixture
 def headless_display():
     """Provide headless display for graphics tests."""
@@ -38,51 +51,67 @@ def headless_display():
     return True
 
 
+@pytest.fixture(scope="session")
+def _solved_cube_templates():
+    """Build one solved cube per common size for the session."""
+    from rcsim.cube import Cube
+    return {size: Cube(size=size) for size in (2, 3, 4, 5)}
+
+
 @pytest.fixture
-def sample_cube_3x3():
+def sample_cube_3x3(_solved_cube_templates):
     """Create a sample 3x3 cube for testing."""
-    from rcsim.cube import Cube
-    return Cube(size=3)
+    return _solved_cube_templates[3].clone()
 
 
 @pytest.fixture
-def sample_cube_2x2():
+def sample_cube_2x2(_solved_cube_templates):
     """Create a sample 2x2 cube for testing."""
-    from rcsim.cube import Cube
-    return Cube(size=2)
+    return _solved_cube_templates[2].clone()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_moves():
     """Provide sample moves for testing."""
     from rcsim.cube.moves import Move
-    return [
+    return (
         Move.parse("R"),
         Move.parse("U"),
         Move.parse("R'"),
         Move.parse("U'"),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scramble():
     """Provide a sample scramble sequence."""
     from rcsim.cube.moves import Move
     scramble_notation = "R U R' U R U2 R' F R U R' U' F' R U R' U R U2 R'"
-    return [Move.parse(move) for move in scramble_notation.split()]
+    return tuple(Move.parse(move) for move in scramble_notation.split())
 
 
-@pytest.fixture
-def mock_renderer():
-    """Mock renderer for testing without actual graphics."""
-    from unittest.mock import Mock
+class _Stub:
+    """Callable test stub that only records whether it was called."""
     
-    renderer = Mock()
-    renderer.render_cube = Mock()
-    renderer.update_animation = Mock()
-    renderer.capture_screenshot = Mock(return_value=None)
+    __slots__ = ("called", "return_value")
     
-    return renderer
+    def __init__(self, return_value=None):
+        self.called = False
+        self.return_value = return_value
+    
+    def __call__(self, *args, **kwargs):
+        self.called = True
+        return self.return_value
+
+
+@pytest.fixture
+def mock_renderer():
+    """Stub renderer for testing without actual graphics."""
+    return SimpleNamespace(
+        render_cube=_Stub(),
+        update_animation=_Stub(),
+        capture_screenshot=_Stub(return_value=None),
+    )
 
 
 @pytest.fixture
@@ -116,41 +145,72 @@ def temp_config_file(tmp_path):
     return config_file
 
 
-@pytest.fixture
-def timer_service():
-    """Create timer service for testing."""
+@pytest.fixture(scope="session")
+def _timer_service_template():
+    """Build one timer service for the session."""
     from rcsim.app.timer import TimerService
     return TimerService()
 
 
 @pytest.fixture
-def game_session():
-    """Create game session for integration testing."""
+def timer_service(_timer_service_template):
+    """Create timer service for testing."""
+    return copy.deepcopy(_timer_service_template)
+
+
+@pytest.fixture(scope="session")
+def _game_session_template():
+    """Build one game session for the session."""
     from rcsim.app.game_session import GameSession
     return GameSession(cube_size=3)
 
 
 @pytest.fixture
-def cfop_solver():
-    """Create CFOP solver for testing."""
+def game_session(_game_session_template):
+    """Create game session for integration testing."""
+    return copy.deepcopy(_game_session_template)
+
+
+def _copy_solver(template):
+    """Copy a solver, sharing its algorithms but not its solution."""
+    solver = copy.copy(template)
+    solver.solution_steps = []
+    return solver
+
+
+@pytest.fixture(scope="session")
+def _cfop_solver_template():
+    """Build one CFOP solver, and its algorithm tables, for the session."""
     from rcsim.solvers.cfop import CFOPSolver
     return CFOPSolver()
 
 
 @pytest.fixture
-def layer_by_layer_solver():
-    """Create Layer-by-Layer solver for testing."""
+def cfop_solver(_cfop_solver_template):
+    """Create CFOP solver for testing."""
+    return _copy_solver(_cfop_solver_template)
+
+
+@pytest.fixture(scope="session")
+def _layer_by_layer_solver_template():
+    """Build one Layer-by-Layer solver for the session."""
     from rcsim.solvers.layer_by_layer import LayerByLayerSolver
     return LayerByLayerSolver()
 
 
+@pytest.fixture
+def layer_by_layer_solver(_layer_by_layer_solver_template):
+    """Create Layer-by-Layer solver for testing."""
+    return _copy_solver(_layer_by_layer_solver_template)
+
+
 @pytest.fixture(params=[2, 3, 4, 5])
 def cube_sizes(request):
     """Parametrized fixture for different cube sizes."""
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def solved_cube_state():
     """Provide a solved cube state for testing."""
     from rcsim.cube import Cube
@@ -168,10 +228,9 @@ def scrambled_cube_state(sample_cube_3x3, sample_scramble):
 
 # Performance testing fixtures
 @pytest.fixture
-def benchmark_cube():
+def benchmark_cube(_solved_cube_templates):
     """Create cube optimized for benchmarking."""
-    from rcsim.cube import Cube
-    return Cube(size=3)
+    return _solved_cube_templates[3].clone()
 
 
 @pytest.fixture
@@ -182,21 +241,22 @@ def performance_scramble():
 
 
 # Mock fixtures for external dependencies
+@pytest.fixture(scope="session")
+def _mock_opengl_context():
+    """Build the OpenGL context mock once for the session."""
+    from unittest.mock import Mock
+    return Mock()
+
+
 @pytest.fixture
-def mock_opengl():
+def mock_opengl(_mock_opengl_context):
     """Mock OpenGL calls for testing without GPU."""
-    from unittest.mock import patch, Mock
+    from unittest.mock import patch
     
-    with patch('moderngl.create_context') as mock_context:
-        mock_ctx = Mock()
-        mock_context.return_value = mock_ctx
-        
-        # Mock common OpenGL operations
-        mock_ctx.clear = Mock()
-        mock_ctx.enable = Mock()
-        mock_ctx.disable = Mock()
-        
-        yield mock_ctx
+    # Shared across tests, so forget the previous test's calls
+    _mock_opengl_context.reset_mock(return_value=True, side_effect=True)
+    with patch('moderngl.create_context', return_value=_mock_opengl_context):
+        yield _mock_opengl_context
 
 
 # Hypothesis strategies for property-based testing
@@ -241,49 +301,80 @@ def pytest_configure(config):
     )
 
 
+# Markers added by file location, built once
+_PATH_RE = re.compile(r"test_(integration|performance|unit)")
+_INTEGRATION = pytest.mark.integration
+_PERFORMANCE = pytest.mark.performance
+_SLOW = pytest.mark.slow
+_UNIT = pytest.mark.unit
+_GPU = pytest.mark.gpu
+_HEADLESS = pytest.mark.headless
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test location."""
-    rootdir = config.rootdir
-    
     for item in items:
-        # Add markers based on test file location
-        rel_path = item.fspath.relto(rootdir)
+        # Add markers based on test file location, relative to the rootdir
+        rel_path = item.nodeid.split("::", 1)[0]
+        kinds = set(_PATH_RE.findall(rel_path))
         
-        if "test_integration" in rel_path:
-            item.add_marker(pytest.mark.integration)
-        elif "test_performance" in rel_path:
-            item.add_marker(pytest.mark.performance)
-            item.add_marker(pytest.mark.slow)
-        elif "test_unit" in rel_path:
-            item.add_marker(pytest.mark.unit)
+        if "integration" in kinds:
+            item.add_marker(_INTEGRATION)
+        elif "performance" in kinds:
+            item.add_marker(_PERFORMANCE)
+            item.add_marker(_SLOW)
+        elif "unit" in kinds:
+            item.add_marker(_UNIT)
         
         # Add GPU marker for graphics tests
         if "graphics" in rel_path or "render" in rel_path:
-            item.add_marker(pytest.mark.gpu)
+            item.add_marker(_GPU)
         
         # Add headless marker for tests that can run without display
-        if not any(mark.name == "gpu" for mark in item.iter_markers()):
-            item.add_marker(pytest.mark.headless)
+        if item.get_closest_marker("gpu") is None:
+            item.add_marker(_HEADLESS)
 
 
 # Cleanup fixtures
-@pytest.fixture(autouse=True)
+_TEMP_DIR = Path(tempfile.gettempdir()) / "rcsim_test"
+
+
+def _remove_temp_dir():
+    """Remove the shared temporary directory if a test created it."""
+    if _TEMP_DIR.exists():
+        shutil.rmtree(_TEMP_DIR)
+
+
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_temp_files():
-    """Automatically clean up temporary files after each test."""
+    """Clean up temporary files once the test session ends."""
     yield
-    
-    # Clean up any temporary files created during testing
-    import tempfile
-    import shutil
-    temp_dir = Path(tempfile.gettempdir()) / "rcsim_test"
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+    _remove_temp_dir()
+
+
+@pytest.fixture
+def clean_temp():
+    """Provide an empty temporary directory, removed after the test."""
+    _remove_temp_dir()
+    _TEMP_DIR.mkdir(parents=True)
+    yield _TEMP_DIR
+    _remove_temp_dir()
 
 
 # Database fixtures for testing statistics
+@pytest.fixture
+def temp_db_inmem():
+    """Provide an in-memory database connection for statistics tests."""
+    import sqlite3
+    
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
 def temp_db():
-    """Create temporary database for testing statistics storage."""
+    """Create temporary database file, for tests of on-disk persistence."""
     import sqlite3
     from tempfile import NamedTemporaryFile
     
@@ -302,14 +393,19 @@ def temp_db():
 
 
 # Logging configuration for tests
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def configure_test_logging():
-    """Configure logging for tests."""
+    """Configure logging once for the session.
+    
+    Only warnings are logged unless ``RCSIM_TEST_LOG`` names another level
+    (e.g. ``RCSIM_TEST_LOG=DEBUG``), so debug records are never built in
+    hot loops by default. Use ``caplog`` to capture records in a test.
+    """
     import logging
     
-    # Set up test-specific logging
+    level = os.environ.get("RCSIM_TEST_LOG", "WARNING").upper()
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=getattr(logging, level, logging.WARNING),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
@@ -321,4 +417,4 @@ def configure_test_logging():
     
     # Clean up logging handlers
     for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
\ No newline at end of file
+        logging.root.removeHandler(handler)
@@ -0,0 +1,115 @@
+"""Unit tests for the algorithm database."""
+
+import dataclasses
+
+import pytest
+
+from rcsim.cube.moves import MoveSequence
+from rcsim.solvers.algorithms import Algorithm, AlgorithmDatabase
+
+
+def _custom_algorithm(category="OLL"):
+    """Create a custom algorithm for database tests."""
+    return Algorithm("Custom", MoveSequence.parse("R U R'"), "Custom case", category, 1, 0.5)
+
+
+class TestAlgorithmDatabase:
+    """Test AlgorithmDatabase lookups and custom algorithms."""
+
+    def test_default_database_shared(self):
+        """Test instances share the built-in algorithms."""
+        first = AlgorithmDatabase()
+        second = AlgorithmDatabase()
+
+        assert first.algorithms is second.algorithms
+        assert first.get_algorithm("PLL", "T-Perm") is second.get_algorithm("PLL", "T-Perm")
+
+    def test_custom_algorithm_copies_on_write(self):
+        """Test adding an algorithm does not leak into other instances."""
+        db = AlgorithmDatabase()
+        other = AlgorithmDatabase()
+        custom = _custom_algorithm()
+
+        db.add_custom_algorithm(custom)
+
+        assert db.get_algorithm("OLL", "Custom") is custom
+        assert other.get_algorithm("OLL", "Custom") is None
+        assert AlgorithmDatabase().get_algorithm_count() == other.get_algorithm_count()
+
+    def test_algorithm_perm_matches_moves(self):
+        """Test an algorithm's table moves a cube like its moves and is shared."""
+        from rcsim.cube import Cube
+
+        db = AlgorithmDatabase()
+        expected = Cube(3)
+        expected.apply_sequence(db.get_algorithm("PLL", "T-Perm").moves)
+        cube = Cube(3)
+
+        cube.apply_permutation(db.get_algorithm_perm("PLL", "T-Perm"))
+
+        assert cube == expected
+        assert AlgorithmDatabase().get_algorithm_perm("PLL", "T-Perm") is db.get_algorithm_perm("PLL", "T-Perm")
+        assert db.get_algorithm_perm("PLL", "Missing") is None
+
+    def test_get_algorithm_by_section(self):
+        """Test lookups use the section an algorithm is stored under."""
+        db = AlgorithmDatabase()
+
+        assert db.get_algorithm("Common", "Right Hand").category == "Trigger"
+        assert db.get_algorithm("Trigger", "Right Hand") is None
+        assert db.get_algorithm("Missing", "T-Perm") is None
+
+    def test_search_sorted_by_frequency(self):
+        """Test search matches name or description, most frequent first."""
+        db = AlgorithmDatabase()
+        db.add_custom_algorithm(_custom_algorithm())
+
+        results = db.search_algorithms("PERM")
+        assert results and all("perm" in alg.name.lower() or "perm" in alg.description.lower()
+                               for alg in results)
+        assert [alg.frequency for alg in results] == sorted((alg.frequency for alg in results),
+                                                            reverse=True)
+        assert db.search_algorithms("custom case")[0].name == "Custom"
+
+    def test_algorithms_are_immutable(self):
+        """Test shared algorithms cannot be modified in place."""
+        alg = AlgorithmDatabase().get_algorithm("PLL", "T-Perm")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            alg.frequency = 1.0
+
+    def test_identical_notation_shares_sequence(self):
+        """Test aliases with the same moves reuse one parsed sequence."""
+        db = AlgorithmDatabase()
+
+        assert db.get_algorithm("Common", "Sexy Move").moves is db.get_algorithm("Common", "Right Hand").moves
+        assert db.get_algorithm("PLL", "T-Perm").moves is db.get_algorithm("PLL", "J-Perm B").moves
+
+    def test_moves_resolved_at_construction(self):
+        """Test the move and notation tuples mirror the sequence."""
+        alg = AlgorithmDatabase().get_algorithm("Common", "Sune")
+
+        assert alg.moves_tuple == tuple(alg.moves)
+        assert alg.notation_tuple == ("R", "U", "R'", "U", "R", "U2", "R'")
+        assert " ".join(alg.notation_tuple) == str(alg.moves)
+
+    def test_algorithm_identity_equality(self):
+        """Test algorithms compare and hash by identity."""
+        alg = AlgorithmDatabase().get_algorithm("PLL", "T-Perm")
+        twin = Algorithm(alg.name, alg.moves, alg.description, alg.category,
+                         alg.difficulty, alg.frequency)
+
+        assert alg == AlgorithmDatabase().get_algorithm("PLL", "T-Perm")
+        assert alg != twin
+        assert len({alg, twin}) == 2
+
+    def test_category_listing_cached_until_added(self):
+        """Test category listings are reused until the category changes."""
+        db = AlgorithmDatabase()
+        oll = db.get_algorithms_by_category("OLL")
+
+        assert db.get_algorithms_by_category("OLL") is oll
+        assert db.get_algorithms_by_category("Missing") == ()
+
+        db.add_custom_algorithm(_custom_algorithm())
+        assert len(db.get_algorithms_by_category("OLL")) == len(oll) + 1
@@ -0,0 +1,79 @@
+"""Unit tests for the orbit camera."""
+
+import numpy as np
+import pytest
+
+from rcsim.graphics.camera import Camera
+
+
+class TestCameraPrecision:
+    """Test that camera vectors stay float32 through all operations."""
+    
+    def _assert_float32(self, camera):
+        assert camera.position.dtype == np.float32
+        assert camera.target.dtype == np.float32
+        assert camera.up.dtype == np.float32
+    
+    def test_initial_vectors_are_float32(self):
+        """Test freshly constructed camera uses float32 vectors."""
+        self._assert_float32(Camera())
+    
+    def test_orbit_zoom_pan_keep_float32(self):
+        """Test camera controls never upcast the vectors."""
+        camera = Camera()
+        camera.orbit(12.5, -7.25)
+        camera.zoom(0.75)
+        camera.pan(3.0, -2.0)
+        camera.frame_cube(5)
+        camera.reset_to_default()
+        
+        self._assert_float32(camera)
+        assert isinstance(camera.distance, float)
+    
+    def test_pan_moves_target_and_position_together(self):
+        """Test panning translates both ends of the view ray equally."""
+        camera = Camera()
+        offset_before = camera.position - camera.target
+        
+        camera.pan(4.0, 1.5)
+        
+        assert np.allclose(camera.position - camera.target, offset_before, atol=1e-5)
+        assert not np.allclose(camera.target, 0.0)
+    
+    def test_state_roundtrip(self):
+        """Test restoring a saved state preserves precision and distance."""
+        camera = Camera()
+        camera.orbit(30.0, 10.0)
+        state = camera.get_state()
+        
+        restored = Camera()
+        restored.set_state(state)
+        
+        self._assert_float32(restored)
+        assert restored.distance == pytest.approx(camera.distance, rel=1e-5)
+
+
+class TestCameraMatrixBuffers:
+    """Test the column-major upload buffers match the NumPy matrices."""
+    
+    def test_view_buffer_matches_view_matrix(self):
+        """Test view buffer is the transposed view matrix."""
+        camera = Camera()
+        camera.orbit(20.0, 5.0)
+        camera.pan(1.0, 2.0)
+        
+        buf = np.array(list(camera.get_view_buffer())).reshape(4, 4).T
+        assert np.allclose(buf, camera.get_view_matrix(), atol=1e-5)
+    
+    def test_projection_buffer_matches_projection_matrix(self):
+        """Test projection buffer is the transposed projection matrix."""
+        camera = Camera()
+        
+        buf = np.array(list(camera.get_projection_buffer(1.5))).reshape(4, 4).T
+        assert np.allclose(buf, camera.get_projection_matrix(1.5), atol=1e-5)
+    
+    def test_buffers_are_reused(self):
+        """Test repeated calls write into the same buffer object."""
+        camera = Camera()
+        assert camera.get_view_buffer() is camera.get_view_buffer()
+        assert camera.get_projection_buffer(1.0) is camera.get_projection_buffer(2.0)
@@ -0,0 +1,204 @@
+"""Unit tests for the CFOP solver internals."""
+
+import pytest
+
+from rcsim.cube import Cube
+from rcsim.cube.state import StandardColors
+from rcsim.solvers.cfop import (
+    CFOPSolver,
+    _CROSS_AFFECTING,
+    _CROSS_CANDIDATES,
+    _CROSS_SEARCH_MOVES,
+    _CROSS_TRANSITIONS,
+    _CROSS_WHITE_BY_MASK,
+    _SolveState,
+    _U_TRANSITION,
+    _cross_search,
+    _cross_search_loops,
+    _edge_codes,
+)
+
+
+class TestCrossSearch:
+    """Test the cross search candidate handling."""
+
+    def test_skipped_candidates_keep_cross_count(self):
+        """Test candidates outside the affecting set never change the cross."""
+        solver = CFOPSolver()
+        skipped = [m for m in _CROSS_CANDIDATES if m not in _CROSS_AFFECTING]
+        assert skipped == ["U", "U'"]
+
+        for seed in range(5):
+            cube = Cube(3)
+            cube.scramble(num_moves=12, seed=seed)
+            before = solver._count_cross_edges_correct(cube)
+            for move in skipped:
+                test_cube = cube.clone()
+                test_cube.apply_move(move)
+                assert solver._count_cross_edges_correct(test_cube) == before
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_code_tables_track_cube(self, seed):
+        """Test the piece code tables follow real turns and cross counts."""
+        solver = CFOPSolver()
+        cube = Cube(3)
+        cube.scramble(num_moves=20, seed=seed)
+        codes, masks = _edge_codes(cube)
+
+        for row, move in enumerate(_CROSS_SEARCH_MOVES):
+            cube.apply_move(move)
+            expected, _ = _edge_codes(cube)
+            assert _CROSS_TRANSITIONS[row, codes].tolist() == expected.tolist()
+            assert _CROSS_WHITE_BY_MASK[masks, expected].sum() == solver._count_cross_edges_correct(cube)
+            cube.undo_last_move()
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_loop_kernel_matches_numpy_search(self, seed, monkeypatch):
+        """Test the numba kernel source takes the same steps as the NumPy search."""
+        import rcsim.solvers.cfop as cfop
+
+        monkeypatch.setattr(cfop, "_cross_search_native", None)
+        cube = Cube(3)
+        cube.scramble(num_moves=12, seed=seed)
+        codes, masks = _edge_codes(cube)
+
+        steps = _cross_search_loops(codes, masks, _CROSS_TRANSITIONS, _U_TRANSITION,
+                                    _CROSS_WHITE_BY_MASK, 15, 4)
+        assert steps.tolist() == _cross_search(codes, masks, 15)
+
+
+class TestPredicates:
+    """Test the packed face predicates against per-sticker checks."""
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_predicates_match_face_colors(self, seed):
+        """Test each predicate agrees with a direct color comparison."""
+        cube = Cube(3)
+        cube.scramble(num_moves=3, seed=seed)
+        solver = CFOPSolver()
+        white, yellow = StandardColors.WHITE, StandardColors.YELLOW
+        edges = [(0, 1), (1, 0), (1, 2), (2, 1)]
+        down, up = cube.get_face_colors('D'), cube.get_face_colors('U')
+
+        assert solver._count_cross_edges_correct(cube) == sum(down[r][c] == white for r, c in edges)
+        assert solver._is_cross_solved(cube) == all(down[r][c] == white for r, c in edges)
+        assert solver._is_yellow_cross_formed(cube) == all(up[r][c] == yellow for r, c in edges)
+        assert solver._is_oll_solved(cube) == all(c == yellow for row in up for c in row)
+
+        sides_done = all(
+            all(color == face[1][1] for row in face[1:] for color in row)
+            for face in (cube.get_face_colors(f) for f in 'FRBL')
+        )
+        d_white = all(c == white for row in down for c in row)
+        assert solver._is_f2l_complete(cube) == (d_white and sides_done)
+
+
+class TestScratchPool:
+    """Test work cubes are reused across solves."""
+
+    def test_solves_reuse_one_work_cube(self):
+        """Test repeated solves match fresh solvers and keep one pooled cube."""
+        solver = CFOPSolver()
+        for seed in range(3):
+            cube = Cube(3)
+            cube.scramble(num_moves=15, seed=seed)
+            before = cube.clone()
+
+            steps = solver.solve(cube)
+
+            expected = CFOPSolver().solve(cube)
+            assert [str(s.moves) for s in steps] == [str(s.moves) for s in expected]
+            assert cube == before
+            assert len(solver._scratch_pool) == 1
+
+
+def _reference_two_look_oll(solver, cube):
+    """2-look OLL as originally written, looking algorithms up per call."""
+    moves = []
+    if not solver._is_yellow_cross_formed(cube):
+        cross_alg = solver.algorithm_db.get_algorithm("OLL", "OLL 45")
+        for i in range(3):
+            if solver._is_yellow_cross_formed(cube):
+                break
+            for move in cross_alg.moves:
+                cube.apply_move(move)
+                moves.append(move)
+    if not solver._is_oll_solved(cube):
+        sune = solver.algorithm_db.get_algorithm("Common", "Sune")
+        for i in range(6):
+            if solver._is_oll_solved(cube):
+                break
+            for move in sune.moves:
+                cube.apply_move(move)
+                moves.append(move)
+            cube.apply_move("U")
+            moves.append(cube.move_history[-1])
+    return moves
+
+
+def _reference_two_look_pll(solver, cube):
+    """2-look PLL as originally written, looking algorithms up per call."""
+    moves = []
+    for alg in (solver.algorithm_db.get_algorithm("PLL", "T-Perm"),
+                solver.algorithm_db.get_algorithm("PLL", "A-Perm A")):
+        for i in range(4):
+            if cube.is_solved():
+                break
+            for move in alg.moves:
+                cube.apply_move(move)
+                moves.append(move)
+            if cube.is_solved():
+                break
+            cube.apply_move("U")
+            moves.append(cube.move_history[-1])
+    return moves
+
+
+class TestTwoLook:
+    """Test the prebuilt 2-look fallbacks against the per-call lookups."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("method", ["_two_look_oll", "_two_look_pll"])
+    def test_matches_reference(self, seed, method):
+        """Test the fallback applies the same moves as the original loops."""
+        reference = {"_two_look_oll": _reference_two_look_oll,
+                     "_two_look_pll": _reference_two_look_pll}[method]
+        solver = CFOPSolver()
+        cube = Cube(3)
+        cube.scramble(num_moves=8, seed=seed)
+        expected_cube = cube.clone()
+
+        moves = getattr(solver, method)(cube)
+        expected = reference(solver, expected_cube)
+
+        assert moves == expected
+        assert cube == expected_cube
+
+
+class TestSolveState:
+    """Test the facts passed between phases."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_cross_phase_records_cross(self, seed):
+        """Test the recorded cross result matches the packed D face."""
+        solver = CFOPSolver()
+        cube = Cube(3)
+        cube.scramble(num_moves=12, seed=seed)
+        state = _SolveState()
+
+        solver._solve_cross(cube, state)
+
+        assert state.cross_solved == solver._is_cross_solved(cube)
+
+    def test_unsolved_cross_skips_f2l_check(self, monkeypatch):
+        """Test F2L does not rebuild faces on entry after an unsolved cross."""
+        solver = CFOPSolver()
+        cube = Cube(3)
+        cube.scramble(num_moves=12, seed=0)
+        calls = []
+        original = solver._is_f2l_complete
+        monkeypatch.setattr(solver, "_is_f2l_complete", lambda c: calls.append(1) or original(c))
+
+        solver._solve_f2l(cube, _SolveState(cross_solved=False))
+
+        assert len(calls) == 3  # before pairs 2-4 only
@@ -0,0 +1,144 @@
+"""Unit tests for the piece-code encoding."""
+
+import pytest
+
+from rcsim.cube import Cube, Move
+from rcsim.cube.codes import NUM_CODES, decode_piece, move_table
+from rcsim.cube.cube import CubeError
+
+
+MOVES = [f"{face}{suffix}" for face in "URFDLBMES" for suffix in ("", "'", "2")]
+
+
+class TestMoveTables:
+    """Test code tables against moves applied to real cubes."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_tables_follow_moves(self, seed):
+        """Test every table maps codes the way the move moves the pieces."""
+        cube = Cube(3)
+        cube.scramble(num_moves=20, seed=seed)
+        codes = cube.get_piece_codes()
+
+        for notation in MOVES:
+            cube.apply_move(notation)
+            assert move_table(Move.parse(notation))[codes].tolist() == cube.get_piece_codes().tolist()
+            cube.undo_last_move()
+
+    def test_tables_are_shared_permutations(self):
+        """Test tables are cached, read-only bijections of the codes."""
+        table = move_table(Move.parse("R"))
+
+        assert move_table(Move.parse("R")) is table
+        assert not table.flags.writeable
+        assert sorted(table.tolist()) == list(range(NUM_CODES))
+
+    def test_decode_round_trip(self):
+        """Test codes decode to the pieces' own position and orientation."""
+        cube = Cube(3)
+        cube.apply_sequence("R U F'")
+
+        for cubie, code in zip(cube.state.cubies, cube.get_piece_codes()):
+            assert decode_piece(code) == (cubie.current_position, cubie.orientation)
+
+    def test_codes_need_3x3(self):
+        """Test other sizes are rejected."""
+        with pytest.raises(CubeError):
+            Cube(2).get_piece_codes()
+
+
+class TestCodeMoves:
+    """Test moves executed through the code tables on a 3x3."""
+
+    @pytest.mark.parametrize("notation", ["R", "U'", "F2", "M", "E'", "S2"])
+    def test_moves_match_piece_rotation(self, notation):
+        """Test each piece ends where rotating it around the move axis puts it."""
+        cube = Cube(3)
+        cube.scramble(num_moves=15, seed=4)
+        move = Move.parse(notation)
+        axis, angle = move.get_rotation_axis(), move.get_rotation_angle()
+        expected = []
+        for cubie in cube.state.cubies:
+            position, orientation = cubie.current_position, cubie.orientation
+            if move.affects_position(position, 3):
+                position = position.rotate_around_axis(axis.value, angle)
+                orientation = orientation.rotate_around_axis(axis, angle)
+            expected.append((position, orientation))
+
+        cube.apply_move(notation)
+
+        assert [(c.current_position, c.orientation) for c in cube.state.cubies] == expected
+        for cubie in cube.state.cubies:
+            assert cube.state.get_piece_at_position(cubie.current_position) is cubie
+
+    def test_codes_cached_until_move(self):
+        """Test piece codes are reused until the cube changes."""
+        cube = Cube(3)
+        codes = cube.get_piece_codes()
+        assert cube.get_piece_codes() is codes
+        assert cube.clone().get_piece_codes() is codes
+
+        cube.apply_move("R")
+        assert cube.get_piece_codes() is not codes
+        assert cube.get_piece_codes().tolist() == move_table(Move.parse("R"))[codes].tolist()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_sticker_ids_match_faces(self, seed):
+        """Test stickers read from codes match the pieces' face colors."""
+        from rcsim.cube.codes import sticker_ids
+        from rcsim.cube.state import PACKED_FACE_ORDER
+
+        cube = Cube(3)
+        cube.scramble(num_moves=25, seed=seed)
+        expected = [cube.state.get_face_ids(face).ravel().tolist() for face in PACKED_FACE_ORDER]
+
+        assert sticker_ids(cube.get_piece_codes()).reshape(6, 9).tolist() == expected
+
+
+class TestMoveIndices:
+    """Test whole sequences applied through composed tables."""
+
+    def test_indices_match_single_moves(self):
+        """Test applying indices equals applying each move, history included."""
+        from rcsim.cube.codes import MOVES, move_indices
+
+        sequence = list(MOVES) + [Move.parse(m) for m in ("R", "U", "R'", "U'")]
+        single = Cube(3)
+        single.scramble(num_moves=20, seed=7)
+        batched = single.clone()
+
+        for move in sequence:
+            single.apply_move(move)
+        batched.apply_move_indices(move_indices(sequence))
+
+        assert batched == single
+        assert batched.get_move_history() == single.get_move_history()
+        assert batched.get_piece_codes().tolist() == single.get_piece_codes().tolist()
+
+    def test_sequence_tables_are_cached(self):
+        """Test a sequence's composed table is built once."""
+        from rcsim.cube.codes import move_indices, sequence_table
+
+        indices = move_indices([Move.parse("R"), Move.parse("U")])
+
+        assert sequence_table(indices) is sequence_table(indices.copy())
+        assert not sequence_table(indices).flags.writeable
+
+    def test_indices_need_3x3(self):
+        """Test other sizes are rejected."""
+        from rcsim.cube.codes import move_indices
+
+        with pytest.raises(CubeError):
+            Cube(2).apply_move_indices(move_indices([Move.parse("R")]))
+
+
+class TestSolvedCodes:
+    """Test the solved check on piece codes."""
+
+    @pytest.mark.parametrize("sequence", ["", "R", "R R'", "E", "M2 M2", "R U R' U' " * 6])
+    def test_matches_piece_check(self, sequence):
+        """Test the code comparison agrees with checking every piece."""
+        cube = Cube(3)
+        cube.apply_sequence(sequence)
+
+        assert cube.is_solved() == cube.state.is_solved()
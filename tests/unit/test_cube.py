@@ -1,5 +1,6 @@
 """Unit tests for cube functionality."""
 
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st
 
@@ -123,6 +124,32 @@ class TestCube:
         assert cloned is not sample_cube_3x3
         assert cloned.get_move_history() == sample_cube_3x3.get_move_history()
     
+    def test_move_version_tracks_state_changes(self, sample_cube_3x3):
+        """Test move_version changes on every state mutation."""
+        versions = [sample_cube_3x3.move_version]
+        
+        sample_cube_3x3.apply_move("R")
+        versions.append(sample_cube_3x3.move_version)
+        sample_cube_3x3.undo_last_move()
+        versions.append(sample_cube_3x3.move_version)
+        sample_cube_3x3.reset()
+        versions.append(sample_cube_3x3.move_version)
+        
+        assert len(set(versions)) == len(versions)
+        assert sample_cube_3x3.clone().move_version == sample_cube_3x3.move_version
+    
+    def test_new_cubes_are_independent(self):
+        """Test cubes built from the shared solved state never share pieces."""
+        first = Cube(3)
+        first.apply_move("R")
+        second = Cube(3)
+        
+        assert second.is_solved()
+        assert not set(map(id, first.state.cubies)) & set(map(id, second.state.cubies))
+        
+        first.reset()
+        assert first.is_solved() and second == first
+    
     @pytest.mark.parametrize("size", [2, 3, 4, 5])
     def test_different_cube_sizes(self, size):
         """Test functionality across different cube sizes."""
@@ -157,6 +184,70 @@ class TestCubeState:
         
         assert cube1 != cube2
     
+    def test_position_hash_matches_equality(self):
+        """Test equal positions hash alike however they were built."""
+        from rcsim.cube.state import Position
+        
+        position = Position(1, 0, -1)
+        assert position == Position(1.0, 0.0, -1.0)
+        assert hash(position) == hash(Position(1.0, 0.0, -1.0))
+        assert {position: 'edge'}[Position(1.0, 0.0, -1.0)] == 'edge'
+        assert hash(position.rotate_around_axis('y', 90)) != hash(position)
+    
+    def test_positions_array_follows_moves(self, sample_cube_3x3):
+        """Test the cached position array is refreshed after a move."""
+        state = sample_cube_3x3.state
+        before = state.positions_array()
+        assert before.shape == (len(state.cubies), 3)
+        assert state.positions_array() is before
+        
+        sample_cube_3x3.apply_move("R")
+        after = sample_cube_3x3.state.positions_array()
+        
+        expected = [(c.current_position.x, c.current_position.y, c.current_position.z)
+                    for c in sample_cube_3x3.state.cubies]
+        assert after is not before
+        assert np.allclose(after, expected)
+    
+    def test_face_colors_cached_until_move(self, sample_cube_3x3):
+        """Test face colors are reused until a move, without sharing lists."""
+        state = sample_cube_3x3.state
+        first = state.get_face_colors('F')
+        first[0][0] = None
+        
+        assert state.get_face_colors('F')[0][0] is not None
+        assert 'F' in state._face_colors
+        
+        sample_cube_3x3.apply_move("R")
+        assert 'F' not in sample_cube_3x3.state._face_colors
+        assert sample_cube_3x3.get_face_colors('F') == state._compute_face_colors('F')
+    
+    def test_face_ids_match_face_colors(self, sample_cube_3x3):
+        """Test face color ids encode get_face_colors and follow moves."""
+        from rcsim.cube.state import COLOR_IDS
+        
+        sample_cube_3x3.apply_sequence("R U F'")
+        state = sample_cube_3x3.state
+        for face in ['U', 'D', 'L', 'R', 'F', 'B']:
+            ids = state.get_face_ids(face)
+            expected = [[COLOR_IDS[c] for c in row] for row in state.get_face_colors(face)]
+            assert ids.dtype == np.uint8 and not ids.flags.writeable
+            assert ids.tolist() == expected
+            assert state.get_face_ids(face) is ids
+    
+    def test_packed_state_layout(self, sample_cube_3x3):
+        """Test packed faces hold 3 bits per sticker in face order."""
+        from rcsim.cube.state import PACKED_FACE_ORDER
+        
+        sample_cube_3x3.apply_sequence("R U F'")
+        state = sample_cube_3x3.state
+        packed = sample_cube_3x3.packed_state
+        for i, face in enumerate(PACKED_FACE_ORDER):
+            face_bits = state.get_packed_face(face)
+            assert (packed >> (27 * i)) & ((1 << 27) - 1) == face_bits
+            for cell, color_id in enumerate(state.get_face_ids(face).ravel()):
+                assert (face_bits >> (3 * cell)) & 7 == color_id
+    
     def test_state_clone(self, sample_cube_3x3):
         """Test that state cloning works correctly."""
         original_cube = sample_cube_3x3
@@ -164,6 +255,109 @@ class TestCubeState:
         
         assert original_cube == cloned_cube
         assert original_cube is not cloned_cube
+
+    def test_state_clone_shares_only_immutable_data(self, sample_cube_3x3):
+        """Test cloned pieces move independently but share their colors."""
+        sample_cube_3x3.apply_sequence("R U")
+        cloned = sample_cube_3x3.clone()
+
+        for cubie, copy in zip(sample_cube_3x3.state.cubies, cloned.state.cubies):
+            assert copy is not cubie
+            assert copy.colors is cubie.colors
+            assert copy.piece_type == cubie.piece_type
+
+        cloned.apply_move("F")
+        assert cloned != sample_cube_3x3
+        assert sample_cube_3x3.get_move_history() == [Move.parse("R"), Move.parse("U")]
+
+    def test_cube_face_ids(self, sample_cube_3x3):
+        """Test the cube-level face ids match the state and reject bad faces."""
+        from rcsim.cube.state import COLOR_TABLE
+        
+        sample_cube_3x3.apply_sequence("R U")
+        ids = sample_cube_3x3.get_face_ids('F')
+        assert sample_cube_3x3.state.get_face_ids('F') is ids
+        assert ids.base is not None and not ids.flags.writeable
+        assert [[COLOR_TABLE[i] for i in row] for row in ids.tolist()] == sample_cube_3x3.get_face_colors('F')
+        
+        with pytest.raises(CubeError):
+            sample_cube_3x3.get_face_ids('X')
+    
+    def test_top_row_matches_face_ids(self, sample_cube_3x3):
+        """Test the top row read agrees with the full face, cached or not."""
+        from rcsim.cube.state import COLOR_IDS
+        
+        sample_cube_3x3.apply_sequence("R U F' L2")
+        fresh = {face: sample_cube_3x3.get_top_row(face) for face in ['U', 'D', 'L', 'R', 'F', 'B']}
+        
+        for face, row in fresh.items():
+            ids = sample_cube_3x3.get_face_ids(face)
+            assert row == (*ids[0].tolist(), ids[1, 1])
+            assert sample_cube_3x3.get_top_row(face) == row
+        
+        sample_cube_3x3.apply_move("D")
+        colors = sample_cube_3x3.get_face_colors('F')
+        ids = sample_cube_3x3.get_top_row('F')
+        assert ids == tuple(COLOR_IDS[c] for c in (*colors[0], colors[1][1]))
+        
+        with pytest.raises(CubeError):
+            sample_cube_3x3.get_top_row('X')
+    
+    def test_u_face_is_cached_view(self, sample_cube_3x3):
+        """Test the U face view is shared until the next move."""
+        view = sample_cube_3x3.u_face
+        assert sample_cube_3x3.u_face is view
+        assert not view.flags.writeable
+        
+        sample_cube_3x3.apply_move("R")
+        assert sample_cube_3x3.u_face is not view
+        assert sample_cube_3x3.u_face.tolist() == sample_cube_3x3.state.get_face_ids('U').tolist()
+
+    @pytest.mark.parametrize("size", [2, 3, 4])
+    def test_sticker_ids_match_face_ids(self, size):
+        """Test the flat sticker snapshot agrees with each face and is cached."""
+        from rcsim.cube.state import PACKED_FACE_ORDER
+
+        cube = Cube(size=size)
+        cube.scramble(num_moves=20, seed=size)
+        stickers = cube.get_sticker_ids()
+
+        assert cube.get_sticker_ids() is stickers
+        assert not stickers.flags.writeable
+        expected = np.concatenate([cube.state.get_face_ids(face).ravel() for face in PACKED_FACE_ORDER])
+        assert stickers.tolist() == expected.tolist()
+
+        cube.apply_move("R")
+        assert cube.get_sticker_ids() is not stickers
+
+    def test_packed_state_matches_state_packing(self, sample_cube_3x3):
+        """Test the 3x3 packed state agrees with the per-face packing and is cached."""
+        sample_cube_3x3.scramble(num_moves=20, seed=5)
+
+        packed = sample_cube_3x3.packed_state
+        assert packed == sample_cube_3x3.state.get_packed_state()
+        assert sample_cube_3x3.state._packed_state == packed
+
+        sample_cube_3x3.apply_move("R")
+        assert sample_cube_3x3.packed_state == sample_cube_3x3.state.get_packed_state() != packed
+
+    def test_copy_state_from_reuses_pieces(self, sample_cube_3x3):
+        """Test copying state in place matches a clone without new cubies."""
+        target = Cube(size=3)
+        target.apply_sequence("L D2")
+        cubies = list(target.state.cubies)
+        
+        sample_cube_3x3.apply_sequence("R U F'")
+        target.copy_state_from(sample_cube_3x3)
+        
+        assert target == sample_cube_3x3
+        assert target.state.cubies == cubies
+        assert target.move_history == sample_cube_3x3.move_history
+        for face in ['U', 'D', 'L', 'R', 'F', 'B']:
+            assert target.get_face_colors(face) == sample_cube_3x3.get_face_colors(face)
+        
+        target.apply_move("U")
+        assert target != sample_cube_3x3
     
     def test_face_colors(self, sample_cube_3x3):
         """Test getting face colors."""
@@ -182,6 +376,29 @@ class TestCubeState:
             assert len(all_colors[face]) == 3
             assert len(all_colors[face][0]) == 3
 
+    def test_move_tables_match_moves(self):
+        """Test moving piece codes through move tables equals applying the moves."""
+        moved = Cube(3)
+        by_table = Cube(3)
+        codes = by_table.get_piece_codes()
+
+        for notation in ["R", "U", "R'", "U'", "F2", "M"]:
+            moved.apply_move(notation)
+            codes = by_table.get_move_table(notation)[codes]
+        by_table.set_piece_codes(codes)
+
+        assert by_table == moved
+        assert by_table.get_move_table("R") is by_table.get_move_table(Move.parse("R"))
+
+    def test_move_tables_reject_bad_input(self):
+        """Test move tables and piece codes reject other sizes and bad codes."""
+        with pytest.raises(CubeError):
+            Cube(2).get_move_table("R")
+        with pytest.raises(CubeError):
+            Cube(3).get_move_table("Q")
+        with pytest.raises(CubeError):
+            Cube(3).set_piece_codes([0] * 5)
+
 
 # Property-based testing
 class TestCubeProperties:
@@ -311,4 +528,39 @@ class TestCubeValidation:
         assert info['move_count'] == 0
         assert info['total_pieces'] == 26
         assert info['is_valid'] == True
-        assert info['has_scramble'] == False
\ No newline at end of file
+        assert info['has_scramble'] == False
+
+
+class TestCubePool:
+    """Test recycling of work cubes."""
+
+    def test_get_reuses_recycled_cube(self, sample_cube_3x3):
+        """Test a recycled cube is handed out again holding the new state."""
+        from rcsim.cube import CubePool
+
+        pool = CubePool()
+        first = pool.get(sample_cube_3x3)
+        first.apply_sequence("R U")
+        pool.recycle(first)
+        assert len(pool) == 1
+
+        sample_cube_3x3.apply_move("F")
+        second = pool.get(sample_cube_3x3)
+
+        assert second is first
+        assert second == sample_cube_3x3
+        assert second.get_move_history() == sample_cube_3x3.get_move_history()
+        assert len(pool) == 0
+
+    def test_pool_keys_by_size_and_caps_length(self):
+        """Test cubes only go to requests of their size and the pool stays bounded."""
+        from rcsim.cube import CubePool
+
+        pool = CubePool(max_size=2)
+        for _ in range(3):
+            pool.recycle(Cube(2))
+        assert len(pool) == 2
+
+        cube = pool.get(Cube(3))
+        assert cube.size == 3
+        assert len(pool) == 2
@@ -0,0 +1,51 @@
+"""Unit tests for the GL state cache."""
+
+import pytest
+
+from rcsim.graphics import gl_state
+from rcsim.graphics.gl_state import GLStateCache
+
+
+@pytest.fixture
+def gl_calls(monkeypatch):
+    """Record GL calls made by the cache instead of needing a context."""
+    calls = []
+    for name in ("glEnable", "glDisable", "glMatrixMode", "glUseProgram", "glClearColor"):
+        monkeypatch.setattr(gl_state, name, lambda *args, _name=name: calls.append((_name,) + args))
+    return calls
+
+
+class TestGLStateCache:
+    """Test redundant state changes are skipped."""
+
+    def test_repeated_enable_calls_gl_once(self, gl_calls):
+        """Test enabling an enabled capability is a no-op."""
+        cache = GLStateCache()
+        cache.enable(gl_state.GL_DEPTH_TEST)
+        cache.enable(gl_state.GL_DEPTH_TEST)
+        cache.disable(gl_state.GL_DEPTH_TEST)
+        cache.disable(gl_state.GL_DEPTH_TEST)
+        cache.enable(gl_state.GL_DEPTH_TEST)
+
+        assert [call[0] for call in gl_calls] == ["glEnable", "glDisable", "glEnable"]
+
+    def test_matrix_mode_and_program(self, gl_calls):
+        """Test matrix mode and program binds only change on new values."""
+        cache = GLStateCache()
+        cache.matrix_mode(gl_state.GL_MODELVIEW)
+        cache.matrix_mode(gl_state.GL_MODELVIEW)
+        cache.bind_program(3)
+        cache.bind_program(3)
+        cache.bind_program(0)
+
+        assert gl_calls == [("glMatrixMode", gl_state.GL_MODELVIEW),
+                            ("glUseProgram", 3), ("glUseProgram", 0)]
+
+    def test_invalidate_forces_next_call(self, gl_calls):
+        """Test invalidate makes the cache forget what GL holds."""
+        cache = GLStateCache()
+        cache.clear_color(0.1, 0.1, 0.15, 1.0)
+        cache.invalidate()
+        cache.clear_color(0.1, 0.1, 0.15, 1.0)
+
+        assert len(gl_calls) == 2
@@ -79,6 +79,15 @@ class TestMove:
         for invalid in invalid_notations:
             with pytest.raises(ParseError):
                 Move.parse(invalid)
+
+    def test_parse_is_cached(self):
+        """Test repeated notation returns the same move and errors still raise."""
+        assert Move.parse("R2") is Move.parse("R2")
+        assert MoveSequence.parse("R U")[0] is Move.parse("R")
+
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                Move.parse("RR")
     
     @pytest.mark.parametrize("face", ["R", "L", "U", "D", "F", "B", "M", "E", "S", "x", "y", "z"])
     def test_valid_faces(self, face):
@@ -141,7 +150,34 @@ class TestMoveSequence:
         sequence = MoveSequence(moves)
         assert len(sequence.moves) == 3
         assert sequence.moves == moves
-    
+
+    def test_from_moves_copies_list(self):
+        """Test the unchecked constructor matches the checked one."""
+        moves = (Move.parse("R"), Move.parse("U2"))
+        sequence = MoveSequence.from_moves(moves)
+
+        assert sequence == MoveSequence(list(moves))
+        assert isinstance(sequence.moves, list)
+        sequence.add_move("F")
+        assert len(moves) == 2
+
+    def test_to_permutation(self):
+        """Test the composed table and its inverse match the moves on a cube."""
+        from rcsim.cube import Cube
+        from rcsim.cube.codes import inverse_table
+
+        sequence = MoveSequence.parse("R U R' U' Rw M2 F")
+        expected = Cube(3)
+        expected.apply_sequence(sequence)
+        cube = Cube(3)
+
+        cube.apply_permutation(sequence.to_permutation(), sequence)
+        assert cube == expected
+        assert cube.get_move_history() == expected.get_move_history()
+
+        cube.apply_permutation(inverse_table(sequence.to_permutation()))
+        assert cube.is_solved()
+
     def test_sequence_parse(self):
         """Test parsing sequence from notation string."""
         notation = "R U R' U R U2 R'"
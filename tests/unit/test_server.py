@@ -0,0 +1,184 @@
+"""Unit tests for the web server."""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from rcsim.web.server import ConnectionManager
+
+
+class _FakeSocket:
+    """WebSocket stand-in recording sent text frames."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(text)
+
+
+class TestBroadcast:
+    """Test broadcasting to WebSocket clients."""
+
+    def test_broadcast_reaches_clients_and_drops_dead_ones(self):
+        """Test every live client gets the message and failed ones are removed."""
+        manager = ConnectionManager()
+        live, dead = _FakeSocket(), _FakeSocket(fail=True)
+        manager.active_connections = [live, dead]
+
+        asyncio.run(manager.broadcast({"type": "cube_reset", "moves": [1, 2]}))
+
+        assert [json.loads(text) for text in live.sent] == [{"type": "cube_reset", "moves": [1, 2]}]
+        assert manager.active_connections == [live]
+
+        # The endpoint's own cleanup after a dropped connection is harmless
+        manager.disconnect(dead)
+        assert manager.active_connections == [live]
+
+
+class TestCubeManager:
+    """Test cube state handling of the web API."""
+
+    def test_state_cached_until_cube_changes(self):
+        """Test the state model is rebuilt only after a mutation."""
+        from rcsim.web.server import CubeManager
+
+        manager = CubeManager()
+        first = manager.get_cube_state()
+        assert manager.get_cube_state("main") is first
+
+        moved = manager.apply_moves("R U")
+        assert moved is not first
+        assert moved.move_count == 2
+        assert manager.get_cube_state() is moved
+
+        reset = manager.reset_cube()
+        assert reset is not moved
+        assert reset.is_solved
+        assert reset.face_colors == first.face_colors
+
+    def test_state_matches_face_colors(self):
+        """Test face colors are the hex strings of the cube's stickers."""
+        from rcsim.web.server import CubeManager
+
+        manager = CubeManager()
+        state = manager.scramble_cube(num_moves=10)
+        cube = manager.get_cube()
+
+        for face, colors in cube.get_all_face_colors().items():
+            assert state.face_colors[face] == [[color.to_hex() for color in row] for row in colors]
+
+
+def _get(path, **kwargs):
+    """Send a GET request straight to the ASGI app."""
+    import httpx
+    from rcsim.web.server import app
+
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, **kwargs)
+
+    return asyncio.run(request())
+
+
+class TestRoutes:
+    """Test HTTP routes through the ASGI app."""
+
+    def test_root_serves_page_compressed(self):
+        """Test the page is served from disk and gzipped for clients that accept it."""
+        from rcsim.web.server import static_path
+
+        response = _get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.text == (static_path / "index.html").read_text()
+
+    def test_solve_runs_off_the_event_loop(self):
+        """Test solving through the API works from the worker thread."""
+        import httpx
+        from rcsim.web.server import app, cube_manager
+
+        cube_manager.get_cube().apply_sequence("R U R' U'")
+
+        async def request():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/cube/solve", json={"method": "cfop"})
+
+        response = asyncio.run(request())
+        cube_manager.reset_cube()
+
+        assert response.status_code == 200
+        assert response.json()["method"] == "cfop"
+        assert response.json()["total_moves"] > 0
+
+    def test_state_read_waits_for_scramble(self, monkeypatch):
+        """Test a state read during a scramble sees the finished cube, not a half-moved one."""
+        import threading
+        import time
+        import httpx
+        from rcsim.web.server import app, cube_manager
+
+        started = threading.Event()
+
+        def slow_scramble(num_moves, cube_id):
+            cube = cube_manager.get_cube(cube_id)
+            cube.apply_move("R")
+            started.set()
+            time.sleep(0.1)
+            cube.apply_move("U")
+            return cube_manager.get_cube_state(cube_id)
+
+        monkeypatch.setattr(cube_manager, "scramble_cube", slow_scramble)
+
+        async def requests():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                scramble = asyncio.ensure_future(client.post("/api/cube/scramble?cube_id=race"))
+                while not started.is_set():
+                    await asyncio.sleep(0.001)
+                state = await client.get("/api/cube/state?cube_id=race")
+                return await scramble, state
+
+        scrambled, state = asyncio.run(requests())
+
+        assert scrambled.status_code == 200 and state.status_code == 200
+        assert state.json()["move_count"] == 2
+        assert state.json() == scrambled.json()
+
+    def test_solvers_list(self):
+        """Test the pre-serialized solver list is valid JSON naming every solver."""
+        from rcsim.web.server import cube_manager
+
+        response = _get("/api/solvers")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["solvers"] == list(cube_manager.solvers)
+        assert set(response.json()["descriptions"]) == set(cube_manager.solvers)
+
+
+class TestWebSocketHandlers:
+    """Test WebSocket message handlers."""
+
+    def test_handlers_reply_with_json_text(self):
+        """Test ping and get_state answer with the expected messages."""
+        from rcsim.web.server import _WS_HANDLERS, cube_manager
+
+        socket = _FakeSocket()
+        asyncio.run(_WS_HANDLERS["ping"](socket, {"type": "ping"}))
+        asyncio.run(_WS_HANDLERS["get_state"](socket, {"type": "get_state"}))
+
+        pong, state = [json.loads(text) for text in socket.sent]
+        assert pong == {"type": "pong"}
+        assert state["type"] == "cube_state"
+        assert state["state"] == json.loads(json.dumps(cube_manager.get_cube_state().dict()))
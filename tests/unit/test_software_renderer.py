@@ -0,0 +1,215 @@
+"""Unit tests for the pygame software renderer."""
+
+import math
+
+import numpy as np
+import pytest
+
+from rcsim.graphics.software_renderer import SoftwareRenderer
+
+
+def _reference_projection(renderer, point):
+    """Per-point projection as originally written with scalar trig."""
+    x, y, z = point
+
+    angle_y = math.radians(renderer.camera_rotation_y)
+    x_rot = x * math.cos(angle_y) - z * math.sin(angle_y)
+    z_rot = x * math.sin(angle_y) + z * math.cos(angle_y)
+
+    angle_x = math.radians(renderer.camera_rotation_x)
+    y_rot = y * math.cos(angle_x) - z_rot * math.sin(angle_x)
+    z_final = y * math.sin(angle_x) + z_rot * math.cos(angle_x) + renderer.camera_distance
+
+    if z_final <= 0:
+        return (renderer.width // 2, renderer.height // 2)
+
+    scale = 1.0 / math.tan(math.radians(renderer.fov) / 2.0)
+    return (int(renderer.width // 2 + x_rot * scale * renderer.height / (2.0 * z_final)),
+            int(renderer.height // 2 - y_rot * scale * renderer.height / (2.0 * z_final)))
+
+
+class TestProjection:
+    """Test batched point projection."""
+
+    @pytest.mark.parametrize("rot_x,rot_y", [(0.0, 0.0), (-25.0, 45.0), (60.0, -130.0)])
+    def test_batch_matches_scalar_projection(self, rot_x, rot_y):
+        """Test project_points agrees with the scalar formula."""
+        renderer = SoftwareRenderer()
+        renderer.camera_rotation_x = rot_x
+        renderer.camera_rotation_y = rot_y
+        points = np.random.default_rng(1).uniform(-2.0, 2.0, size=(50, 3))
+
+        projected = renderer.project_points(points)
+        expected = np.array([_reference_projection(renderer, p) for p in points])
+
+        assert projected.shape == (50, 2)
+        assert np.abs(projected - expected).max() <= 1
+
+    def test_project_point_returns_int_tuple(self):
+        """Test the single-point API is kept."""
+        renderer = SoftwareRenderer()
+        screen_x, screen_y = renderer.project_point(np.array([0.0, 0.0, 0.0]))
+
+        assert (screen_x, screen_y) == (renderer.width // 2, renderer.height // 2)
+        assert isinstance(screen_x, int) and isinstance(screen_y, int)
+
+    def test_points_behind_camera_collapse_to_center(self):
+        """Test points behind the camera project to screen center."""
+        renderer = SoftwareRenderer()
+        renderer.camera_rotation_x = 0.0
+        renderer.camera_rotation_y = 0.0
+        points = np.array([[0.0, 0.0, -renderer.camera_distance - 1.0]])
+
+        assert renderer.project_points(points).tolist() == [[renderer.width // 2, renderer.height // 2]]
+
+    def test_view_matrix_rebuilt_on_rotation_change(self):
+        """Test the cached rotation matrix follows the camera angles."""
+        renderer = SoftwareRenderer()
+        first = renderer._compute_view_matrix()
+        assert renderer._compute_view_matrix() is first
+
+        renderer.camera_rotation_y += 10.0
+        assert renderer._compute_view_matrix() is not first
+
+    def test_arrow_keys_invalidate_rotation(self):
+        """Test camera input marks the cached trig dirty."""
+        import pygame
+
+        renderer = SoftwareRenderer()
+        renderer._compute_view_matrix()
+        assert not renderer._rot_dirty
+
+        renderer.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+
+        assert renderer._rot_dirty
+        renderer._compute_view_matrix()
+        assert renderer._cos_y == pytest.approx(math.cos(math.radians(30.0)))
+
+
+class TestFaceCorners:
+    """Test face corner construction from the shared templates."""
+
+    def test_batch_translates_templates(self):
+        """Test batched corners are the scaled template plus each center."""
+        renderer = SoftwareRenderer()
+        centers = np.array([[0.0, 0.0, 0.0], [1.0, -1.0, 2.0]])
+
+        corners = renderer.build_face_corners_batch(centers, ['F', 'R'], 0.9)
+
+        assert corners.shape == (2, 4, 3)
+        assert np.allclose(corners[0, :, 2], 0.45)
+        assert np.allclose(corners[1, :, 0], 1.45)
+        assert np.allclose(corners[1].mean(axis=0), [1.45, -1.0, 2.0])
+
+    def test_normals_match_templates(self):
+        """Test each face normal points through its template center."""
+        for face, template in SoftwareRenderer._FACE_TEMPLATES.items():
+            assert np.allclose(template.mean(axis=0) * 2.0, SoftwareRenderer._FACE_NORMALS[face])
+
+    def test_render_draws_cube(self):
+        """Test a full frame renders onto an offscreen surface."""
+        import pygame
+        from rcsim.cube import Cube
+
+        renderer = SoftwareRenderer(200, 150)
+        renderer.screen = pygame.Surface((200, 150))
+        renderer.set_cube(Cube(size=3))
+
+        renderer.render()
+
+        background = renderer.screen.get_at((0, 0))
+        assert renderer.screen.get_at((100, 75)) != background
+
+    def test_render_draws_visible_sides_grouped_by_color(self, monkeypatch):
+        """Test only camera-facing body and stickers are drawn, one run per fill."""
+        import pygame
+        from rcsim.cube import Cube
+
+        cube = Cube(size=3)
+        cube.apply_sequence("R U F'")
+        renderer = SoftwareRenderer(200, 150)
+        renderer.screen = pygame.Surface((200, 150))
+        renderer.set_cube(cube)
+
+        calls = []
+        monkeypatch.setattr(pygame.draw, "polygon",
+                            lambda surface, rgb, points, width=0: calls.append((rgb, points)))
+        renderer.render()
+
+        # Three body quads, then one fill per sticker with no borders
+        assert all(rgb == SoftwareRenderer._BODY_COLOR for rgb, points in calls[:3])
+        fills = [rgb for rgb, points in calls[3:]]
+        assert len(fills) == 27
+
+        # Every fill color is drawn in a single contiguous run
+        runs = [rgb for i, rgb in enumerate(fills) if i == 0 or fills[i - 1] != rgb]
+        assert len(runs) == len(set(fills))
+
+    def test_face_data_cached_until_move(self):
+        """Test visible faces are rebuilt only after the cube changes."""
+        from rcsim.cube import Cube
+
+        cube = Cube(size=3)
+        renderer = SoftwareRenderer()
+        renderer.set_cube(cube)
+
+        first = renderer._get_face_data(1.0)
+        assert renderer._get_face_data(1.0) is first
+        assert len(first[1]) == 54
+
+        cube.apply_move("R")
+        assert renderer._get_face_data(1.0) is not first
+
+    def test_render_piece_face_culls_back_faces(self):
+        """Test single-face rendering keeps the screen-space cull."""
+        import pygame
+        from rcsim.cube.state import Color
+
+        renderer = SoftwareRenderer(200, 150)
+        renderer.screen = pygame.Surface((200, 150))
+        renderer.camera_rotation_x = 0.0
+        renderer.camera_rotation_y = 0.0
+
+        drawn = []
+        renderer._draw_polygon = lambda surface, points, rgb: drawn.append(rgb)
+        red = Color(255, 0, 0, "red")
+
+        # The camera looks along +z from z = -distance, so B faces it
+        renderer.render_piece_face(0.0, 0.0, 0.0, 'B', red, 0.9)
+        renderer.render_piece_face(0.0, 0.0, 0.0, 'F', red, 0.9)
+
+        assert drawn == [(255, 0, 0)]
+
+    def test_needs_redraw_after_input_or_move(self):
+        """Test idle frames are skipped until input or a move happens."""
+        import pygame
+        from rcsim.cube import Cube
+
+        cube = Cube(size=3)
+        renderer = SoftwareRenderer(200, 150)
+        renderer.screen = pygame.Surface((200, 150))
+        renderer.set_cube(cube)
+        assert renderer.needs_redraw()
+
+        renderer.render()
+        assert not renderer.needs_redraw()
+
+        cube.apply_move("U")
+        assert renderer.needs_redraw()
+
+        renderer.render()
+        renderer.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_MINUS))
+        assert renderer.needs_redraw()
+
+        renderer.render()
+        renderer.handle_input(pygame.event.Event(pygame.WINDOWEXPOSED))
+        assert renderer.needs_redraw()
+
+    def test_focal_follows_fov_and_height(self):
+        """Test the cached focal length tracks fov and screen height."""
+        renderer = SoftwareRenderer(800, 600)
+        assert renderer._focal == pytest.approx(300.0 / math.tan(math.radians(30.0)))
+
+        renderer.fov = 90.0
+        renderer.height = 400
+        assert renderer._focal == pytest.approx(200.0)
@@ -0,0 +1,75 @@
+"""Unit tests for window event handling."""
+
+import pygame
+import pytest
+
+from rcsim.graphics.window import Window, WindowConfig
+
+
+@pytest.fixture
+def window():
+    """Window with event state but no OpenGL context."""
+    win = Window.__new__(Window)
+    win.config = WindowConfig()
+    win.running = False
+    win.clock = None
+    win.on_key_press = None
+    win.on_mouse_click = None
+    win.on_mouse_drag = None
+    win.on_mouse_wheel = None
+    win.on_resize = None
+    win._mouse_pressed = False
+    win._last_mouse_pos = (0, 0)
+    win.target_fps = 0
+    win._last_pump_time = 0.0
+    pygame.event.clear()
+    yield win
+    pygame.event.clear()
+
+
+class TestHandleEvents:
+    """Test event dispatch from the pygame queue."""
+
+    def test_mouse_motion_is_coalesced(self, window):
+        """Test a burst of motion events produces one drag callback."""
+        drags = []
+        window.on_mouse_drag = lambda dx, dy, x, y: drags.append((dx, dy, x, y))
+
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 10)))
+        for x in range(11, 21):
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 12), rel=(1, 0), buttons=(1, 0, 0)))
+
+        assert window.handle_events() is True
+        assert drags == [(10, 2, 20, 12)]
+
+    def test_motion_flushed_before_button_release(self, window):
+        """Test motion before a release is reported, motion after is not."""
+        drags = []
+        window.on_mouse_drag = lambda dx, dy, x, y: drags.append((dx, dy))
+
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 5), rel=(5, 5), buttons=(1, 0, 0)))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(5, 5)))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(9, 9), rel=(4, 4), buttons=(0, 0, 0)))
+
+        window.handle_events()
+
+        assert drags == [(5, 5)]
+        assert window._last_mouse_pos == (9, 9)
+
+    def test_quit_stops_loop(self, window):
+        """Test QUIT makes handle_events return False."""
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+        assert window.handle_events() is False
+
+    def test_pump_throttled_to_frame_rate(self, window, monkeypatch):
+        """Test SDL is not pumped again within the same frame budget."""
+        pumps = []
+        monkeypatch.setattr(pygame.event, "get", lambda: pumps.append(1) or [])
+        window.target_fps = 60
+
+        window.handle_events()
+        window.handle_events()
+
+        assert len(pumps) == 1